@@ -0,0 +1,146 @@
+"""
+Micro-benchmarks of the NumPy kernels in plain CPython, no Blender needed.
+
+Usage:
+    python benchmarks/bench_kernels.py [--sizes 10000,100000,1000000] [--repeat 5] [--output results.json]
+
+Each kernel is run on synthetic arrays (quad grids, random trees) and
+checked against its expected result before being timed.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import bpy_stub
+bpy_stub.install()
+
+from r0fl_simple_toolbox import kernels
+
+def grid_arrays(n_verts: int, islands_x: int = 1):
+    """
+    Quad grid as the arrays foreach_get gives.
+    UVs are split into islands_x vertical strips along the seams.
+    """
+    side = max(2, round(n_verts ** 0.5))
+    xs, ys = np.meshgrid(np.arange(side), np.arange(side))
+    co = np.stack([xs.ravel(), ys.ravel(), np.zeros(side * side)], axis=1).astype(np.float64) / (side - 1)
+
+    # Quad corners, counter-clockwise
+    fx, fy = np.meshgrid(np.arange(side - 1), np.arange(side - 1))
+    v0 = (fy * side + fx).ravel()
+    quads = np.stack([v0, v0 + 1, v0 + side + 1, v0 + side], axis=1)
+    n_polys = len(quads)
+    loop_verts = quads.ravel()
+
+    # Unique undirected edges
+    a = loop_verts
+    b = quads[:, [1, 2, 3, 0]].ravel()
+    keys = np.minimum(a, b) * (side * side) + np.maximum(a, b)
+    unique_keys, loop_edges = np.unique(keys, return_inverse=True)
+    edge_verts = np.stack([unique_keys // (side * side), unique_keys % (side * side)], axis=1)
+
+    loop_starts = np.arange(n_polys) * 4
+    loop_totals = np.full(n_polys, 4)
+
+    # Shift each strip in UV space so strips don't share UVs along their seams
+    uv = co[loop_verts, :2].copy()
+    strip = np.repeat(np.minimum(fx.ravel() * islands_x // (side - 1), islands_x - 1), 4)
+    uv[:, 0] += strip * 2.0
+
+    return {
+        "co": co, "edge_verts": edge_verts, "loop_verts": loop_verts, "loop_edges": loop_edges,
+        "loop_starts": loop_starts, "loop_totals": loop_totals, "uv": uv, "n_polys": n_polys,
+    }
+
+def random_tree(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    parents = np.full(n, -1, dtype=np.int64)
+    parents[1:] = (rng.random(n - 1) * np.arange(1, n)).astype(np.int64)
+    return parents
+
+def timed(func, repeat: int):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+def bench_size(n: int, repeat: int) -> dict:
+    g = grid_arrays(n, islands_x=4)
+    co, edge_verts = g["co"], g["edge_verts"]
+    loop_verts, loop_edges, uv, n_polys = g["loop_verts"], g["loop_edges"], g["uv"], g["n_polys"]
+    n_verts = len(co)
+    results = {}
+
+    # Axis band: the x = 0 column of the grid
+    side = round(n_verts ** 0.5)
+    band, results["axis_band_edges"] = timed(lambda: kernels.axis_band_edges(co, edge_verts, 0, 1e-6), repeat)
+    assert len(band) == side - 1
+
+    # Loose geometry: a grid has none
+    loose, results["loose_geometry"] = timed(lambda: kernels.loose_geometry(n_verts, edge_verts, loop_verts, loop_edges), repeat)
+    assert not any(len(x) for x in loose)
+
+    mask, results["nth_mask"] = timed(lambda: kernels.nth_mask(n_verts, 0, 3, 1), repeat)
+    assert mask.sum() == len(range(1, n_verts, 3))
+
+    (loop_polys, next_loop), results["loop_topology"] = timed(
+        lambda: kernels.loop_topology(g["loop_starts"], g["loop_totals"], len(loop_verts)), repeat)
+
+    (face_island, n_islands), results["uv_islands"] = timed(
+        lambda: kernels.uv_islands(loop_verts, loop_edges, loop_polys, next_loop, uv, n_polys), repeat)
+    assert n_islands == 4
+
+    area_3d, results["face_areas"] = timed(lambda: kernels.face_areas(co, loop_verts, next_loop, loop_polys, n_polys), repeat)
+    assert abs(area_3d.sum() - 1.0) < 1e-6
+
+    area_uv, results["uv_face_areas"] = timed(lambda: kernels.uv_face_areas(uv, next_loop, loop_polys, n_polys), repeat)
+
+    island_3d = kernels.island_sums(face_island, n_islands, area_3d)
+    island_uv = kernels.island_sums(face_island, n_islands, area_uv)
+    density, results["density"] = timed(lambda: kernels.density(island_3d, island_uv, 1024), repeat)
+    assert np.allclose(density, 1024)
+
+    new_uv, results["scale_islands"] = timed(lambda: kernels.scale_islands(uv, face_island[loop_polys], density, 512.0), repeat)
+    scaled = kernels.density(island_3d, kernels.island_sums(face_island, n_islands, kernels.uv_face_areas(new_uv, next_loop, loop_polys, n_polys)), 1024)
+    assert np.allclose(scaled, 512)
+
+    parents = random_tree(n_verts)
+    (children, offsets), results["children_table"] = timed(lambda: kernels.children_table(parents), repeat)
+    descendants, results["depth_first"] = timed(lambda: kernels.depth_first(children, offsets, 0), repeat)
+    assert len(descendants) == n_verts - 1
+    descendants, results["breadth_first"] = timed(lambda: kernels.breadth_first(children, offsets, 0), repeat)
+    assert len(descendants) == n_verts - 1
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(prog="bench_kernels.py")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report = {}
+    for n in (int(x) for x in args.sizes.split(',')):
+        results = bench_size(n, args.repeat)
+        report[str(n)] = results
+        print(f"{n} vertices")
+        for name, seconds in results.items():
+            print(f"    {name}: {seconds * 1000:.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
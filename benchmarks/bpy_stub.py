@@ -0,0 +1,113 @@
+"""
+Minimal stand-ins for bpy, bmesh and bpy_extras, so the add-on package imports in plain CPython.
+
+Only what the modules touch at import time is provided: base classes to
+subclass, property functions, handler lists and decorators. Anything else
+resolves to an inert placeholder. Code calling into Blender still needs
+Blender, the stub is meant for the NumPy kernels and their tests and
+benchmarks.
+
+Usage:
+    import bpy_stub
+    bpy_stub.install()
+    from r0fl_simple_toolbox import kernels
+"""
+import sys
+import types
+
+class _Placeholder:
+    """Inert value: any attribute, call or iteration gives another placeholder or nothing"""
+
+    def __init__(self, name="bpy"):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Placeholder(f"{self._name}.{name}")
+
+    def __call__(self, *args, **kwargs):
+        return _Placeholder(f"{self._name}()")
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"<stub {self._name}>"
+
+
+class _Module(types.ModuleType):
+    """Module resolving unknown attributes to placeholders, or to classes for bpy.types"""
+
+    def __init__(self, name, make_classes=False):
+        super().__init__(name)
+        self._make_classes = make_classes
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (), {}) if self._make_classes else _Placeholder(f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+def _property(*args, **kwargs):
+    return None
+
+def _persistent(func):
+    return func
+
+def _build_bpy():
+    bpy = _Module("bpy")
+    bpy.types = _Module("bpy.types", make_classes=True)
+
+    bpy.props = _Module("bpy.props")
+    for name in ("BoolProperty", "BoolVectorProperty", "IntProperty", "IntVectorProperty",
+                 "FloatProperty", "FloatVectorProperty", "StringProperty", "EnumProperty",
+                 "PointerProperty", "CollectionProperty", "RemoveProperty"):
+        setattr(bpy.props, name, _property)
+
+    bpy.app = _Module("bpy.app")
+    bpy.app.version = (4, 2, 0)
+    bpy.app.version_string = "4.2.0 (stub)"
+    bpy.app.binary_path = ""
+    bpy.app.background = True
+    bpy.app.handlers = _Module("bpy.app.handlers")
+    bpy.app.handlers.persistent = _persistent
+    for name in ("depsgraph_update_pre", "depsgraph_update_post", "undo_pre", "undo_post",
+                 "redo_pre", "redo_post", "load_pre", "load_post", "save_pre", "save_post"):
+        setattr(bpy.app.handlers, name, [])
+
+    bpy.utils = _Module("bpy.utils")
+    bpy.utils.register_class = lambda cls: None
+    bpy.utils.unregister_class = lambda cls: None
+    return bpy
+
+def install():
+    """Register the stubs in sys.modules, unless the real bpy is available"""
+    if "bpy" in sys.modules:
+        return sys.modules["bpy"]
+    try:
+        import bpy
+        return bpy
+    except ImportError:
+        pass
+
+    bpy = _build_bpy()
+    bpy_extras = _Module("bpy_extras")
+    bpy_extras.io_utils = _Module("bpy_extras.io_utils", make_classes=True)
+
+    sys.modules["bpy"] = bpy
+    for name in ("types", "props", "app", "utils"):
+        sys.modules[f"bpy.{name}"] = getattr(bpy, name)
+    sys.modules["bpy.app.handlers"] = bpy.app.handlers
+    sys.modules["bmesh"] = _Module("bmesh")
+    sys.modules["bpy_extras"] = bpy_extras
+    sys.modules["bpy_extras.io_utils"] = bpy_extras.io_utils
+    return bpy
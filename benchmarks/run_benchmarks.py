@@ -0,0 +1,347 @@
+"""
+Headless benchmarks of the toolbox operators and utilities over synthetic scenes.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/run_benchmarks.py -- [options]
+
+Options:
+    --output PATH       JSON results file (default: benchmarks/results.json)
+    --baseline PATH     Results of a previous run to compare with
+    --threshold F       Relative slowdown reported as a regression (default: 0.25)
+    --sizes LIST        Vertex counts of the synthetic meshes (default: 1000,10000,100000,1000000,5000000)
+    --objects LIST      Object counts of the hierarchies (default: 100,1000,10000,50000)
+    --props LIST        Custom properties per object (default: 10,100,1000)
+    --repeat N          Timed runs per case, the median is kept (default: 3)
+    --filter TEXT       Only run cases whose name contains TEXT
+
+Exits with status 1 when a regression against the baseline is found.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tempfile
+
+import bpy
+import bmesh
+import addon_utils
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+ADDON = "r0fl_simple_toolbox"
+
+# Cases faster than this are never reported as regressions, timings are too noisy
+NOISE_FLOOR = 0.002
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    int_list = lambda text: [int(x) for x in text.split(',') if x.strip()]
+
+    parser = argparse.ArgumentParser(prog="run_benchmarks.py")
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results.json"))
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--sizes", type=int_list, default=[1_000, 10_000, 100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--objects", type=int_list, default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument("--props", type=int_list, default=[10, 100, 1_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="")
+    return parser.parse_args(argv)
+
+
+# ---- Synthetic scenes ----
+
+def clear_scene():
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes))
+
+def link_mesh_object(name, bm):
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def add_test_data(obj):
+    """Sharp edges, custom normals and a few loose vertices for the cleanup tools to find"""
+    mesh = obj.data
+    sharp = mesh.attributes.new("sharp_edge", "BOOLEAN", "EDGE")
+    sharp.data.foreach_set("value", [True] * len(mesh.edges))
+    mesh.attributes.new("bench_color", "FLOAT_COLOR", "CORNER")
+    mesh.normals_split_custom_set_from_vertices([(0.0, 0.0, 1.0)] * len(mesh.vertices))
+
+    n_loose = max(1, len(mesh.vertices) // 100)
+    mesh.vertices.add(n_loose)
+
+def make_grid(n_verts: int):
+    side = max(2, round(n_verts ** 0.5))
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_grid(bm, x_segments=side - 1, y_segments=side - 1, size=1.0, calc_uvs=True)
+    obj = link_mesh_object(f"Grid_{n_verts}", bm)
+    add_test_data(obj)
+    return obj
+
+def make_cube(n_verts: int):
+    cuts = max(0, round((n_verts / 6) ** 0.5) - 1)
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_cube(bm, size=2.0, calc_uvs=True)
+    if cuts:
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges[:], cuts=cuts, use_grid_fill=True)
+    obj = link_mesh_object(f"Cube_{n_verts}", bm)
+    add_test_data(obj)
+    return obj
+
+def make_hierarchy(n_objects: int, branching: int = 4):
+    """Tree of objects sharing one mesh, each parent holding up to `branching` children"""
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=0.1)
+    mesh = bpy.data.meshes.new("HierarchyCube")
+    bm.to_mesh(mesh)
+    bm.free()
+
+    collection = bpy.context.scene.collection
+    objects = []
+    for i in range(n_objects):
+        obj = bpy.data.objects.new(f"Node_{i}", mesh)
+        collection.objects.link(obj)
+        if i:
+            obj.parent = objects[(i - 1) // branching]
+        objects.append(obj)
+    return objects
+
+def make_custom_props(n_props: int, n_objects: int = 100):
+    objects = make_hierarchy(n_objects, branching=n_objects)
+    for obj in objects:
+        for i in range(n_props):
+            obj[f"prop_{i}"] = i
+    return objects
+
+def select(objects, active=None):
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = active or (objects[0] if objects else None)
+
+def enter_edit_mode(select_all=True):
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT" if select_all else "DESELECT")
+
+
+# ---- Cases ----
+
+class Case:
+    """
+    A timed call. setup builds the scene and returns the state run needs,
+    it is called before every run as most tools change the scene.
+    """
+
+    def __init__(self, name: str, params, setup, run, param_name="size"):
+        self.name = name
+        self.params = params
+        self.setup = setup
+        self.run = run
+        self.param_name = param_name
+
+    def key(self, param) -> str:
+        return f"{self.name}[{self.param_name}={param}]"
+
+
+def mesh_setup(builder, mode="OBJECT", select_all=True):
+    def setup(size):
+        clear_scene()
+        obj = builder(size)
+        select([obj])
+        if mode == "EDIT":
+            enter_edit_mode(select_all)
+        return obj
+    return setup
+
+def hierarchy_setup(n_objects):
+    clear_scene()
+    objects = make_hierarchy(n_objects)
+    select(objects[:1])
+    return objects
+
+def props_setup(n_props):
+    clear_scene()
+    objects = make_custom_props(n_props)
+    select(objects)
+    return objects
+
+def op(idname: str, **kwargs):
+    category, name = idname.split('.')
+    operator = getattr(getattr(bpy.ops, category), name)
+    def run(state):
+        result = operator(**kwargs)
+        if 'FINISHED' not in result:
+            raise RuntimeError(f"{idname} returned {result}")
+    return run
+
+def get_cases(args) -> list:
+    from r0fl_simple_toolbox import utils, hierarchy, property_index, texel_density, memory
+
+    sizes = args.sizes
+    csv_path = os.path.join(tempfile.gettempdir(), "r0tools_benchmark.csv")
+
+    return [
+        # Operators
+        Case("op.clear_custom_split_normals", sizes, mesh_setup(make_grid), op("r0tools.clear_custom_split_normals")),
+        Case("op.clear_sharp_axis_x[object]", sizes, mesh_setup(make_grid), op("r0tools.clear_sharp_axis_x")),
+        Case("op.clear_sharp_axis_x[edit]", sizes, mesh_setup(make_grid, "EDIT"), op("r0tools.clear_sharp_axis_x")),
+        Case("op.clear_sharp_axis_y", sizes, mesh_setup(make_cube), op("r0tools.clear_sharp_axis_y")),
+        Case("op.clear_sharp_axis_z", sizes, mesh_setup(make_cube), op("r0tools.clear_sharp_axis_z")),
+        Case("op.find_loose_geometry[select]", sizes, mesh_setup(make_grid, "EDIT"), op("r0tools.find_loose_geometry", action="SELECT")),
+        Case("op.find_loose_geometry[delete]", sizes, mesh_setup(make_grid), op("r0tools.find_loose_geometry", action="DELETE")),
+        Case("op.nth_edges", sizes, _nth_edges_setup, op("r0tools.nth_edges")),
+        Case("op.clear_mesh_attributes", sizes, mesh_setup(make_grid), op("r0tools.clear_mesh_attributes", dry_run=False)),
+        Case("op.profile_mesh_memory", sizes, mesh_setup(make_cube), op("r0tools.profile_mesh_memory")),
+        Case("op.export_mesh_memory_csv", sizes, lambda size: (mesh_setup(make_cube)(size), memory.profile_meshes()),
+             op("r0tools.export_mesh_memory_csv", filepath=csv_path)),
+        Case("op.zenuv_set_td", sizes, mesh_setup(make_grid), op("r0tools.zenuv_set_td")),
+        Case("op.audit_texel_density", sizes, mesh_setup(make_cube), op("r0tools.audit_texel_density")),
+        Case("op.export_texel_density_csv", sizes, lambda size: (mesh_setup(make_cube)(size), texel_density.audit_texel_density()),
+             op("r0tools.export_texel_density_csv", filepath=csv_path)),
+        Case("op.screen_coverage[camera]", args.objects, _camera_setup, op("r0tools.screen_coverage", source="CAMERA", action="TAG"), "objects"),
+        Case("op.clear_all_objects_children", args.objects, hierarchy_setup, op("r0tools.clear_all_objects_children", recurse=True), "objects"),
+        Case("op.update_property_list", args.props, props_setup, op("r0tools.update_property_list"), "props"),
+        Case("op.clear_custom_properties", args.props, lambda n: (props_setup(n), bpy.ops.r0tools.update_property_list(), _select_all_properties()),
+             op("r0tools.clear_custom_properties"), "props"),
+        Case("op.purge_custom_properties", args.props, props_setup, op("r0tools.purge_custom_properties", dry_run=False), "props"),
+
+        # Utilities
+        Case("utils.iter_children", args.objects, hierarchy_setup,
+             lambda objects: sum(1 for _ in utils.iter_children(objects[0], recursive=True)), "objects"),
+        Case("utils.iter_children[cold]", args.objects, lambda n: (hierarchy_setup(n), hierarchy.get_index().invalidate())[0],
+             lambda objects: sum(1 for _ in utils.iter_children(objects[0], recursive=True)), "objects"),
+        Case("hierarchy.unparent_keep_transform", args.objects, hierarchy_setup,
+             lambda objects: hierarchy.unparent_keep_transform(objects[1:]), "objects"),
+        Case("utils.get_loose_geometry", sizes, mesh_setup(make_grid), lambda obj: utils.get_loose_geometry(obj.data)),
+        Case("utils.get_edge_vertices", sizes, mesh_setup(make_grid), lambda obj: utils.get_edge_vertices(obj.data)),
+        Case("utils.get_axis_band_edges", sizes, mesh_setup(make_grid), lambda obj: utils.get_axis_band_edges(obj.data, 'X', 0.0)),
+        Case("utils.set_mesh_smooth", sizes, mesh_setup(make_grid), utils.set_mesh_smooth),
+        Case("utils.clear_custom_normals", sizes, mesh_setup(make_grid), utils.clear_custom_normals),
+        Case("utils.rebuild_custom_property_list", args.props, props_setup,
+             lambda objects: utils.rebuild_custom_property_list(bpy.context.scene.r0fl_toolbox_props, objects), "props"),
+        Case("utils.get_selection_fingerprint", args.objects, lambda n: (hierarchy_setup(n), select(bpy.context.scene.objects))[0],
+             lambda objects: utils.get_selection_fingerprint(bpy.context.view_layer), "objects"),
+        Case("property_index.build", args.props, lambda n: (props_setup(n), property_index.get_index().invalidate())[0],
+             lambda objects: property_index.get_index().build(), "props"),
+        Case("texel_density.get_island_density", sizes, mesh_setup(make_cube),
+             lambda obj: texel_density.get_island_density(texel_density.MeshTDData(obj.data, obj.data.uv_layers.active), 2048)),
+    ]
+
+def _nth_edges_setup(size):
+    """Grid in Edit mode with a single seed edge selected"""
+    obj = mesh_setup(make_grid)(size)
+    obj.data.edges[0].select = True
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.context.scene.tool_settings.mesh_select_mode = (False, True, False)
+    return obj
+
+def _select_all_properties():
+    for item in bpy.context.scene.r0fl_toolbox_props.custom_property_list:
+        item.selected = True
+
+def _camera_setup(n_objects):
+    objects = hierarchy_setup(n_objects)
+    camera = bpy.data.objects.new("Camera", bpy.data.cameras.new("Camera"))
+    camera.location = (0.0, -10.0, 0.0)
+    camera.rotation_euler = (1.5708, 0.0, 0.0)
+    bpy.context.scene.collection.objects.link(camera)
+    bpy.context.scene.camera = camera
+    return objects
+
+
+# ---- Runner ----
+
+def enable_addon():
+    # Optional operators are registered right away in background mode
+    addon_utils.enable(ADDON, default_set=True, persistent=True)
+
+def run_case(case: Case, param, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        state = case.setup(param)
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+
+    return {"median": statistics.median(times), "min": min(times), "runs": len(times)}
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Cases slower than the baseline by more than threshold, as (key, baseline, current)"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or "median" not in base or "median" not in result:
+            continue
+        if result["median"] > NOISE_FLOOR and result["median"] > base["median"] * (1.0 + threshold):
+            regressions.append((key, base["median"], result["median"]))
+    return regressions
+
+def main():
+    args = parse_args()
+    enable_addon()
+
+    results = {}
+    covered = set()
+    for case in get_cases(args):
+        if args.filter and args.filter not in case.name:
+            continue
+        if case.name.startswith("op."):
+            covered.add(case.name[3:].split('[')[0])
+
+        for param in case.params:
+            key = case.key(param)
+            try:
+                results[key] = run_case(case, param, args.repeat)
+                print(f"[BENCH] {key}: {results[key]['median'] * 1000:.2f} ms")
+            except Exception as e:
+                results[key] = {"error": str(e)}
+                print(f"[BENCH] {key}: ERROR {e}")
+
+    clear_scene()
+
+    # Registered toolbox operators without a case, so missing coverage is visible
+    uncovered = sorted(name for name in dir(bpy.ops.r0tools) if name not in covered)
+
+    report = {
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": args.repeat,
+        "results": results,
+        "uncovered_operators": uncovered,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        report["regressions"] = [{"case": k, "baseline": b, "current": c} for k, b, c in regressions]
+        for key, base, current in regressions:
+            print(f"[BENCH] REGRESSION {key}: {base * 1000:.2f} ms -> {current * 1000:.2f} ms ({current / base:.2f}x)")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"[BENCH] Wrote {len(results)} results to {args.output}")
+    if uncovered:
+        print(f"[BENCH] Operators without a benchmark: {', '.join(uncovered)}")
+
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
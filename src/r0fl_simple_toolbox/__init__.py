@@ -10,36 +10,31 @@ bl_info = {
     "category": "Object"
 }
 
-import importlib
-
-modules = (
-    ".properties",
-    ".operators",
-    ".ui",
-)
-
-def import_modules():
-    for module in modules:
-        print(f"------------------> IMPORT {module} - {__package__}")
-        importlib.import_module(module, __package__)
-
-
-def reimport_modules():
-    for module in modules:
-        print(f"------------------> RELOAD {module} - {__package__}")
-        to_reload_module = importlib.import_module(module, __package__)
-        importlib.reload(to_reload_module)
-
-
-import_modules()
-reimport_modules()
-
-from . import properties
-from . import operators
-from . import ui
+from . import startup
+
+# Each module is imported once. Reloading is left to the dev tools reloader,
+# which only reloads changed modules.
+with startup.timed("import", "properties"):
+    from . import properties
+with startup.timed("import", "hierarchy"):
+    from . import hierarchy
+with startup.timed("import", "property_index"):
+    from . import property_index
+with startup.timed("import", "reloader"):
+    from . import reloader
+with startup.timed("import", "profiling"):
+    from . import profiling
+with startup.timed("import", "operators"):
+    from . import operators
+with startup.timed("import", "ui"):
+    from . import ui
 
 register_modules = [
     properties,
+    hierarchy,
+    property_index,
+    reloader,
+    profiling,
     operators,
     ui,
 ]
@@ -47,7 +42,10 @@ register_modules = [
 
 def register():
     for module in register_modules:
-        module.register()
+        with startup.timed("register", module.__name__.rpartition('.')[2]):
+            module.register()
+    
+    print(f"[{bl_info['name']}] Imported in {startup.get_total('import') * 1000:.1f} ms, registered in {startup.get_total('register') * 1000:.1f} ms")
 
 
 def unregister():
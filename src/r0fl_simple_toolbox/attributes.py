@@ -0,0 +1,124 @@
+import bpy
+
+from .property_index import compile_patterns
+
+# Bytes per element of each attribute data type
+DATA_TYPE_SIZES = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'STRING': 256,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT16_2D': 4,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+# Mesh collection holding the elements of each attribute domain
+DOMAIN_COLLECTIONS = {
+    'POINT': "vertices",
+    'EDGE': "edges",
+    'FACE': "polygons",
+    'CORNER': "loops",
+}
+
+def get_domain_size(mesh, domain: str) -> int:
+    collection = DOMAIN_COLLECTIONS.get(domain)
+    return len(getattr(mesh, collection)) if collection else 0
+
+def get_attribute_size(mesh, attr) -> int:
+    """Estimated bytes of an attribute: element count x item size"""
+    return get_domain_size(mesh, attr.domain) * DATA_TYPE_SIZES.get(attr.data_type, 4)
+
+
+class AttributeRules:
+    """
+    Keep/remove rules deciding which mesh attributes to clear.
+
+    An attribute is removed when its domain and data type are accepted, its name
+    matches a remove pattern and it matches no keep pattern. Internal and required
+    attributes are never removed.
+    """
+
+    def __init__(self, remove="*", keep="", domains=None, data_types=None, keep_uv_maps=True, use_regex=False):
+        self.remove_re = compile_patterns(remove, use_regex)
+        self.keep_re = compile_patterns(keep, use_regex)
+        self.domains = set(domains) if domains is not None else set(DOMAIN_COLLECTIONS)
+        self.data_types = set(data_types) if data_types is not None else set(DATA_TYPE_SIZES)
+        self.keep_uv_maps = keep_uv_maps
+
+    def is_protected(self, mesh, attr) -> bool:
+        if attr.name.startswith('.') or getattr(attr, "is_internal", False) or getattr(attr, "is_required", False):
+            return True
+        if attr.name == "position":
+            return True
+        if self.keep_uv_maps and attr.name in mesh.uv_layers:
+            return True
+        return False
+
+    def should_remove(self, mesh, attr) -> bool:
+        if self.remove_re is None:
+            return False
+        if attr.domain not in self.domains or attr.data_type not in self.data_types:
+            return False
+        if self.is_protected(mesh, attr):
+            return False
+        if self.keep_re is not None and self.keep_re.match(attr.name):
+            return False
+        return self.remove_re.match(attr.name) is not None
+
+
+def scan_attributes(rules: AttributeRules, meshes=None) -> list:
+    """
+    Find the attributes to remove from every unique mesh.
+    Returns:
+        List of (mesh, attribute name, domain, data type, estimated bytes)
+    """
+    meshes = bpy.data.meshes if meshes is None else meshes
+
+    plan = []
+    for mesh in meshes:
+        if mesh.library:
+            continue
+        for attr in mesh.attributes:
+            if rules.should_remove(mesh, attr):
+                plan.append((mesh, attr.name, attr.domain, attr.data_type, get_attribute_size(mesh, attr)))
+
+    return plan
+
+def remove_attributes(plan) -> int:
+    """Remove the attributes of a plan from scan_attributes, one pass per mesh"""
+    by_mesh = {}
+    for mesh, name, *_ in plan:
+        by_mesh.setdefault(mesh, []).append(name)
+
+    removed = 0
+    for mesh, names in by_mesh.items():
+        for name in names:
+            # References are invalidated by each removal, look up by name
+            attr = mesh.attributes.get(name)
+            if attr is None:
+                continue
+            try:
+                mesh.attributes.remove(attr)
+                removed += 1
+            except Exception as e:
+                print(f"Unable to remove attribute {name} of {mesh.name}: {e}")
+
+    return removed
+
+def format_attribute_report(plan, dry_run=True) -> str:
+    """Table of the attributes of a plan and the memory they hold"""
+    total = sum(entry[4] for entry in plan)
+    verb = "Would remove" if dry_run else "Removed"
+    lines = [f"{verb} {len(plan)} attributes from {len({entry[0] for entry in plan})} meshes, freeing ~{total / 1024**2:.2f} MiB", ""]
+    lines.append(f"{'Mesh':<32} {'Attribute':<32} {'Domain':<8} {'Type':<12} {'Bytes':>12}")
+    for mesh, name, domain, data_type, size in sorted(plan, key=lambda e: e[4], reverse=True):
+        lines.append(f"{mesh.name[:32]:<32} {name[:32]:<32} {domain:<8} {data_type:<12} {size:>12}")
+
+    return '\n'.join(lines)
@@ -0,0 +1,226 @@
+"""
+Apply toolbox cleanups to many .blend files from the command line.
+
+Run with plain Python, not inside Blender:
+    python batch_process.py <dir|file|glob>... --ops clear_split_normals,unparent (--in-place | --output-dir <dir>)
+        [--jobs N] [--blender <path>] [--log results.jsonl]
+
+Files are split into small chunks processed by a pool of background Blender
+processes running batch_worker.py, --jobs at a time. Each worker prints one
+result per file, which is appended to the JSON lines log as it arrives.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_worker.py")
+
+# Must match batch_worker.RESULT_PREFIX. Not imported, the worker needs bpy
+RESULT_PREFIX = "R0TOOLS_RESULT "
+
+OPERATIONS = ("clear_split_normals", "clear_custom_properties", "clear_attributes", "clear_sharp", "unparent")
+
+def find_blend_files(paths) -> tuple:
+    """
+    Expand directories (recursively) and glob patterns to .blend files.
+    Returns:
+        Tuple (sorted unique absolute file paths, common root directory of the inputs)
+    """
+    files = set()
+    roots = []
+    for path in paths:
+        if os.path.isdir(path):
+            roots.append(os.path.abspath(path))
+            matches = glob.glob(os.path.join(glob.escape(path), "**", "*.blend"), recursive=True)
+        else:
+            matches = glob.glob(path, recursive=True)
+            roots.extend(os.path.dirname(os.path.abspath(m)) for m in matches)
+        files.update(os.path.abspath(m) for m in matches if m.endswith(".blend") and os.path.isfile(m))
+
+    root = os.path.commonpath(roots) if roots else os.getcwd()
+    return sorted(files), root
+
+def get_output_path(filepath: str, root: str, output_dir: str) -> str:
+    """Same path relative to the output directory as the file has to the input root, or in place"""
+    if not output_dir:
+        return filepath
+    return os.path.join(os.path.abspath(output_dir), os.path.relpath(filepath, root))
+
+def make_chunks(items, jobs: int, chunk_size: int = 0) -> list:
+    """
+    Split items for the workers. Chunks are small enough to give every worker
+    several, so a slow file doesn't leave the other cores idle at the end.
+    """
+    if not chunk_size:
+        chunk_size = max(1, min(16, len(items) // (jobs * 4)))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+class BatchLog:
+    """Thread-safe sink of per-file results, one JSON object per line"""
+
+    def __init__(self, filepath: str, total: int):
+        self.file = open(filepath, 'a', encoding="utf-8") if filepath else None
+        self.total = total
+        self.results = []
+        self.lock = threading.Lock()
+
+    def add(self, result: dict):
+        with self.lock:
+            self.results.append(result)
+            if self.file:
+                self.file.write(json.dumps(result) + "\n")
+                self.file.flush()
+            status = result["status"].upper()
+            print(f"[BATCH] {len(self.results)}/{self.total} {status} {result['file']} ({result.get('time', 0.0):.2f}s)")
+            if "error" in result:
+                print(f"{' '*2}{result['error']}")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+class BatchRunner:
+    def __init__(self, blender: str, ops, options: dict, log: BatchLog, tmp_dir: str):
+        self.blender = blender
+        self.ops = list(ops)
+        self.options = options
+        self.log = log
+        self.tmp_dir = tmp_dir
+        self._job_counter = 0
+        self._lock = threading.Lock()
+
+    def _write_job(self, files) -> str:
+        with self._lock:
+            self._job_counter += 1
+            job_path = os.path.join(self.tmp_dir, f"job_{self._job_counter}.json")
+        with open(job_path, 'w') as f:
+            json.dump({"files": files, "ops": self.ops, "options": self.options}, f)
+        return job_path
+
+    def run_chunk(self, files):
+        """
+        Process (input, output) pairs in one worker.
+        When the worker dies, the file it was on is marked failed and the
+        rest of the chunk goes to a new worker.
+        """
+        remaining = list(files)
+        while remaining:
+            cmd = [
+                self.blender,
+                "--background",
+                "--factory-startup",
+                "--python", WORKER_SCRIPT,
+                "--",
+                self._write_job(remaining),
+            ]
+            # Last lines of Blender's own output, reported when it fails
+            tail = deque(maxlen=20)
+            done = 0
+            try:
+                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           text=True, encoding="utf-8", errors="replace")
+            except OSError as e:
+                for filepath, output_path in remaining:
+                    self.log.add({"file": filepath, "output": output_path, "status": "failed",
+                                  "error": f"Unable to start Blender: {e}"})
+                return
+
+            for line in process.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    self.log.add(json.loads(line[len(RESULT_PREFIX):]))
+                    done += 1
+                else:
+                    tail.append(line.rstrip())
+            process.wait()
+
+            remaining = remaining[done:]
+            if remaining:
+                filepath, output_path = remaining.pop(0)
+                self.log.add({"file": filepath, "output": output_path, "status": "failed",
+                              "error": f"Worker exited with code {process.returncode}", "log": list(tail)})
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="batch_process.py", description="Apply toolbox cleanups to .blend files with background Blender workers")
+    parser.add_argument("paths", nargs="+", help="Directories (searched recursively), .blend files or glob patterns")
+    parser.add_argument("--ops", required=True, help=f"Comma separated operations, in order: {', '.join(OPERATIONS)}")
+
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--in-place", action="store_true", help="Overwrite the input files")
+    target.add_argument("--output-dir", help="Save to this directory, keeping the paths relative to the inputs")
+
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of Blender processes run at once (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=0, help="Files per worker process (default: automatic)")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or blender)")
+    parser.add_argument("--log", default=None, help="JSON lines file the per-file results are appended to")
+
+    parser.add_argument("--sharp-axis", default="X", choices=("X", "Y", "Z"), help="clear_sharp: axis plane")
+    parser.add_argument("--sharp-threshold", type=float, default=0.0, help="clear_sharp: distance from the axis plane")
+    parser.add_argument("--property-include", default="*", help="clear_custom_properties: patterns of properties to remove")
+    parser.add_argument("--property-exclude", default="", help="clear_custom_properties: patterns of properties to keep")
+    parser.add_argument("--attr-remove", default="*", help="clear_attributes: patterns of attributes to remove")
+    parser.add_argument("--attr-keep", default="", help="clear_attributes: patterns of attributes to keep")
+    parser.add_argument("--regex", action="store_true", help="Patterns are regular expressions instead of wildcards")
+
+    args = parser.parse_args(argv)
+    args.ops = [op.strip() for op in args.ops.split(',') if op.strip()]
+    unknown = [op for op in args.ops if op not in OPERATIONS]
+    if unknown or not args.ops:
+        parser.error(f"Unknown operations: {', '.join(unknown)}" if unknown else "No operations given")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+def main(argv=None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    files, root = find_blend_files(args.paths)
+    if not files:
+        print("[BATCH] No .blend files found")
+        return 1
+
+    pairs = [(f, get_output_path(f, root, args.output_dir)) for f in files]
+    chunks = make_chunks(pairs, args.jobs, args.chunk_size)
+    jobs = min(args.jobs, len(chunks))
+    print(f"[BATCH] {len(files)} files in {len(chunks)} chunks across {jobs} workers: {', '.join(args.ops)}")
+
+    options = {
+        "sharp_axis": args.sharp_axis,
+        "sharp_threshold": args.sharp_threshold,
+        "property_include": args.property_include,
+        "property_exclude": args.property_exclude,
+        "attr_remove": args.attr_remove,
+        "attr_keep": args.attr_keep,
+        "use_regex": args.regex,
+    }
+
+    log = BatchLog(args.log, len(files))
+    t_start = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory(prefix="r0tools_batch_") as tmp_dir:
+            runner = BatchRunner(args.blender, args.ops, options, log, tmp_dir)
+            # Threads only wait on the Blender processes, which do the work
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                for future in [pool.submit(runner.run_chunk, chunk) for chunk in chunks]:
+                    future.result()
+    finally:
+        log.close()
+
+    elapsed = time.perf_counter() - t_start
+    failed = sum(1 for r in log.results if r["status"] != "ok")
+    print(f"[BATCH] Done in {elapsed:.1f}s ({len(files) / elapsed:.2f} files/s): {len(files) - failed} ok, {failed} failed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
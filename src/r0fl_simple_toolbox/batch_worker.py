@@ -0,0 +1,127 @@
+"""
+Background batch worker applying toolbox cleanups to .blend files.
+
+Run by batch_process.py, not imported by the addon:
+    blender --background --factory-startup --python batch_worker.py -- <job.json>
+
+Files of the job are opened one after the other in the same Blender process,
+saving its startup for every file. One result line is printed per file.
+"""
+
+import os
+import sys
+import json
+import time
+import importlib
+import traceback
+
+import bpy
+
+# Printed in front of every result, the rest of the output is Blender's log
+RESULT_PREFIX = "R0TOOLS_RESULT "
+
+# The toolbox package this worker lives in, imported without registering it
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_package_dir))
+_package = os.path.basename(_package_dir)
+
+u = importlib.import_module(f"{_package}.utils")
+hierarchy = importlib.import_module(f"{_package}.hierarchy")
+attributes = importlib.import_module(f"{_package}.attributes")
+property_index = importlib.import_module(f"{_package}.property_index")
+
+def iter_local_meshes():
+    """One local mesh object per mesh data, so shared meshes are processed once"""
+    meshes = {}
+    for obj in bpy.data.objects:
+        if obj.type == "MESH" and not obj.library and not obj.data.library:
+            meshes.setdefault(obj.data, obj)
+    return meshes.values()
+
+def op_clear_split_normals(options) -> int:
+    cleared = 0
+    for obj in iter_local_meshes():
+        cleared += u.clear_custom_normals(obj)
+        u.set_mesh_smooth(obj)
+    return cleared
+
+def op_clear_custom_properties(options) -> int:
+    stats = property_index.purge_custom_properties(
+        include=options.get("property_include", "*"),
+        exclude=options.get("property_exclude", ""),
+        use_regex=options.get("use_regex", False),
+        dry_run=False
+    )
+    return sum(s[0] for s in stats.values())
+
+def op_clear_attributes(options) -> int:
+    rules = attributes.AttributeRules(
+        remove=options.get("attr_remove", "*"),
+        keep=options.get("attr_keep", ""),
+        use_regex=options.get("use_regex", False)
+    )
+    return attributes.remove_attributes(attributes.scan_attributes(rules))
+
+def op_clear_sharp(options) -> int:
+    axis = options.get("sharp_axis", "X")
+    threshold = options.get("sharp_threshold", 0.0)
+
+    cleared = 0
+    for obj in iter_local_meshes():
+        edge_indices = u.get_axis_band_edges(obj.data, axis, threshold)
+        cleared += u.clear_sharp_edges(obj.data, edge_indices)
+    return cleared
+
+def op_unparent(options) -> int:
+    children = [obj for obj in bpy.data.objects if obj.parent is not None and not obj.library]
+    view_layer = bpy.context.scene.view_layers[0] if bpy.context.scene else None
+    failed = hierarchy.unparent_keep_transform(children, view_layer)
+    return len(children) - len(failed)
+
+# Operation name -> function(options) returning the number of elements changed
+OPERATIONS = {
+    "clear_split_normals": op_clear_split_normals,
+    "clear_custom_properties": op_clear_custom_properties,
+    "clear_attributes": op_clear_attributes,
+    "clear_sharp": op_clear_sharp,
+    "unparent": op_unparent,
+}
+
+def process_file(filepath: str, output_path: str, ops, options) -> dict:
+    t_start = time.perf_counter()
+    result = {"file": filepath, "output": output_path, "ops": {}}
+
+    try:
+        bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False, use_scripts=False)
+
+        for name in ops:
+            t_op = time.perf_counter()
+            count = OPERATIONS[name](options)
+            result["ops"][name] = {"changed": count, "time": time.perf_counter() - t_op}
+
+        if output_path == filepath:
+            bpy.ops.wm.save_mainfile()
+        else:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            bpy.ops.wm.save_as_mainfile(filepath=output_path)
+
+        result["status"] = "ok"
+    except Exception as e:
+        traceback.print_exc()
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["time"] = time.perf_counter() - t_start
+    return result
+
+def main(argv):
+    with open(argv[0], 'r') as f:
+        job = json.load(f)
+
+    for filepath, output_path in job["files"]:
+        result = process_file(filepath, output_path, job["ops"], job["options"])
+        # Flushed per file, the driver streams these to its log while the worker runs
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -1,9 +1,7 @@
 from . import bl_info
 
 def _version_str(version_tuple: tuple):
-    v_str = '.'.join([str(n) for n in version_tuple])
-    print(f"{v_str=}")
-    return v_str
+    return '.'.join([str(n) for n in version_tuple])
 
 VERSION = bl_info.get("version", (0, 0, 0))
 VERSION_STR = _version_str(VERSION)
@@ -0,0 +1,186 @@
+import bmesh
+import numpy as np
+
+from . import kernels
+
+def walk_edge_ring(edge) -> list:
+    """
+    Walk the edge ring of an edge across quads, through the loop structure.
+
+    Returns:
+        Ordered list of the ring's edges, the given edge included
+    """
+    visited = {edge}
+    sides = []
+
+    # Walk both directions from the edge, one per face using it
+    for start_loop in list(edge.link_loops)[:2]:
+        side = []
+        loop = start_loop
+        while len(loop.face.verts) == 4:
+            # Opposite edge in the quad
+            loop = loop.link_loop_next.link_loop_next
+            ring_edge = loop.edge
+            if ring_edge in visited:
+                break
+            visited.add(ring_edge)
+            side.append(ring_edge)
+
+            # Cross over to the adjacent face
+            radial = loop.link_loop_radial_next
+            if radial == loop:
+                break
+            loop = radial
+        sides.append(side)
+
+    if len(sides) < 2:
+        sides.append([])
+
+    return list(reversed(sides[1])) + [edge] + sides[0]
+
+def walk_edge_loop(edge) -> list:
+    """Walk the edge loop of an edge through vertices with 4 edges, or 3 along boundaries"""
+    visited = {edge}
+    loop_edges = [edge]
+    valence = 3 if len(edge.link_faces) == 1 else 4
+
+    for start_vert in edge.verts:
+        e = edge
+        vert = start_vert
+        while len(vert.link_edges) == valence:
+            # The continuing edge shares no face with the current one
+            faces = set(e.link_faces)
+            candidates = [x for x in vert.link_edges if x != e and faces.isdisjoint(x.link_faces)]
+            if len(candidates) != 1:
+                break
+            e = candidates[0]
+            if e in visited:
+                break
+            visited.add(e)
+            loop_edges.append(e)
+            vert = e.other_vert(vert)
+
+    return loop_edges
+
+def pick_nth(ring, seed_index: int, nth: int = 2, offset: int = 1) -> list:
+    """
+    Pick every Nth edge of a ring, counting from the seed edge.
+    The seed edge itself is never picked, whatever the offset.
+    Args:
+        ring: Ordered ring edges
+        seed_index: Position of the seed edge in the ring
+        nth: Pick one edge every nth edges
+        offset: Distance from the seed of the first picked edge
+    """
+    mask = kernels.nth_mask(len(ring), seed_index, nth, offset)
+    mask[seed_index] = False
+    return [e for e, picked in zip(ring, mask) if picked]
+
+class RingCache:
+    """
+    Edge rings of a set of seed edges, walked once and reused for any N and offset.
+
+    Edge loops of ring edges are walked on first use and memoized, or all at once
+    with ensure_loops so later lookups never touch the topology.
+    """
+
+    def __init__(self, seed_edges):
+        self.seeds = list(seed_edges)
+        self.rings = []  # (ring edges, seed index)
+        self._loops = {}
+
+        # Seeds lying on a ring already walked from another seed are skipped
+        walked = set()
+        for seed in self.seeds:
+            if seed in walked:
+                continue
+            ring = walk_edge_ring(seed)
+            walked.update(ring)
+            self.rings.append((ring, ring.index(seed)))
+
+    def get_loop(self, edge) -> list:
+        loop = self._loops.get(edge)
+        if loop is None:
+            loop = walk_edge_loop(edge)
+            self._loops[edge] = loop
+        return loop
+
+    def ensure_loops(self):
+        for ring, _ in self.rings:
+            for e in ring:
+                self.get_loop(e)
+
+    def build_index_arrays(self):
+        """
+        Flatten the rings and their edge loops into edge index arrays, so any N and
+        offset is picked with array operations. Edge indices must be valid.
+        """
+        rel = []
+        ring_edges = []
+        loop_edges = []
+        loop_counts = []
+        for ring, seed_index in self.rings:
+            rel.extend(range(-seed_index, len(ring) - seed_index))
+            for e in ring:
+                ring_edges.append(e.index)
+                loop = self.get_loop(e)
+                loop_edges.extend(x.index for x in loop)
+                loop_counts.append(len(loop))
+
+        # Position of every ring edge relative to its seed, 0 for the seeds
+        self.rel = np.array(rel, dtype=np.int64)
+        self.ring_edges = np.array(ring_edges, dtype=np.int64)
+        # Edge loops of the ring edges as a CSR table
+        self.loop_edges = np.array(loop_edges, dtype=np.int64)
+        self.loop_offsets = np.zeros(len(loop_counts) + 1, dtype=np.int64)
+        np.cumsum(loop_counts, out=self.loop_offsets[1:])
+
+    def get_nth_indices(self, nth: int = 2, offset: int = 1, expand=True):
+        """Sorted unique edge indices of get_nth_edges, from build_index_arrays"""
+        picked = (self.rel % nth == offset % nth) & (self.rel != 0)
+        if not expand:
+            return np.unique(self.ring_edges[picked])
+
+        positions = np.flatnonzero(picked)
+        starts = self.loop_offsets[positions]
+        counts = self.loop_offsets[positions + 1] - starts
+        if not len(counts):
+            return np.empty(0, dtype=np.int64)
+        idx = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return np.unique(self.loop_edges[idx])
+
+    def get_nth_edges(self, nth: int = 2, offset: int = 1, expand=True) -> set:
+        """Every Nth edge of the rings, optionally expanded to their edge loops"""
+        picked = set()
+        for ring, seed_index in self.rings:
+            picked.update(pick_nth(ring, seed_index, nth, offset))
+
+        if not expand:
+            return picked
+
+        expanded = set()
+        for e in picked:
+            expanded.update(self.get_loop(e))
+
+        return expanded
+
+def get_nth_edges(seed_edges, nth: int = 2, offset: int = 1, expand=True) -> set:
+    """Collect every Nth edge of the rings of the seed edges, optionally expanded to their edge loops"""
+    return RingCache(seed_edges).get_nth_edges(nth, offset, expand)
+
+def dissolve_nth_edges(bm, seed_edges, nth: int = 2, offset: int = 1, expand=True, keep_seeds=True) -> int:
+    """
+    Dissolve every Nth edge of the rings of the seed edges.
+    Returns the number of edges dissolved.
+    """
+    edges_delete = get_nth_edges(seed_edges, nth, offset, expand)
+    if edges_delete:
+        bmesh.ops.dissolve_edges(bm, edges=list(edges_delete), use_verts=True, use_face_split=False)
+
+    # The seed edges are the only ones left selected
+    if not keep_seeds:
+        for edge in seed_edges:
+            if edge.is_valid:
+                edge.select_set(False)
+
+    return len(edges_delete)
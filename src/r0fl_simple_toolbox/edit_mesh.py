@@ -0,0 +1,86 @@
+import bpy
+import bmesh
+import numpy as np
+from itertools import chain
+
+def iter_edit_meshes(context=None, destructive=False):
+    """
+    Iterate (object, bmesh) for every unique mesh in multi-object Edit mode.
+
+    Edits are made in place on each edit-mesh and a single update_edit_mesh is pushed
+    per mesh once the caller moves on to the next one. Modes are never switched.
+    Args:
+        context: Context to take the objects in mode from. bpy.context if None
+        destructive: Whether the caller changes the topology
+    """
+    context = context or bpy.context
+    for obj in context.objects_in_mode_unique_data:
+        if obj.type != "MESH":
+            continue
+
+        mesh = obj.data
+        bm = bmesh.from_edit_mesh(mesh)
+        yield obj, bm
+        bmesh.update_edit_mesh(mesh, loop_triangles=destructive, destructive=destructive)
+
+def iter_object_meshes(context=None):
+    """Iterate (object, mesh) for every unique mesh of the selected objects which are not in Edit mode"""
+    context = context or bpy.context
+    seen = set()
+    for obj in context.selected_objects:
+        if obj.type != "MESH" or obj.mode == "EDIT":
+            continue
+        mesh = obj.data
+        if mesh in seen:
+            continue
+        seen.add(mesh)
+        yield obj, mesh
+
+
+# ---- Edit-mesh arrays ----
+# Read straight from the BMesh, in the same element order as the mesh data,
+# instead of syncing the whole mesh with update_from_editmode.
+
+def ensure_indices(bm):
+    bm.verts.index_update()
+    bm.edges.index_update()
+    bm.faces.index_update()
+
+def read_select(bm):
+    """Selection of the vertices, edges and faces of an edit-mesh as bool arrays"""
+    return tuple(
+        np.fromiter((e.select for e in seq), dtype=bool, count=len(seq))
+        for seq in (bm.verts, bm.edges, bm.faces)
+    )
+
+def read_coords(bm):
+    """(V, 3) vertex coordinates of an edit-mesh"""
+    co = np.fromiter(chain.from_iterable(v.co for v in bm.verts), dtype=np.float64, count=len(bm.verts) * 3)
+    return co.reshape(-1, 3)
+
+def read_edge_vertices(bm):
+    """(E, 2) vertex indices of every edge of an edit-mesh. Vertex indices must be valid"""
+    edge_verts = np.fromiter(
+        chain.from_iterable((e.verts[0].index, e.verts[1].index) for e in bm.edges),
+        dtype=np.int32, count=len(bm.edges) * 2
+    )
+    return edge_verts.reshape(-1, 2)
+
+def get_loops(bm) -> list:
+    """Every loop of an edit-mesh, in face order like the mesh loops"""
+    return [loop for face in bm.faces for loop in face.loops]
+
+def read_loop_indices(loops):
+    """Vertex and edge index of every loop from get_loops. Indices must be valid"""
+    n_loops = len(loops)
+    loop_verts = np.fromiter((loop.vert.index for loop in loops), dtype=np.int32, count=n_loops)
+    loop_edges = np.fromiter((loop.edge.index for loop in loops), dtype=np.int32, count=n_loops)
+    return loop_verts, loop_edges
+
+def read_loop_totals(bm):
+    return np.fromiter((len(face.loops) for face in bm.faces), dtype=np.int32, count=len(bm.faces))
+
+def read_uv(loops, uv_layer):
+    """(L, 2) UVs of the loops from get_loops on a BMesh UV layer"""
+    uv = np.fromiter(chain.from_iterable(loop[uv_layer].uv for loop in loops), dtype=np.float64, count=len(loops) * 2)
+    return uv.reshape(-1, 2)
@@ -0,0 +1,168 @@
+import bpy
+import numpy as np
+
+from . import kernels
+from . import profiling
+
+class HierarchyIndex:
+    """
+    Parent to children map of the objects in a view layer.
+
+    Built lazily in one pass over the view layer and only rebuilt once invalidated,
+    which happens when a depsgraph update reports changed parenting.
+    """
+
+    def __init__(self):
+        self._objects = []
+        self._rows = {}  # object pointer -> row in _objects
+        self._children = np.empty(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._parents = {}
+        self._view_layer_ptr = 0
+        self._valid = False
+
+    def invalidate(self):
+        self._valid = False
+
+    def is_valid(self) -> bool:
+        return self._valid
+
+    def build(self, view_layer):
+        objects = list(view_layer.objects)
+        rows = {obj.as_pointer(): i for i, obj in enumerate(objects)}
+        parents = {}
+        parent_rows = np.full(len(objects), -1, dtype=np.int64)
+        for i, obj in enumerate(objects):
+            parent = obj.parent
+            parent_ptr = parent.as_pointer() if parent else 0
+            parents[obj.as_pointer()] = parent_ptr
+            parent_rows[i] = rows.get(parent_ptr, -1)
+
+        self._objects = objects
+        self._rows = rows
+        self._children, self._offsets = kernels.children_table(parent_rows)
+        self._parents = parents
+        self._view_layer_ptr = view_layer.as_pointer()
+        self._valid = True
+
+    def ensure(self, view_layer=None):
+        view_layer = view_layer or bpy.context.view_layer
+        if not self._valid or self._view_layer_ptr != view_layer.as_pointer():
+            self.build(view_layer)
+        return self
+
+    def _rows_to_objects(self, rows) -> list:
+        objects = self._objects
+        return [objects[i] for i in rows]
+
+    def children(self, obj) -> list:
+        row = self._rows.get(obj.as_pointer())
+        if row is None:
+            return []
+        return self._rows_to_objects(self._children[self._offsets[row]:self._offsets[row + 1]])
+
+    def iter_depth_first(self, obj, recursive=True):
+        """Iterate through the children of an object, each followed by its own children"""
+        if not recursive:
+            yield from self.children(obj)
+            return
+
+        row = self._rows.get(obj.as_pointer())
+        if row is None:
+            return
+        yield from self._rows_to_objects(kernels.depth_first(self._children, self._offsets, row))
+
+    def iter_breadth_first(self, obj):
+        """Iterate through the children of an object level by level"""
+        row = self._rows.get(obj.as_pointer())
+        if row is None:
+            return
+        yield from self._rows_to_objects(kernels.breadth_first(self._children, self._offsets, row))
+
+    def check_updates(self, depsgraph):
+        """Invalidate the index if any updated object was added or re-parented"""
+        if not self._valid:
+            return
+
+        if len(depsgraph.view_layer.objects) != len(self._parents):
+            self.invalidate()
+            return
+
+        for update in depsgraph.updates:
+            if not isinstance(update.id, bpy.types.Object):
+                continue
+            obj = update.id.original
+            parent = obj.parent
+            parent_ptr = parent.as_pointer() if parent else 0
+            if self._parents.get(obj.as_pointer()) != parent_ptr:
+                self.invalidate()
+                return
+
+
+_index = HierarchyIndex()
+
+def get_index(view_layer=None) -> HierarchyIndex:
+    """Get the hierarchy index of a view layer, rebuilding it if needed"""
+    return _index.ensure(view_layer)
+
+def unparent_keep_transform(objects, view_layer=None) -> list:
+    """
+    Clear the parent of objects keeping their world transform, without operators.
+
+    World matrices are captured for every object before any parent is cleared,
+    followed by a single view layer update. Selection and visibility are untouched.
+    Returns:
+        List of objects which could not be unparented
+    """
+    world_matrices = [obj.matrix_world.copy() for obj in objects]
+
+    failed = []
+    for obj, matrix in zip(objects, world_matrices):
+        try:
+            obj.parent = None
+            obj.matrix_parent_inverse.identity()
+            obj.matrix_world = matrix
+        except Exception as e:
+            print(f"ERROR: Unable to unparent {obj.name}: {e}")
+            failed.append(obj)
+
+    _index.invalidate()
+    profiling.update_view_layer(view_layer)
+
+    return failed
+
+
+@bpy.app.handlers.persistent
+def hierarchy_depsgraph_update(scene, depsgraph):
+    _index.check_updates(depsgraph)
+
+@bpy.app.handlers.persistent
+def hierarchy_invalidate(*args):
+    # Undo and file loads replace every object
+    _index.invalidate()
+
+# -------------------------------------------------------------------
+#   Register & Unregister
+# -------------------------------------------------------------------
+
+handlers = [
+    (bpy.app.handlers.depsgraph_update_post, hierarchy_depsgraph_update),
+    (bpy.app.handlers.undo_post, hierarchy_invalidate),
+    (bpy.app.handlers.redo_post, hierarchy_invalidate),
+    (bpy.app.handlers.load_post, hierarchy_invalidate),
+]
+
+def register():
+    for handler_list, handler in handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        try:
+            if handler in handler_list:
+                handler_list.remove(handler)
+        except Exception as e:
+            print(f"Error removing handler {handler}: {e}")
+
+    _index.invalidate()
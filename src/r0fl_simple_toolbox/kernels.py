@@ -0,0 +1,240 @@
+"""
+Numeric cores of the toolbox working on plain NumPy arrays.
+
+Nothing here imports bpy. The modules using these read the arrays with
+foreach_get and write results back, so the kernels can be tested and
+benchmarked in plain CPython.
+"""
+import numpy as np
+
+# ---- Mesh ----
+
+def axis_band_edges(co, edge_verts, axis: int, threshold: float):
+    """
+    Indices of the edges with both vertices within threshold of an axis plane.
+    Args:
+        co: (V, 3) vertex coordinates
+        edge_verts: (E, 2) vertex indices of each edge
+        axis: 0, 1 or 2 for X, Y or Z
+    """
+    in_band = np.abs(co[:, axis]) <= threshold
+    return np.flatnonzero(in_band[edge_verts[:, 0]] & in_band[edge_verts[:, 1]])
+
+def loose_geometry(n_verts: int, edge_verts, loop_verts, loop_edges):
+    """
+    Loose geometry from how often each element is used by face corners.
+    Returns:
+        Tuple of index arrays (loose_verts, loose_edges, wire_edges)
+        loose_verts: Vertices not used by any edge or face
+        loose_edges: Edges without faces which are not attached to any face either
+        wire_edges: All edges without faces
+    """
+    vert_in_face = np.bincount(loop_verts, minlength=n_verts) > 0
+    vert_in_edge = np.bincount(edge_verts.ravel(), minlength=n_verts) > 0
+    edge_in_face = np.bincount(loop_edges, minlength=len(edge_verts)) > 0
+
+    wire = ~edge_in_face
+    loose = wire & ~vert_in_face[edge_verts[:, 0]] & ~vert_in_face[edge_verts[:, 1]]
+
+    return np.flatnonzero(~(vert_in_face | vert_in_edge)), np.flatnonzero(loose), np.flatnonzero(wire)
+
+def nth_mask(length: int, seed_index: int, nth: int = 2, offset: int = 1):
+    """Mask of every Nth element of an ordered ring, counting from the seed element"""
+    offset = offset % nth
+    return (np.arange(length) - seed_index) % nth == offset
+
+# ---- UV islands and texel density ----
+
+def loop_topology(loop_starts, loop_totals, n_loops: int):
+    """Polygon index and next loop index in the polygon, of every loop"""
+    loop_polys = np.repeat(np.arange(len(loop_starts), dtype=np.int32), loop_totals)
+    next_loop = np.arange(1, n_loops + 1, dtype=np.int32)
+    last_loops = loop_starts + loop_totals - 1
+    next_loop[last_loops] = loop_starts
+    return loop_polys, next_loop
+
+def face_areas(co, loop_verts, next_loop, loop_polys, n_polys: int):
+    """3D area of every polygon from the norm of its vector area"""
+    cross = np.cross(co[loop_verts], co[loop_verts[next_loop]])
+    vector_area = np.stack([np.bincount(loop_polys, weights=cross[:, i], minlength=n_polys) for i in range(3)], axis=1)
+    return 0.5 * np.linalg.norm(vector_area, axis=1)
+
+def uv_face_areas(uv, next_loop, loop_polys, n_polys: int):
+    """UV area of every polygon, with the shoelace formula"""
+    uv_next = uv[next_loop]
+    cross = uv[:, 0] * uv_next[:, 1] - uv_next[:, 0] * uv[:, 1]
+    return 0.5 * np.abs(np.bincount(loop_polys, weights=cross, minlength=n_polys))
+
+def connected_components(n: int, a, b):
+    """
+    Label the connected components of n nodes joined by the pairs (a, b).
+
+    Vectorized union-find: roots of joined pairs are hooked onto the smaller
+    root, then paths are compressed, until every pair shares a root.
+    Returns:
+        Tuple (labels, number of components) with labels in 0..components-1
+    """
+    parent = np.arange(n, dtype=np.int64)
+    while len(a):
+        root_a = parent[a]
+        root_b = parent[b]
+        differ = root_a != root_b
+        if not differ.any():
+            break
+        lo = np.minimum(root_a, root_b)[differ]
+        hi = np.maximum(root_a, root_b)[differ]
+        np.minimum.at(parent, hi, lo)
+
+        # Compress until every node points at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels, len(roots)
+
+def uv_islands(loop_verts, loop_edges, loop_polys, next_loop, uv, n_polys: int, epsilon: float = 1e-5):
+    """
+    Group polygons into UV islands.
+
+    Two polygons sharing an edge are in the same island when the UVs at both
+    ends of the edge match on each side.
+    Returns:
+        Tuple (island index of every polygon, number of islands)
+    """
+    order = np.argsort(loop_edges, kind="stable")
+    sorted_edges = loop_edges[order]
+
+    # Consecutive loops on the same edge
+    same_edge = sorted_edges[:-1] == sorted_edges[1:]
+    la = order[:-1][same_edge]
+    lb = order[1:][same_edge]
+
+    la_next = next_loop[la]
+    lb_next = next_loop[lb]
+
+    # Neighbours usually run the shared edge in opposite directions
+    opposite = loop_verts[la] != loop_verts[lb]
+    lb_start = np.where(opposite, lb_next, lb)
+    lb_end = np.where(opposite, lb, lb_next)
+
+    match = (
+        (np.abs(uv[la] - uv[lb_start]) <= epsilon).all(axis=1)
+        & (np.abs(uv[la_next] - uv[lb_end]) <= epsilon).all(axis=1)
+    )
+
+    return connected_components(n_polys, loop_polys[la[match]], loop_polys[lb[match]])
+
+def island_sums(face_island, n_islands: int, values):
+    return np.bincount(face_island, weights=values, minlength=n_islands)
+
+def density(area_3d, area_uv, texture_size: int):
+    """Texel density in pixels per unit of the 3D areas, 0 where there is no area"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = texture_size * np.sqrt(area_uv / area_3d)
+    result[~np.isfinite(result)] = 0.0
+    return result
+
+def scale_islands(uv, loop_island, island_density, target: float):
+    """
+    Scale every island around its UV bounds center to reach the target density.
+    Islands without area are left untouched.
+    Returns:
+        New (L, 2) UV array
+    """
+    n_islands = len(island_density)
+    with np.errstate(divide="ignore"):
+        scale = np.where(island_density > 0, target / island_density, 1.0)
+
+    # Per island bounds from runs of loops sorted by island, ufunc.at is much slower
+    order = np.argsort(loop_island, kind="stable")
+    sorted_islands = loop_island[order]
+    starts = np.flatnonzero(np.r_[True, sorted_islands[1:] != sorted_islands[:-1]])
+    sorted_uv = uv[order]
+
+    center = np.zeros((n_islands, 2))
+    present = sorted_islands[starts]
+    center[present] = (np.minimum.reduceat(sorted_uv, starts, axis=0) + np.maximum.reduceat(sorted_uv, starts, axis=0)) * 0.5
+
+    return center[loop_island] + (uv - center[loop_island]) * scale[loop_island, None]
+
+# ---- Hierarchy ----
+
+def children_table(parents):
+    """
+    Children of every node, as a CSR table.
+    Args:
+        parents: Parent index of every node, -1 for roots
+    Returns:
+        Tuple (children, offsets): the children of node i are children[offsets[i]:offsets[i + 1]],
+        in node order
+    """
+    parents = np.asarray(parents, dtype=np.int64)
+    n = len(parents)
+    has_parent = parents >= 0
+    children = np.flatnonzero(has_parent)
+    children = children[np.argsort(parents[children], kind="stable")]
+    counts = np.bincount(parents[has_parent], minlength=n)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return children, offsets
+
+def _gather_children(children, offsets, level):
+    """Children of every node of a level, grouped by parent in level order, and their counts per node"""
+    starts = offsets[level]
+    counts = offsets[level + 1] - starts
+    idx = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    return children[idx], counts
+
+def depth_first(children, offsets, root: int):
+    """
+    Descendants of a node, each followed by its own descendants.
+
+    Only the subtree is visited, one gather per level: subtree sizes are summed
+    up the levels, then every node is placed after its parent and its earlier
+    siblings' subtrees.
+    """
+    levels = []
+    parents = []  # Per level, position of each node's parent in the previous level
+    level = children[offsets[root]:offsets[root + 1]]
+    while len(level):
+        levels.append(level)
+        level, counts = _gather_children(children, offsets, level)
+        parents.append(np.repeat(np.arange(len(counts)), counts))
+
+    if not levels:
+        return np.empty(0, dtype=children.dtype)
+
+    # Subtree sizes, from the deepest level up
+    sizes = [None] * len(levels)
+    sizes[-1] = np.ones(len(levels[-1]), dtype=np.int64)
+    for d in range(len(levels) - 2, -1, -1):
+        sizes[d] = 1 + np.bincount(parents[d], weights=sizes[d + 1], minlength=len(levels[d])).astype(np.int64)
+
+    # Positions in the result, from the top level down
+    result = np.empty(int(sizes[0].sum()), dtype=children.dtype)
+    position = np.cumsum(sizes[0]) - sizes[0]
+    result[position] = levels[0]
+    for d in range(1, len(levels)):
+        size = sizes[d]
+        parent = parents[d - 1]
+        before = np.cumsum(size) - size
+        # Subtract the sizes of the siblings of earlier parents
+        first = np.flatnonzero(np.r_[True, parent[1:] != parent[:-1]])
+        group_start = np.repeat(before[first], np.diff(np.r_[first, len(parent)]))
+        position = position[parent] + 1 + before - group_start
+        result[position] = levels[d]
+
+    return result
+
+def breadth_first(children, offsets, root: int):
+    """Descendants of a node level by level, one slice per level"""
+    result = []
+    level = children[offsets[root]:offsets[root + 1]]
+    while len(level):
+        result.append(level)
+        # Gather the children of the whole level at once
+        level, _ = _gather_children(children, offsets, level)
+    return np.concatenate(result) if result else np.empty(0, dtype=np.int64)
@@ -0,0 +1,209 @@
+"""
+LOD operators, imported and registered only while Experimental Features are enabled.
+"""
+import bpy
+import numpy as np
+
+from . import utils as u
+from . import lods
+
+class SimpleToolbox_OT_ScreenCoverage(bpy.types.Operator):
+    bl_label = "Screen Coverage"
+    bl_idname = "r0tools.screen_coverage"
+    bl_description = "Compute the projected screen area of every visible mesh and select or tag the ones below the Screen Size Threshold.\n\nViewport: Project from the active 3D viewport.\nCamera: Project from the scene camera, using the render resolution. Works in background mode."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('VIEWPORT', "Viewport", "Project from the active 3D viewport"),
+            ('CAMERA', "Camera", "Project from the scene camera"),
+        ],
+        default='VIEWPORT'
+    )
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('SELECT', "Select", "Select objects below the threshold"),
+            ('TAG', "Tag", f"Store the screen coverage in the '{lods.COVERAGE_PROP}' custom property of objects below the threshold"),
+        ],
+        default='SELECT'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT"
+
+    def get_view_projection(self, context):
+        if self.source == 'CAMERA':
+            if not context.scene.camera:
+                self.report({'ERROR'}, "Scene has no camera")
+                return None
+            return lods.get_camera_view_projection(context.scene)
+
+        region, rv3d = u.get_viewport(context)
+        if not (region and rv3d):
+            self.report({'ERROR'}, "Could not find 3D viewport")
+            return None
+        return lods.get_viewport_view_projection(rv3d)
+
+    def execute(self, context):
+        threshold = context.scene.r0fl_toolbox_props.polygon_threshold
+
+        view_proj = self.get_view_projection(context)
+        if view_proj is None:
+            return {'CANCELLED'}
+
+        objects, corners, matrices = lods.get_world_bound_boxes()
+        coverage = lods.get_screen_coverage(corners, matrices, view_proj)
+        below = coverage < threshold
+
+        if self.action == 'SELECT':
+            u.deselect_all()
+            for obj, is_below in zip(objects, below):
+                if is_below:
+                    obj.select_set(True)
+        elif self.action == 'TAG':
+            for obj, is_below, pct in zip(objects, below, coverage):
+                if is_below:
+                    obj[lods.COVERAGE_PROP] = float(pct)
+                elif lods.COVERAGE_PROP in obj:
+                    del obj[lods.COVERAGE_PROP]
+
+        msg = f"{int(np.count_nonzero(below))} of {len(objects)} visible objects cover less than {threshold:.2f}% of the screen"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_GenerateLODs(bpy.types.Operator):
+    bl_label = "Generate LODs"
+    bl_idname = "r0tools.generate_lods"
+    bl_description = "Generate LOD1..LODn objects for the selected meshes from the LOD Screen Sizes table.\nDecimation runs in a pool of background Blender processes and a report is written to the 'r0_LOD_Report' text."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    REPORT_TEXT = "r0_LOD_Report"
+
+    _timer = None
+    _pool = None
+    _objects = None
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT" and len(context.selected_objects) > 0
+
+    def prepare(self, context) -> bool:
+        addon_props = context.scene.r0fl_toolbox_props
+
+        screen_sizes = lods.parse_screen_sizes(addon_props.lod_screen_sizes_prop)
+        if not screen_sizes:
+            self.report({'ERROR'}, "No LOD screen sizes set")
+            return False
+
+        ratios = lods.get_decimate_ratios(screen_sizes, addon_props.screen_size_pct_prop)
+
+        objects = list(u.iter_scene_objects(selected=True, type="MESH"))
+        meshes = {obj.data for obj in objects}
+        # Names only, objects may be deleted or undone while the workers run.
+        # Worker results are keyed by the mesh names written here.
+        self._objects = [(obj.name, obj.data.name) for obj in objects]
+        if not meshes:
+            self.report({'ERROR'}, "No meshes selected")
+            return False
+
+        self._pool = lods.LODWorkerPool(meshes, ratios, workers=addon_props.lod_workers_prop)
+        print(f"[LODS] Generating {len(ratios)} LODs for {len(meshes)} meshes across {len(self._pool.batches)} workers")
+        self._pool.start()
+        return True
+
+    def create_lod_objects(self, results):
+        """
+        Returns:
+            Tuple (number of LOD objects created, names of source objects no longer found)
+        """
+        created = 0
+        missing = []
+        for obj_name, mesh_name in self._objects:
+            entry = results.get(mesh_name)
+            if not entry:
+                continue
+
+            obj = bpy.data.objects.get(obj_name)
+            if obj is None or obj.type != "MESH":
+                missing.append(obj_name)
+                continue
+
+            for lod in entry["lods"]:
+                lod_mesh = lod["datablock"]
+                if lod_mesh is None:
+                    continue
+
+                if not lod_mesh.materials:
+                    for mat in obj.data.materials:
+                        lod_mesh.materials.append(mat)
+
+                lod_obj = bpy.data.objects.new(f"{obj.name}_LOD{lod['lod']}", lod_mesh)
+                lod_obj.matrix_world = obj.matrix_world.copy()
+                for collection in obj.users_collection:
+                    collection.objects.link(lod_obj)
+                created += 1
+
+        return created, missing
+
+    def finish(self, context):
+        elapsed = self._pool.elapsed()
+        results = self._pool.load_results()
+        self._pool.cleanup()
+
+        created, missing = self.create_lod_objects(results)
+
+        report = lods.format_lod_report(results, elapsed)
+        print(report)
+        text = bpy.data.texts.get(self.REPORT_TEXT) or bpy.data.texts.new(self.REPORT_TEXT)
+        text.from_string(report)
+
+        self.report({'INFO'}, f"Created {created} LOD objects for {len(results)} meshes in {elapsed:.2f}s")
+
+        if missing:
+            self.report({'WARNING'}, f"Skipped {len(missing)} objects removed during generation: {', '.join(missing)}")
+
+        failed = [batch for batch in self._pool.batches if batch.failed]
+        if failed:
+            self.report({'WARNING'}, f"{len(failed)} LOD worker(s) failed, see {', '.join(batch.log_path for batch in failed)}")
+
+    def invoke(self, context, event):
+        if not self.prepare(context):
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._pool.terminate()
+            context.window_manager.event_timer_remove(self._timer)
+            self.report({'WARNING'}, "LOD generation cancelled")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER' and self._pool.is_done():
+            context.window_manager.event_timer_remove(self._timer)
+            self.finish(context)
+            return {'FINISHED'}
+
+        return {'PASS_THROUGH'}
+
+    def execute(self, context):
+        # Blocking path, used from scripts and background mode
+        if not self.prepare(context):
+            return {'CANCELLED'}
+
+        self._pool.wait()
+        self.finish(context)
+        return {'FINISHED'}
+
+
+classes = [
+    SimpleToolbox_OT_ScreenCoverage,
+    SimpleToolbox_OT_GenerateLODs,
+]
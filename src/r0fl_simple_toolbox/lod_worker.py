@@ -0,0 +1,71 @@
+"""
+Background LOD decimation worker.
+
+Run by lods.LODWorkerPool, not imported by the addon:
+    blender --background --factory-startup --python lod_worker.py -- <input.blend> <output.blend> <report.json> <ratios json>
+"""
+
+import sys
+import json
+import time
+
+import bpy
+import numpy as np
+
+def count_triangles(mesh) -> int:
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(np.sum(loop_totals - 2))
+
+def decimate_mesh(mesh, ratios):
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    mod = obj.modifiers.new("Decimate", 'DECIMATE')
+
+    lods = []
+    for lod_idx, ratio in enumerate(ratios, start=1):
+        t_start = time.perf_counter()
+        mod.ratio = ratio
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        lod_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        lod_mesh.name = f"{mesh.name}_LOD{lod_idx}"
+        # Materials are re-assigned from the source mesh when loaded back
+        lod_mesh.materials.clear()
+        lods.append({
+            "lod": lod_idx,
+            "mesh": lod_mesh.name,
+            "ratio": ratio,
+            "tris": count_triangles(lod_mesh),
+            "time": time.perf_counter() - t_start,
+            "datablock": lod_mesh,
+        })
+
+    bpy.data.objects.remove(obj)
+    return lods
+
+def main(argv):
+    input_path, output_path, report_path, ratios = argv
+    ratios = json.loads(ratios)
+    t_start = time.perf_counter()
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    with bpy.data.libraries.load(input_path, link=False) as (data_from, data_to):
+        data_to.meshes = data_from.meshes
+
+    report = {}
+    lod_meshes = set()
+    for mesh in data_to.meshes:
+        lods = decimate_mesh(mesh, ratios)
+        lod_meshes.update(lod["datablock"] for lod in lods)
+        for lod in lods:
+            del lod["datablock"]
+        report[mesh.name] = {"source_tris": count_triangles(mesh), "lods": lods}
+
+    bpy.data.libraries.write(output_path, lod_meshes, fake_user=True)
+
+    with open(report_path, 'w') as f:
+        json.dump({"meshes": report, "time": time.perf_counter() - t_start}, f, indent=2)
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -0,0 +1,258 @@
+import os
+import bpy
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+import numpy as np
+
+# Custom property written on objects tagged by the screen coverage analysis
+COVERAGE_PROP = "r0_screen_coverage"
+
+# Script run by each background Blender process of the LOD worker pool
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "lod_worker.py")
+
+def get_world_bound_boxes(object_type: str = "MESH"):
+    """
+    Bulk read the local bound box corners and world matrices of every visible object.
+
+    Returns:
+        Tuple (objects, corners, matrices) where corners is an (N, 8, 3) array
+        and matrices an (N, 4, 4) row-major array.
+    """
+    all_objects = bpy.data.objects
+    n = len(all_objects)
+
+    corners = np.empty(n * 24, dtype=np.float32)
+    all_objects.foreach_get("bound_box", corners)
+
+    # Matrices come out column-major
+    matrices = np.empty(n * 16, dtype=np.float32)
+    all_objects.foreach_get("matrix_world", matrices)
+
+    mask = np.fromiter(
+        (obj.visible_get() and (not object_type or obj.type == object_type) for obj in all_objects),
+        dtype=bool,
+        count=n
+    )
+    objects = [all_objects[int(idx)] for idx in np.flatnonzero(mask)]
+
+    return objects, corners.reshape(n, 8, 3)[mask], matrices.reshape(n, 4, 4).transpose(0, 2, 1)[mask]
+
+def get_viewport_view_projection(rv3d):
+    """View projection matrix of a 3D viewport"""
+    return np.array(rv3d.perspective_matrix, dtype=np.float32)
+
+def get_camera_view_projection(scene, camera=None):
+    """View projection matrix of a camera, using the scene render resolution. Works headless."""
+    camera = camera or scene.camera
+    render = scene.render
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    projection = camera.calc_matrix_camera(
+        depsgraph,
+        x=render.resolution_x,
+        y=render.resolution_y,
+        scale_x=render.pixel_aspect_x,
+        scale_y=render.pixel_aspect_y
+    )
+
+    return np.array(projection @ camera.matrix_world.inverted(), dtype=np.float32)
+
+def get_screen_coverage(corners, matrices, view_proj):
+    """
+    Projected screen area percentage of each bound box.
+
+    All boxes are transformed in a single batched matmul and their coverage is the
+    screen-clipped 2D rectangle enclosing the projected corners.
+    Boxes entirely behind the view cover 0%, boxes the view is inside of or
+    crossing the view plane count as covering the whole screen.
+    Args:
+        corners: (N, 8, 3) local bound box corners
+        matrices: (N, 4, 4) object to world matrices
+        view_proj: (4, 4) view projection matrix
+    """
+    n = len(corners)
+    if not n:
+        return np.empty(0, dtype=np.float32)
+
+    corners_h = np.ones((n, 8, 4), dtype=np.float32)
+    corners_h[..., :3] = corners
+
+    mvp = view_proj @ matrices
+    clip = corners_h @ mvp.transpose(0, 2, 1)
+
+    w = clip[..., 3]
+    in_front = w > 1e-6
+    all_behind = ~in_front.any(axis=1)
+    crossing = ~in_front.all(axis=1) & ~all_behind
+
+    ndc = clip[..., :2] / np.where(in_front, w, 1.0)[..., None]
+    lo = np.clip(ndc.min(axis=1), -1.0, 1.0)
+    hi = np.clip(ndc.max(axis=1), -1.0, 1.0)
+
+    # NDC spans [-1, 1] on both axes, an area of 4
+    coverage = np.prod(hi - lo, axis=1) * 25.0
+    coverage[all_behind] = 0.0
+    coverage[crossing] = 100.0
+
+    return coverage
+
+def parse_screen_sizes(text: str) -> list[float]:
+    """Parse a comma-separated list of screen size percentages, largest first"""
+    sizes = []
+    for t in text.split(','):
+        t = t.strip()
+        if not t:
+            continue
+        try:
+            sizes.append(float(t))
+        except ValueError:
+            print(f"[LODS] Ignoring invalid screen size '{t}'")
+
+    return sorted(sizes, reverse=True)
+
+def get_decimate_ratios(screen_sizes, reference_size: float) -> list[float]:
+    """
+    Decimate ratio for each screen size target.
+
+    Keeps triangle density per screen area constant, so the ratio is the
+    target size relative to the size LOD0 is displayed at.
+    """
+    reference_size = reference_size or 100.0
+    return [min(max(size / reference_size, 0.001), 1.0) for size in screen_sizes]
+
+
+class LODBatch:
+    """A batch of meshes decimated by one background Blender process"""
+
+    def __init__(self, index: int, tmp_dir: str):
+        self.meshes = []
+        self.weight = 0
+        self.process = None
+        self.failed = False
+        self.input_path = os.path.join(tmp_dir, f"batch_{index}_in.blend")
+        self.output_path = os.path.join(tmp_dir, f"batch_{index}_out.blend")
+        self.report_path = os.path.join(tmp_dir, f"batch_{index}_report.json")
+        self.log_path = os.path.join(tmp_dir, f"batch_{index}.log")
+
+    def start(self, ratios):
+        bpy.data.libraries.write(self.input_path, set(self.meshes), fake_user=True)
+
+        cmd = [
+            bpy.app.binary_path,
+            "--background",
+            "--factory-startup",
+            "--python", WORKER_SCRIPT,
+            "--",
+            self.input_path,
+            self.output_path,
+            self.report_path,
+            json.dumps(ratios),
+        ]
+        with open(self.log_path, 'w') as log:
+            self.process = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+
+    def is_done(self) -> bool:
+        return self.process is not None and self.process.poll() is not None
+
+    def load_results(self) -> dict:
+        """
+        Append the LOD meshes written by the worker.
+
+        Returns:
+            Dict of source mesh name to its report entry, with each LOD's loaded mesh datablock
+            stored under "datablock".
+        """
+        if self.process.returncode != 0 or not os.path.exists(self.report_path):
+            self.failed = True
+            print(f"[LODS] Worker failed with code {self.process.returncode}, see {self.log_path}")
+            return {}
+
+        with open(self.report_path, 'r') as f:
+            report = json.load(f)["meshes"]
+
+        # Appended meshes may be renamed on name clashes, so map by file order
+        with bpy.data.libraries.load(self.output_path, link=False) as (data_from, data_to):
+            data_to.meshes = data_from.meshes
+        loaded = dict(zip(data_from.meshes, data_to.meshes))
+
+        for entry in report.values():
+            for lod in entry["lods"]:
+                lod["datablock"] = loaded.get(lod["mesh"])
+
+        return report
+
+
+class LODWorkerPool:
+    """Decimates meshes across a pool of background Blender processes, one batch per worker"""
+
+    def __init__(self, meshes, ratios, workers: int = 0):
+        self.ratios = ratios
+        self.tmp_dir = tempfile.mkdtemp(prefix="r0tools_lods_")
+        self.t_start = 0.0
+
+        workers = workers or os.cpu_count() or 1
+        self.batches = [LODBatch(i, self.tmp_dir) for i in range(min(workers, len(meshes)))]
+
+        # Balance batches by face count, heaviest meshes first
+        for mesh in sorted(meshes, key=lambda m: len(m.polygons), reverse=True):
+            batch = min(self.batches, key=lambda b: b.weight)
+            batch.meshes.append(mesh)
+            batch.weight += len(mesh.polygons)
+
+    def start(self):
+        self.t_start = time.perf_counter()
+        try:
+            for batch in self.batches:
+                batch.start(self.ratios)
+        except BaseException:
+            # Stop the workers already running and remove the temp directory
+            self.terminate()
+            raise
+
+    def is_done(self) -> bool:
+        return all(batch.is_done() for batch in self.batches)
+
+    def wait(self):
+        for batch in self.batches:
+            batch.process.wait()
+
+    def terminate(self):
+        for batch in self.batches:
+            if batch.process and not batch.is_done():
+                batch.process.terminate()
+        self.cleanup()
+
+    def load_results(self) -> dict:
+        results = {}
+        for batch in self.batches:
+            results.update(batch.load_results())
+        return results
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.t_start
+
+    def cleanup(self):
+        """Remove the temp directory, except the logs of failed workers"""
+        failed_logs = {batch.log_path for batch in self.batches if batch.failed}
+        if not failed_logs:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+            return
+
+        for name in os.listdir(self.tmp_dir):
+            path = os.path.join(self.tmp_dir, name)
+            if path not in failed_logs:
+                os.remove(path)
+        print(f"[LODS] Logs of failed workers kept in {self.tmp_dir}")
+
+def format_lod_report(results: dict, elapsed: float) -> str:
+    """Per-LOD triangle count and timing table"""
+    lines = [f"LOD generation: {len(results)} meshes in {elapsed:.2f}s", ""]
+    for mesh_name, entry in sorted(results.items()):
+        lines.append(f"{mesh_name}: LOD0 {entry['source_tris']} tris")
+        for lod in entry["lods"]:
+            lines.append(f"{' '*2}LOD{lod['lod']}: {lod['tris']} tris (ratio {lod['ratio']:.3f}) in {lod['time']:.3f}s")
+
+    return '\n'.join(lines)
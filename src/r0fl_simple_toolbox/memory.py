@@ -0,0 +1,110 @@
+import bpy
+import csv
+
+from .attributes import DATA_TYPE_SIZES, get_domain_size
+
+# Topology attributes, accounted for from element counts
+GEOMETRY_ATTRIBUTES = {"position", ".edge_verts", ".corner_vert", ".corner_edge"}
+
+# Bytes per element of the topology arrays
+VERTEX_SIZE = 12        # float3 position
+EDGE_SIZE = 8           # int2 vertex indices
+LOOP_SIZE = 8           # int vertex + int edge index
+POLY_OFFSET_SIZE = 4    # int corner offset, one extra for the end
+SHAPE_KEY_VERTEX_SIZE = 12
+CUSTOM_NORMAL_SIZE = 4  # short2 per corner
+
+class MeshMemory:
+    """Estimated memory footprint of a mesh, broken down by category and attribute"""
+    __slots__ = ("name", "users", "verts", "edges", "loops", "polys",
+                 "geometry", "attributes", "uv_maps", "shape_keys", "custom_normals", "attribute_sizes")
+
+    CATEGORIES = ("geometry", "attributes", "uv_maps", "shape_keys", "custom_normals")
+
+    def __init__(self, mesh):
+        self.name = mesh.name
+        self.users = mesh.users
+        self.verts = len(mesh.vertices)
+        self.edges = len(mesh.edges)
+        self.loops = len(mesh.loops)
+        self.polys = len(mesh.polygons)
+
+        self.geometry = (
+            self.verts * VERTEX_SIZE
+            + self.edges * EDGE_SIZE
+            + self.loops * LOOP_SIZE
+            + (self.polys + 1) * POLY_OFFSET_SIZE
+        )
+
+        uv_names = set(mesh.uv_layers.keys())
+        self.attributes = 0
+        self.uv_maps = 0
+        self.attribute_sizes = []
+        has_normal_attribute = False
+        for attr in mesh.attributes:
+            name = attr.name
+            if name in GEOMETRY_ATTRIBUTES:
+                continue
+            size = get_domain_size(mesh, attr.domain) * DATA_TYPE_SIZES.get(attr.data_type, 4)
+            self.attribute_sizes.append((name, attr.domain, attr.data_type, size))
+            if name in uv_names:
+                self.uv_maps += size
+            else:
+                self.attributes += size
+            if name == "custom_normal":
+                has_normal_attribute = True
+
+        shape_keys = mesh.shape_keys
+        n_keys = len(shape_keys.key_blocks) if shape_keys else 0
+        self.shape_keys = n_keys * self.verts * SHAPE_KEY_VERTEX_SIZE
+
+        self.custom_normals = 0
+        if not has_normal_attribute and mesh.has_custom_normals:
+            self.custom_normals = self.loops * CUSTOM_NORMAL_SIZE
+
+    @property
+    def total(self) -> int:
+        return self.geometry + self.attributes + self.uv_maps + self.shape_keys + self.custom_normals
+
+
+# Result of the last profile run, drawn by the panel
+_last_profile = []
+
+def profile_meshes(meshes=None) -> list:
+    """
+    Estimate the memory of every mesh, largest first.
+
+    Only element counts and attribute types are read, no data is copied.
+    Meshes shared by several objects are counted once.
+    """
+    global _last_profile
+
+    meshes = bpy.data.meshes if meshes is None else meshes
+    _last_profile = sorted((MeshMemory(mesh) for mesh in meshes), key=lambda m: m.total, reverse=True)
+    return _last_profile
+
+def get_last_profile() -> list:
+    return _last_profile
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GiB"
+
+def export_csv(filepath: str, profile=None):
+    """Write one row per mesh, followed by one row per attribute"""
+    profile = _last_profile if profile is None else profile
+
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["mesh", "users", "verts", "edges", "loops", "polys", *MeshMemory.CATEGORIES, "total"])
+        for m in profile:
+            writer.writerow([m.name, m.users, m.verts, m.edges, m.loops, m.polys, *(getattr(m, c) for c in MeshMemory.CATEGORIES), m.total])
+
+        writer.writerow([])
+        writer.writerow(["mesh", "attribute", "domain", "data_type", "bytes"])
+        for m in profile:
+            for name, domain, data_type, size in m.attribute_sizes:
+                writer.writerow([m.name, name, domain, data_type, size])
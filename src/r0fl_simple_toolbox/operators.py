@@ -1,98 +1,29 @@
+import re
 import sys
+import time
 import bpy
-import math
 import bmesh
 import importlib
+import numpy as np
+from bpy_extras.io_utils import ExportHelper
 
 from .const import INTERNAL_NAME
 from . import utils as u
-
-class SimpleToolbox_OT_ExperimentalOP(bpy.types.Operator):
-    bl_label = "Exp Op 1"
-    bl_idname = "r0tools.experimental_op_1"
-    bl_description = ""
-    bl_options = {'REGISTER'}
-
-    def get_viewport(self, context):
-        # Get the active 3D viewport
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                # Get the region and region 3D view
-                region = None
-                rv3d = None
-                for r in area.regions:
-                    if r.type == 'WINDOW':
-                        region = r
-                        break
-                rv3d = area.spaces[0].region_3d
-                
-                # Exit the loop once we find a valid viewport
-                break
-        
-        
-        # Validate viewport
-        if not (region and rv3d):
-            self.report({'ERROR'}, "Could not find 3D viewport")
-            return (None, None)
-        
-        return region, rv3d
-    
-    def get_loose_vertices(self, obj):
-        obj_verts = [v.index for v in obj.data.vertices]
-        loop_verts = [] # Vertices which are part of a loop
-        loose_verts = []
-
-        # bpy.ops.mesh.select_non_manifold() # Requires Edit Mode
-        
-        for p in obj.data.polygons:
-            poly_idx = p.index
-            poly_verts = [p.vertices[0], p.vertices[1], p.vertices[2]]
-            loop_verts.append(poly_verts)
-
-            print(f"P{poly_idx}: {poly_verts}")
-            
-        for v in obj_verts:
-            found = False
-            for vert_loop in loop_verts:
-                if v in vert_loop:
-                    found = True
-                    break
-
-            if not found:
-                loose_verts.append(v)
-
-        if loose_verts:
-            print(f"{obj.name} has {len(loose_verts)} loose vertices: {loose_verts}")
-
-        return loose_verts
-
-    def execute(self, context):
-        print("=== Experimental Operator 1 ===")
-        region, rv3d = self.get_viewport(context)
-
-        # Get the actual viewport dimensions
-        viewport_width = region.width
-        viewport_height = region.height
-        viewport_diagonal = math.sqrt(viewport_width**2 + viewport_height**2)
-
-        print(f"Viewport WxH: {viewport_width}x{viewport_height}")
-
-        orig_active = context.view_layer.objects.active
-        
-        visible_objects = [o for o in u.iter_scene_objects() if o.visible_get()]
-
-        for o in visible_objects:
-            self.get_loose_vertices(o)
-
-        context.view_layer.objects.active = orig_active
-
-        return {'FINISHED'}
-
+from . import selection
+from . import hierarchy
+from . import property_index
+from . import attributes
+from . import memory
+from . import edge_rings
+from . import edit_mesh
+from . import kernels
+from . import reloader
+from . import profiling
 
 class SimpleToolbox_OT_ReloadNamedScripts(bpy.types.Operator):
     bl_label = "Reload Script(s)"
     bl_idname = "r0tools.reload_named_scripts"
-    bl_description = "Reload only specified scripts from a name text box."
+    bl_description = "Reload only specified scripts from a name text box.\nWithout names, reloads the add-on modules which changed on disk and the modules importing them"
     bl_options = {'REGISTER'}
 
     def get_input_modules(self) -> list[str]:
@@ -135,26 +66,45 @@ class SimpleToolbox_OT_ReloadNamedScripts(bpy.types.Operator):
     def execute(self, context):
         modules = self.get_input_modules()
 
-        if not modules:
-            modules.append(INTERNAL_NAME)
+        # Modules of this add-on are reloaded incrementally, with their dependents.
+        # Short names like "utils" are taken as add-on modules.
+        addon_modules = []
+        other_modules = []
+        for module in modules:
+            if module == INTERNAL_NAME or module.startswith(INTERNAL_NAME + "."):
+                addon_modules.append(module)
+            elif f"{INTERNAL_NAME}.{module}" in sys.modules:
+                addon_modules.append(f"{INTERNAL_NAME}.{module}")
+            else:
+                other_modules.append(module)
 
         failures = []
         successes = []
-        if modules:
-            for module in modules:
-                success = self.reload_module(module)
-                if success:
-                    successes.append(module)
-                else:
-                    failures.append(module)
+        timings = []
+        if addon_modules or not modules:
+            timings, addon_failures = reloader.get_reloader().reload(force=addon_modules)
+            successes.extend(name for name, _ in timings)
+            failures.extend(addon_failures)
+            
+        for module in other_modules:
+            start = time.perf_counter()
+            success = self.reload_module(module)
+            if success:
+                successes.append(module)
+                timings.append((module, time.perf_counter() - start))
+            else:
+                failures.append(module)
         
         print(f"Reloaded: {successes}")
         print(f"Failed: {failures}")
 
-        reload_msg = f"Reloaded {len(successes)}. Unable to reload {len(failures)}"
+        total_time = sum(t for _, t in timings)
+        reload_msg = f"Reloaded {len(successes)} in {total_time * 1000:.0f} ms. Unable to reload {len(failures)}"
         
         try:
             self.report({'INFO'}, reload_msg)
+            if failures:
+                self.report({'WARNING'}, f"Unable to reload: {', '.join(failures)}")
         except Exception as e:
             print(f"Error reporting results: {e}")
         
@@ -163,6 +113,60 @@ class SimpleToolbox_OT_ReloadNamedScripts(bpy.types.Operator):
         return {'FINISHED'}
     
 
+class SimpleToolbox_OT_ToggleProfiling(bpy.types.Operator):
+    bl_label = "Profile Operators"
+    bl_idname = "r0tools.toggle_profiling"
+    bl_description = "Record wall time, bpy.ops calls, mode switches and view layer updates of every toolbox operator run"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if profiling.is_enabled():
+            profiling.disable()
+            self.report({'INFO'}, "Stopped profiling toolbox operators")
+            return {'FINISHED'}
+
+        addon_props = context.scene.r0fl_toolbox_props
+        all_classes = classes + get_registered_feature_classes()
+        profiling.enable(
+            all_classes,
+            history=addon_props.profiling_history_prop,
+            use_cprofile=addon_props.profiling_cprofile_prop,
+            verbose=addon_props.profiling_print_prop
+        )
+        self.report({'INFO'}, "Profiling toolbox operators")
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_ClearProfilingRuns(bpy.types.Operator):
+    bl_label = "Clear"
+    bl_idname = "r0tools.clear_profiling_runs"
+    bl_description = "Clear the recorded operator runs"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        profiling.clear_runs()
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_DumpProfileStats(bpy.types.Operator, ExportHelper):
+    bl_label = "Dump cProfile"
+    bl_idname = "r0tools.dump_profile_stats"
+    bl_description = "Write the cProfile stats of the profiled operator runs, readable with pstats or snakeviz"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".prof"
+    filter_glob: bpy.props.StringProperty(default="*.prof", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return profiling.has_stats()
+
+    def execute(self, context):
+        profiling.dump_stats(self.filepath)
+        self.report({'INFO'}, f"Wrote profile stats to {self.filepath}")
+        return {'FINISHED'}
+
+
 class SimpleToolbox_OT_ClearCustomData(bpy.types.Operator):
     bl_label = "Clear Split Normals"
     bl_idname = "r0tools.clear_custom_split_normals"
@@ -180,31 +184,28 @@ class SimpleToolbox_OT_ClearCustomData(bpy.types.Operator):
         Clears the Custom Split Normals assignments for selected objects and sets AutoSmooth to 180.
         
         Useful to quickly clear baked normals/shading assignments of multiple meshes at once.
+        
+        Works at data level in the current mode, processing each mesh shared by several objects once.
+        Returns the number of meshes processed.
         """
         
+        meshes = {}
         for obj in objects:
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.mesh.customdata_custom_splitnormals_clear()
-            bpy.ops.object.shade_smooth()
-            # bpy.ops.object.shade_smooth() # Not needed. Will give an error if Weighted Normals modifier is present.
+            meshes.setdefault(obj.data, obj)
+        
+        for obj in meshes.values():
+            u.clear_custom_normals(obj)
+            u.set_mesh_smooth(obj)
             # bpy.context.object.data.use_auto_smooth = True
             # bpy.context.object.data.auto_smooth_angle = 3.14159
+        
+        return len(meshes)
 
     def execute(self, context):
-        orig_context = context.mode
-        orig_active = bpy.context.view_layer.objects.active
-
-        if context.mode == "EDIT_MESH":
-            bpy.ops.object.mode_set(mode="OBJECT")
-
         objects = [obj for obj in u.iter_scene_objects(selected=True, type="MESH")]
-        self.op_clear_custom_split_normals_data(objects)
-        bpy.context.view_layer.objects.active = orig_active
+        n_meshes = self.op_clear_custom_split_normals_data(objects)
 
-        if orig_context != "OBJECT" and orig_context == "EDIT_MESH":
-            bpy.ops.object.mode_set(mode='EDIT')
-
-        msg = f"Finished clearing Custom Split Data across {len(objects)} objects"
+        msg = f"Finished clearing Custom Split Data across {len(objects)} objects ({n_meshes} meshes)"
         # u.show_notification(msg)
         self.report({'INFO'}, msg)
         return {'FINISHED'}
@@ -220,15 +221,9 @@ class R0TOOLS_update_property_list(bpy.types.Operator):
 
     def execute(self, context):
         addon_props = context.scene.r0fl_toolbox_props
-        addon_props.custom_property_list.clear()
-
-        unique_props = set()
-        for obj in context.selected_objects:
-            for prop_name in obj.keys():
-                if not prop_name.startswith('_') and prop_name not in unique_props:
-                    unique_props.add(prop_name)
-                    item = addon_props.custom_property_list.add()
-                    item.name = prop_name
+        # Properties set from scripts don't always report a depsgraph update
+        property_index.get_index().update_objects(context.selected_objects)
+        u.rebuild_custom_property_list(addon_props, context.selected_objects)
 
         return {'FINISHED'}
 
@@ -248,36 +243,70 @@ class SimpleToolbox_OT_ClearCustomProperties(bpy.types.Operator):
         return len(context.selected_objects) > 0
 
     def execute(self, context):
-        total_deletions = 0
-        total_objects = 0
+        # Find selected properties to remove
+        props_to_remove = [
+            item.name for item in context.scene.r0fl_toolbox_props.custom_property_list 
+            if item.selected
+        ]
         
-        for obj in context.selected_objects:
-            # Find selected properties to remove
-            props_to_remove = [
-                item.name for item in context.scene.r0fl_toolbox_props.custom_property_list 
-                if item.selected
-            ]
-            
-            # Remove selected properties
-            for prop_name in props_to_remove:
-                if prop_name in obj.keys():
-                    print(f"Deleting property '{prop_name}' of object {obj.name}")
-                    del obj[prop_name]
-                    total_deletions += 1
-                    total_objects += 1
+        # Remove selected properties, only visiting objects holding them
+        index = property_index.get_index()
+        total_deletions, total_objects = index.remove_properties(props_to_remove, context.selected_objects)
         
-        bpy.ops.r0tools.update_property_list()
+        u.rebuild_custom_property_list(context.scene.r0fl_toolbox_props, context.selected_objects)
         # u.show_notification(f"Deleted {total_deletions} propertie(s) across {total_objects} object(s)")
         self.report({'INFO'}, f"Deleted {total_deletions} propertie(s) across {total_objects} object(s)")
         return {'FINISHED'}
 
+
+
+class SimpleToolbox_OT_PurgeCustomProperties(bpy.types.Operator):
+    bl_label = "Purge Custom Properties"
+    bl_idname = "r0tools.purge_custom_properties"
+    bl_description = "Delete custom properties matching the Include patterns and not the Exclude patterns from every data-block in the file (objects, meshes, materials, collections, ...).\n\nDry Run: Only report what would be removed and its estimated size."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: bpy.props.BoolProperty(name="Dry Run", default=True)
+
+    def execute(self, context):
+        addon_props = context.scene.r0fl_toolbox_props
+
+        try:
+            stats = property_index.purge_custom_properties(
+                include=addon_props.purge_include_prop,
+                exclude=addon_props.purge_exclude_prop,
+                use_regex=addon_props.purge_use_regex_prop,
+                dry_run=self.dry_run
+            )
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid pattern: {e}")
+            return {'CANCELLED'}
+
+        total_props = sum(s[0] for s in stats.values())
+        total_ids = sum(s[1] for s in stats.values())
+        total_bytes = sum(s[2] for s in stats.values())
+
+        print(f"[PURGE CUSTOM PROPERTIES] {'Dry Run' if self.dry_run else 'Purged'}")
+        for coll_name, (n_props, n_ids, n_bytes) in sorted(stats.items()):
+            print(f"{' '*2}{coll_name}: {n_props} properties on {n_ids} data-blocks, ~{n_bytes / 1024:.1f} KiB")
+
+        verb = "Would delete" if self.dry_run else "Deleted"
+        self.report({'INFO'}, f"{verb} {total_props} properties across {total_ids} data-blocks (~{total_bytes / 1024:.1f} KiB)")
+
+        if not self.dry_run:
+            u.schedule_property_list_refresh(force=True)
+
+        return {'FINISHED'}
+
         
 class SimpleToolbox_OT_DissolveNthEdge(bpy.types.Operator):
     bl_label = "Remove Nth Edges"
     bl_idname = "r0tools.nth_edges"
-    bl_description = "Remove Nth (every other) edges.\n\nUsage: Select 1 edge on each object and run the operation.\nNote: The selected edge and every other edge starting from it will be preserved.\n\nExpand Edges: Per default, the ring selection of edges expands to cover all connected edges to the ring selection. Turning it off will make it so that it only works on the immediate circular ring selection and will not expand to the continuous connected edges."
+    bl_description = "Remove Nth (every other) edges.\n\nUsage: Select 1 edge on each object and run the operation.\nNote: The selected edge and every other edge starting from it will be preserved.\n\nN: Remove one edge every N edges of the ring.\nOffset: Distance from the selected edge of the first removed edge.\n\nExpand Edges: Per default, the ring selection of edges expands to cover all connected edges to the ring selection. Turning it off will make it so that it only works on the immediate circular ring selection and will not expand to the continuous connected edges."
     bl_options = {'REGISTER', 'UNDO'}
 
+    nth: bpy.props.IntProperty(name="N", default=2, min=2)
+    offset: bpy.props.IntProperty(name="Offset", default=1, min=1)
     expand_edges: bpy.props.BoolProperty(name="Expand Edges", default=True)
     keep_initial_selection: bpy.props.BoolProperty(name="Keep Selected Edges", default=True)
 
@@ -286,183 +315,195 @@ class SimpleToolbox_OT_DissolveNthEdge(bpy.types.Operator):
         # Ensure at least one object is selected
         return any(obj.type == "MESH" and obj.select_get() for obj in context.selected_objects) and context.mode == "EDIT_MESH"
 
-    def process_object(self, obj, context):
-        # Make active
-        context.view_layer.objects.active = obj
-
-        if context.mode != "EDIT_MODE":
-            bpy.ops.object.mode_set(mode="EDIT")
-        
-        # Create a bmesh
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        bm.select_mode = {'EDGE'}
-
-        # Currently selected edges
-        initial_selection = [edge for edge in bm.edges if edge.select]
+    def process_object(self, obj, bm) -> int:
+        # Currently selected edges, from the edit bmesh which is ahead of the mesh data
+        initial_selection = [e for e in bm.edges if e.select]
+        if not initial_selection:
+            return 0
 
-        # Edges to delete from all meshes
-        edges_delete = []
+        # Walk the rings through the loop structure and dissolve the picked edges
+        return edge_rings.dissolve_nth_edges(bm, initial_selection, self.nth, self.offset,
+                                             expand=self.expand_edges, keep_seeds=self.keep_initial_selection)
 
-        for i, edge in enumerate(initial_selection):
-            print(f"{i} {edge.index}")
-            
-            # Deselect all bm edges
-            for e in bm.edges:
-                e.select = False
-
-            # Select the original edge
-            edge.select = True
-
-            # Select the ring and nth
-            bpy.ops.mesh.loop_multi_select(ring=True)
-            bpy.ops.mesh.select_nth()
-
-            selected_edges = [edge.index for edge in bm.edges if edge.select]
-            if edge.index in selected_edges:
-                # Deselect all bm edges
-                for e in bm.edges:
-                    e.select = False
-                
-                # Select the original edge
-                edge.select = True
-                bpy.ops.mesh.loop_multi_select(ring=True)
-                bpy.ops.mesh.select_nth(offset=1)
-            
-            if self.expand_edges:
-                bpy.ops.mesh.loop_multi_select(ring=False)
+    def execute(self, context):
+        total = 0
+        for obj, bm in edit_mesh.iter_edit_meshes(context, destructive=True):
+            total += self.process_object(obj, bm)
 
-            # Store those edges
-            edges_delete.extend([edge for edge in bm.edges if edge.select])
+        self.report({'INFO'}, f"Dissolved {total} edges")
+        return {'FINISHED'}
+    
 
-            # Deselect initial edge we want to keep
-            edge.select = False
+class SimpleToolbox_OT_DissolveNthEdgeModal(bpy.types.Operator):
+    bl_label = "Remove Nth Edges (Interactive)"
+    bl_idname = "r0tools.nth_edges_modal"
+    bl_description = "Interactively preview the Nth edges to remove from the selected edges' rings before dissolving them.\n\nWheel: Change N\nCtrl+Wheel: Change Offset\nE: Toggle Expand Edges\nLMB/Enter: Confirm\nRMB/Esc: Cancel"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        # Make sure to deselect all bm edges too
-        for e in bm.edges:
-            e.select = False
+    nth: bpy.props.IntProperty(name="N", default=2, min=2)
+    offset: bpy.props.IntProperty(name="Offset", default=1, min=1)
+    expand_edges: bpy.props.BoolProperty(name="Expand Edges", default=True)
+    keep_initial_selection: bpy.props.BoolProperty(name="Keep Selected Edges", default=True)
 
-        for edge in edges_delete:
-            edge.select = True
-        
-        bpy.ops.mesh.dissolve_mode(use_verts=True)
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "EDIT_MESH" and context.area is not None and context.area.type == 'VIEW_3D'
+
+    def update_header(self, context):
+        context.area.header_text_set(
+            f"N: {self.nth}  Offset: {self.offset}  Expand: {'On' if self.expand_edges else 'Off'}  |  "
+            "Wheel: N, Ctrl+Wheel: Offset, E: Expand, LMB/Enter: Confirm, RMB/Esc: Cancel"
+        )
+
+    def update_preview(self, context):
+        """Select the edges that would be removed, only touching the ones that changed"""
+        for entry in self._entries:
+            obj, bm, cache, preview = entry["obj"], entry["bm"], entry["cache"], entry["preview"]
+            picked = cache.get_nth_indices(self.nth, self.offset, expand=self.expand_edges)
+
+            removed = np.setdiff1d(preview, picked, assume_unique=True)
+            added = np.setdiff1d(picked, preview, assume_unique=True)
+
+            picked_mask = entry["mask"]
+            picked_mask[removed] = False
+            picked_mask[added] = True
+
+            # Deselecting an edge deselects its vertices, re-select the picked edges sharing them
+            edges = bm.edges
+            for idx in removed.tolist():
+                edges[idx].select_set(False)
+            for idx in removed.tolist():
+                for v in edges[idx].verts:
+                    for e in v.link_edges:
+                        if picked_mask[e.index]:
+                            e.select_set(True)
+            for idx in added.tolist():
+                edges[idx].select_set(True)
+
+            entry["preview"] = picked
+            bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+
+        self.update_header(context)
+
+    def restore_seeds(self, entry):
+        if self.keep_initial_selection:
+            for edge in entry["cache"].seeds:
+                if edge.is_valid:
+                    edge.select_set(True)
+
+    def confirm(self, context):
+        total = 0
+        for entry in self._entries:
+            obj, bm, picked = entry["obj"], entry["bm"], entry["preview"]
+            if len(picked):
+                edges = bm.edges
+                bmesh.ops.dissolve_edges(bm, edges=[edges[idx] for idx in picked.tolist()], use_verts=True, use_face_split=False)
+            self.restore_seeds(entry)
+            bmesh.update_edit_mesh(obj.data)
+            total += len(picked)
+
+        context.area.header_text_set(None)
+        self.report({'INFO'}, f"Dissolved {total} edges")
+        return {'FINISHED'}
 
-        # Update the mesh
-        bmesh.update_edit_mesh(me)
-        bm.free()
+    def cancel_preview(self, context):
+        for entry in self._entries:
+            edges = entry["bm"].edges
+            for idx in entry["preview"].tolist():
+                edges[idx].select_set(False)
+            for edge in entry["cache"].seeds:
+                edge.select_set(True)
+            bmesh.update_edit_mesh(entry["obj"].data, loop_triangles=False, destructive=False)
 
-        # Select initial selection of edges
-        if self.keep_initial_selection:
-            for edge in initial_selection:
-                edge.select = True
+        context.area.header_text_set(None)
+        return {'CANCELLED'}
 
     def execute(self, context):
-        original_active_obj = context.active_object
-        original_mode = context.mode
-
-        if original_mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode="OBJECT")
-
-        # Collect selected mesh objects
-        selected_objects = [obj for obj in context.selected_objects if obj.type == "MESH"]
-        # deselect_all()
-        for obj in selected_objects:
-            # obj.select_set(True)
-            self.process_object(obj, context)
-            # obj.select_set(False)
-
-        # Return to the original active object and mode
-        if original_mode != 'EDIT_MESH':
-            bpy.ops.object.mode_set(mode=original_mode)
-        
-        # Restore selection
-        for obj in selected_objects:
-            obj.select_set(True)
-        context.view_layer.objects.active = original_active_obj
-
+        # Redo panel and scripted calls, same as the non-interactive operator
+        total = 0
+        for obj, bm in edit_mesh.iter_edit_meshes(context, destructive=True):
+            seeds = [e for e in bm.edges if e.select]
+            if seeds:
+                total += edge_rings.dissolve_nth_edges(bm, seeds, self.nth, self.offset,
+                                                       expand=self.expand_edges, keep_seeds=self.keep_initial_selection)
+
+        self.report({'INFO'}, f"Dissolved {total} edges")
         return {'FINISHED'}
-    
 
-class SimpleToolbox_OT_ApplyZenUVTD(bpy.types.Operator):
-    bl_label = "Set TD"
-    bl_idname = "r0tools.zenuv_set_td"
-    bl_description = "Apply Texel Density from ZenUV to objects"
-    bl_options = {'REGISTER','UNDO'}
+    def invoke(self, context, event):
+        # Walk every ring and edge loop once, mouse wheel steps only reuse them
+        self._entries = []
+        for obj, bm in edit_mesh.iter_edit_meshes(context):
+            bm.edges.ensure_lookup_table()
+            bm.edges.index_update()
+            seeds = [e for e in bm.edges if e.select]
+            if not seeds:
+                continue
+
+            cache = edge_rings.RingCache(seeds)
+            cache.build_index_arrays()
+
+            # Only the previewed edges are shown selected
+            for edge in seeds:
+                edge.select_set(False)
+
+            self._entries.append({
+                "obj": obj, "bm": bm, "cache": cache,
+                "preview": np.empty(0, dtype=np.int64),
+                "mask": np.zeros(len(bm.edges), dtype=bool),
+            })
+
+        if not self._entries:
+            self.report({'WARNING'}, "Select at least one edge")
+            return {'CANCELLED'}
 
-    accepted_contexts = ["OBJECT", "EDIT_MESH"]
+        self.update_preview(context)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
-    @classmethod
-    def poll(cls, context):
-        return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
-    
-    def execute(self, context):
-        context_mode = context.mode
-        
-        if context_mode not in ["OBJECT", "EDIT_MESH"]:
-            self.report({'WARNING'}, "Only performed in Object or Edit modes")
-            return {'CANCELLED'}
-        
-        selected_objs = list(u.iter_scene_objects(selected=True))
-        active_obj = bpy.context.view_layer.objects.active
-        
-        if context_mode == "OBJECT":
-            u.deselect_all()
-        
-        TD = u.get_td_value()
-        TD_UNIT = u.get_td_unit()
-        
-        print(f"Setting TD {TD} for {len(selected_objs)} selected objects with {TD} px/{TD_UNIT}")
-        
-        bpy.data.scenes["Scene"].zen_uv.td_props.prp_current_td = TD
-        bpy.data.scenes["Scene"].zen_uv.td_props.td_unit = TD_UNIT
-        bpy.context.scene.zen_uv.td_props.td_set_mode = 'ISLAND'
-        
-        if context_mode == "OBJECT":
-        
-            for o in selected_objs:
-                try:
-                    print(f"Setting {TD} px/{TD_UNIT} for {o.name}")
-                    
-                    o.select_set(True)
-                    
-                    bpy.context.view_layer.objects.active = o
-                    
-                    bpy.context.view_layer.update()
-                    
-                    # Add a small delay to ensure the selection is registered
-                    bpy.app.timers.register(lambda: None, first_interval=0.2)
-                    
-                    bpy.ops.uv.zenuv_set_texel_density(global_mode=True)
-                    
-                except Exception as e:
-                    print(f"Error: {e}")
-                    self.report({'ERROR'}, f"Error: {e}")
-                    o.select_set(False)
-                    
-            for obj in selected_objs:
-                obj.select_set(True)
-                
-            if active_obj:
-                bpy.context.view_layer.objects.active = active_obj
-        elif context_mode == "EDIT_MESH":
-            # Add a small delay to ensure the selection is registered
-            bpy.app.timers.register(lambda: None, first_interval=0.2)
-            
-            bpy.ops.uv.zenuv_set_texel_density(global_mode=True)
-        
-        # u.show_notification(f"Texel density set to {TD} px/{TD_UNIT} for {len(selected_objs)} objects.")
-        self.report({'INFO'}, f"Texel density set to {TD} px/{TD_UNIT} for {len(selected_objs)} objects.")
-        
-        return {'FINISHED'}
+    def modal(self, context, event):
+        if event.type in {'MIDDLEMOUSE', 'MOUSEMOVE'}:
+            return {'PASS_THROUGH'}
+
+        if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            step = 1 if event.type == 'WHEELUPMOUSE' else -1
+            if event.ctrl:
+                self.offset = max(1, self.offset + step)
+            else:
+                self.nth = max(2, self.nth + step)
+            self.update_preview(context)
+        elif event.type == 'E' and event.value == 'PRESS':
+            self.expand_edges = not self.expand_edges
+            self.update_preview(context)
+        elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+            return self.confirm(context)
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            return self.cancel_preview(context)
+
+        return {'RUNNING_MODAL'}
 
 
 class SimpleToolbox_OT_ClearMeshAttributes(bpy.types.Operator):
     bl_label = "Clear Attributes"
     bl_idname = "r0tools.clear_mesh_attributes"
-    bl_description = "Clears unneeded mesh(es) attributes created by various addons.\nPreserves some integral and needed attributes such as material_index that is required for multi-material assignments.\nSometimes certain addons or operations will populate this list with attributes you wish to remove at a later date, be it for parsing or exporting."
+    bl_description = "Clears unneeded mesh(es) attributes created by various addons, across every mesh in the file.\nAttributes are removed by the Remove/Keep name patterns, domains and data types rules. Internal and required attributes are always preserved.\nSometimes certain addons or operations will populate this list with attributes you wish to remove at a later date, be it for parsing or exporting.\n\nDry Run: Only list the attributes that would be removed and the memory they use."
     bl_options = {'REGISTER', 'UNDO'}
     
-    def op_clear_mesh_attributes(self):
+    REPORT_TEXT = "r0_Attribute_Report"
+
+    dry_run: bpy.props.BoolProperty(name="Dry Run", default=True)
+    
+    def get_rules(self, addon_props):
+        return attributes.AttributeRules(
+            remove=addon_props.attr_remove_prop,
+            keep=addon_props.attr_keep_prop,
+            domains=addon_props.attr_domains_prop,
+            data_types=addon_props.attr_data_types_prop,
+            keep_uv_maps=addon_props.attr_keep_uv_maps_prop,
+            use_regex=addon_props.attr_use_regex_prop
+        )
+
+    def op_clear_mesh_attributes(self, rules):
         """
         Clears unneeded mesh(es) attributes created by various addons. Preserves some integral and needed attributes such as material_index that is required for multi-material assignments.
         
@@ -471,42 +512,65 @@ class SimpleToolbox_OT_ClearMeshAttributes(bpy.types.Operator):
         
         print(f"[CLEAR MESH ATTRIBUTES]")
         
-        initial_obj = bpy.context.active_object
+        plan = attributes.scan_attributes(rules)
+        if not self.dry_run:
+            attributes.remove_attributes(plan)
+        
+        report = attributes.format_attribute_report(plan, dry_run=self.dry_run)
+        print(report)
+        text = bpy.data.texts.get(self.REPORT_TEXT) or bpy.data.texts.new(self.REPORT_TEXT)
+        text.from_string(report)
         
-        exclude_filter = ("colorSet", "map", "material_index") # Starts with these tags
-        attrs_check = (bpy.types.IntAttribute,
-                       bpy.types.FloatAttribute,
-                       bpy.types.FloatColorAttribute,
-                       bpy.types.StringAttribute,
-                       bpy.types.ByteColorAttribute,
-                       bpy.types.FloatVectorAttribute,
-                       bpy.types.FloatVectorAttributeValue
-                       )
+        return plan
+
+    def execute(self, context):
+        try:
+            rules = self.get_rules(context.scene.r0fl_toolbox_props)
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid pattern: {e}")
+            return {'CANCELLED'}
+        
+        if not rules.domains or not rules.data_types:
+            self.report({'WARNING'}, "Select at least one domain and one data type")
+            return {'CANCELLED'}
         
-        for obj in bpy.context.selected_objects:
-            if obj.type == "MESH":
-                bpy.context.view_layer.objects.active = obj
-                mesh = bpy.context.object.data
-                print(f"Object: {mesh.name}")
-                try:
-                    for at in reversed(mesh.attributes.items()):
-                        # Check if not T4 Attribute
-                        if not isinstance(at[1], attrs_check):
-                            continue
-                        
-                        at_name = at[0]
-                        if str(at_name).startswith(exclude_filter):
-                            print(f"{' '*2}Keeping Attribute: {at_name}")
-                        else:                    
-                            print(f"{' '*2}Removing Attribute: {at[0]}")
-                            mesh.color_attributes.remove(at[1])
-                except Exception as e:
-                    print(e)
+        plan = self.op_clear_mesh_attributes(rules)
         
-        bpy.context.view_layer.objects.active = initial_obj
+        total_mib = sum(entry[4] for entry in plan) / 1024**2
+        verb = "Would remove" if self.dry_run else "Removed"
+        self.report({'INFO'}, f"{verb} {len(plan)} attributes (~{total_mib:.2f} MiB). See '{self.REPORT_TEXT}' text")
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_ProfileMeshMemory(bpy.types.Operator):
+    bl_label = "Profile Memory"
+    bl_idname = "r0tools.profile_mesh_memory"
+    bl_description = "Estimate the memory used by every mesh in the file: geometry, attributes, UV maps, shape keys and custom normals.\nMeshes shared by several objects are counted once."
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
-        self.op_clear_mesh_attributes()
+        profile = memory.profile_meshes()
+        total = sum(m.total for m in profile)
+        self.report({'INFO'}, f"{len(profile)} meshes use ~{memory.format_bytes(total)}")
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_ExportMeshMemoryCSV(bpy.types.Operator, ExportHelper):
+    bl_label = "Export CSV"
+    bl_idname = "r0tools.export_mesh_memory_csv"
+    bl_description = "Export the last mesh memory profile to a CSV file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".csv"
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return len(memory.get_last_profile()) > 0
+
+    def execute(self, context):
+        memory.export_csv(self.filepath)
+        self.report({'INFO'}, f"Exported mesh memory profile to {self.filepath}")
         return {'FINISHED'}
 
 
@@ -524,66 +588,27 @@ class SimpleToolbox_OT_ClearChildrenRecurse(bpy.types.Operator):
     
     def op_clear_all_objects_children(self, recurse=False):
         parent_objs = 0
-        total_children_cleared = 0
-        
-        problem_objects = []
         
-        active_obj = bpy.context.view_layer.objects.active
-        
-        # Match selected objects' data names to mesh names
+        # Collect first, clearing parents changes the hierarchy.
+        # Dict keeps order and drops children reached from several selected parents.
+        children = {}
         for o in u.iter_scene_objects(selected=True):
             print(f"Iter {o.name}")
-            
-            for child in u.iter_children(o, recursive=recurse):
-                # print(f"Child: {child.name}")
-                try:
-                    self.process_child_object(child)
-                    total_children_cleared += 1
-                except Exception as e:
-                    print(f"ERROR: {e}")
-                    problem_objects.append(child)
-            
+            children.update(dict.fromkeys(u.iter_children(o, recursive=recurse)))
             parent_objs += 1
-                
-        bpy.context.view_layer.objects.active = active_obj
+        
+        problem_objects = hierarchy.unparent_keep_transform(list(children))
+        total_children_cleared = len(children) - len(problem_objects)
         
         cleared_msg = f"Cleared {total_children_cleared} child objects for {parent_objs} main objects."
         # u.show_notification(cleared_msg)
         self.report({'INFO'}, cleared_msg)
         
         if problem_objects:
-            u.deselect_all()
-            for obj in problem_objects:
-                if obj.name in bpy.data.objects:
-                    obj.select_set(True)
-                    child.hide_set(False)
-                    child.hide_viewport = False
             issues_msg = f"The following objects have raised issues: {', '.join([obj.name for obj in problem_objects])}"
             u.show_notification(issues_msg)
             self.report({'WARNING'}, issues_msg)
         
-    def process_child_object(self, child):
-        """Handle visibility and selection state for a child object"""
-        
-        was_hidden = child.hide_get()
-        was_hidden_viewport = child.hide_viewport
-        
-        if was_hidden:
-            child.hide_set(False)
-            
-        if was_hidden_viewport:
-            child.hide_viewport = False
-        
-        child.select_set(True)
-        bpy.context.view_layer.objects.active = child
-        bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-        
-        if was_hidden:
-            child.hide_set(True)
-
-        if was_hidden_viewport:
-            child.hide_viewport = True
-
     def invoke(self, context, event):
         if event.shift:
             self.recurse = True
@@ -597,6 +622,118 @@ class SimpleToolbox_OT_ClearChildrenRecurse(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class SimpleToolbox_OT_FindLooseGeometry(bpy.types.Operator):
+    bl_label = "Loose Geometry"
+    bl_idname = "r0tools.find_loose_geometry"
+    bl_description = "Find loose vertices, loose edges and wire edges of selected meshes and report, select or delete them.\n\nLoose Vertices: Vertices not used by any edge or face.\nLoose Edges: Edges without faces which are not attached to any face.\nWire Edges: Any edge without faces, including those hanging off faces."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('REPORT', "Report", "Only report the loose geometry found"),
+            ('SELECT', "Select", "Select the loose geometry"),
+            ('DELETE', "Delete", "Delete the loose geometry"),
+        ],
+        default='SELECT'
+    )
+    include_wire_edges: bpy.props.BoolProperty(name="Include Wire Edges", description="Also act on edges without faces which are attached to faces", default=False)
+
+    accepted_contexts = ["OBJECT", "EDIT_MESH"]
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
+
+    def get_target_masks(self, n_verts, edge_verts, loose_verts, loose_edges, wire_edges):
+        """Boolean masks of the vertices and edges to select"""
+        edges = wire_edges if self.include_wire_edges else loose_edges
+        edge_mask = np.zeros(len(edge_verts), dtype=bool)
+        edge_mask[edges] = True
+
+        # Selected edges need their vertices selected too
+        vert_mask = np.zeros(n_verts, dtype=bool)
+        vert_mask[loose_verts] = True
+        vert_mask[edge_verts[edge_mask].ravel()] = True
+
+        return vert_mask, edge_mask
+
+    def select_loose(self, obj, vert_mask, edge_mask, n_faces: int):
+        state = selection.SelectionState(
+            vert_mask,
+            edge_mask,
+            np.zeros(n_faces, dtype=bool),
+            tuple(bpy.context.scene.tool_settings.mesh_select_mode)
+        )
+        # Edit-meshes are updated by the edit_mesh layer
+        selection.restore(obj, state, restore_select_mode=False, update=False)
+
+    def delete_loose(self, bm, loose_verts, edges):
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        del_edges = [bm.edges[idx] for idx in edges]
+        # Gather before deleting, indices are invalidated by it
+        end_verts = {v for e in del_edges for v in e.verts}
+        end_verts.update(bm.verts[idx] for idx in loose_verts)
+
+        bmesh.ops.delete(bm, geom=del_edges, context='EDGES')
+        # Only vertices left without any edge, wire edge ends on faces stay with their faces
+        bmesh.ops.delete(bm, geom=[v for v in end_verts if v.is_valid and not v.link_edges], context='VERTS')
+
+    def process_mesh(self, obj, bm=None):
+        """Find and act on the loose geometry of an object's mesh, in place on its edit-mesh if given"""
+        mesh = obj.data
+        if bm is None:
+            n_verts = len(mesh.vertices)
+            edge_verts = u.get_edge_vertices(mesh)
+            loop_verts, loop_edges = u.get_loop_indices(mesh)
+        else:
+            # Read from the edit-mesh, element order matches the mesh data
+            edit_mesh.ensure_indices(bm)
+            n_verts = len(bm.verts)
+            edge_verts = edit_mesh.read_edge_vertices(bm)
+            loop_verts, loop_edges = edit_mesh.read_loop_indices(edit_mesh.get_loops(bm))
+
+        loose_verts, loose_edges, wire_edges = kernels.loose_geometry(n_verts, edge_verts, loop_verts, loop_edges)
+        counts = (len(loose_verts), len(loose_edges), len(wire_edges))
+        if not (len(loose_verts) or len(wire_edges)):
+            return counts
+
+        print(f"{obj.name}: {counts[0]} loose vertices, {counts[1]} loose edges, {counts[2]} wire edges")
+
+        if self.action == 'REPORT':
+            return counts
+
+        if self.action == 'SELECT':
+            vert_mask, edge_mask = self.get_target_masks(n_verts, edge_verts, loose_verts, loose_edges, wire_edges)
+            self.select_loose(obj, vert_mask, edge_mask, len(mesh.polygons) if bm is None else len(bm.faces))
+        elif self.action == 'DELETE':
+            edges = wire_edges if self.include_wire_edges else loose_edges
+            if bm is not None:
+                self.delete_loose(bm, loose_verts, edges)
+            else:
+                bm = bmesh.new()
+                bm.from_mesh(mesh)
+                self.delete_loose(bm, loose_verts, edges)
+                bm.to_mesh(mesh)
+                bm.free()
+                mesh.update()
+
+        return counts
+
+    def execute(self, context):
+        results = []
+        for obj, bm in edit_mesh.iter_edit_meshes(context, destructive=self.action == 'DELETE'):
+            results.append(self.process_mesh(obj, bm))
+        for obj, mesh in edit_mesh.iter_object_meshes(context):
+            results.append(self.process_mesh(obj))
+
+        total_verts, total_edges, total_wire = (sum(c) for c in zip(*results)) if results else (0, 0, 0)
+        msg = f"Found {total_verts} loose vertices, {total_edges} loose edges and {total_wire} wire edges across {len(results)} meshes"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+
 class SimpleToolbox_OT_ClearAxisSharpEdgesX(bpy.types.Operator):
     bl_label = "Clear Sharp X"
     bl_idname = "r0tools.clear_sharp_axis_x"
@@ -610,7 +747,8 @@ class SimpleToolbox_OT_ClearAxisSharpEdgesX(bpy.types.Operator):
         return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
 
     def execute(self, context):
-        u.op_clear_sharp_along_axis('X')
+        cleared = u.op_clear_sharp_along_axis('X')
+        self.report({'INFO'}, f"Cleared {cleared} sharp edges on the X axis")
         return {'FINISHED'}
 
 
@@ -627,7 +765,8 @@ class SimpleToolbox_OT_ClearAxisSharpEdgesY(bpy.types.Operator):
         return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
 
     def execute(self, context):
-        u.op_clear_sharp_along_axis('Y')
+        cleared = u.op_clear_sharp_along_axis('Y')
+        self.report({'INFO'}, f"Cleared {cleared} sharp edges on the Y axis")
         return {'FINISHED'}
 
 
@@ -644,7 +783,8 @@ class SimpleToolbox_OT_ClearAxisSharpEdgesZ(bpy.types.Operator):
         return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
 
     def execute(self, context):
-        u.op_clear_sharp_along_axis('Z')
+        cleared = u.op_clear_sharp_along_axis('Z')
+        self.report({'INFO'}, f"Cleared {cleared} sharp edges on the Z axis")
         return {'FINISHED'}
 
 
@@ -656,23 +796,106 @@ classes = [
     R0TOOLS_update_property_list, # Useful to register them early
     
     SimpleToolbox_OT_ReloadNamedScripts,
+    SimpleToolbox_OT_ToggleProfiling,
+    SimpleToolbox_OT_ClearProfilingRuns,
+    SimpleToolbox_OT_DumpProfileStats,
     SimpleToolbox_OT_ClearCustomData,
     SimpleToolbox_OT_ClearCustomProperties,
+    SimpleToolbox_OT_PurgeCustomProperties,
     SimpleToolbox_OT_ClearMeshAttributes,
+    SimpleToolbox_OT_ProfileMeshMemory,
+    SimpleToolbox_OT_ExportMeshMemoryCSV,
     SimpleToolbox_OT_ClearChildrenRecurse,
     SimpleToolbox_OT_ClearAxisSharpEdgesX,
     SimpleToolbox_OT_ClearAxisSharpEdgesY,
     SimpleToolbox_OT_ClearAxisSharpEdgesZ,
     SimpleToolbox_OT_DissolveNthEdge,
-    SimpleToolbox_OT_ApplyZenUVTD,
-    SimpleToolbox_OT_ExperimentalOP,
+    SimpleToolbox_OT_DissolveNthEdgeModal,
+    SimpleToolbox_OT_FindLooseGeometry,
 ]
 
+# Optional operator modules, imported and registered only while their feature is enabled or in use
+feature_modules = {
+    # Texel density tools, when the External section is first opened
+    "TEXEL_DENSITY": "texel_density_operators",
+    # LODs, while Experimental Features are enabled
+    "LODS": "lod_operators",
+}
+
+_registered_features = {}  # name -> classes
+
+def get_feature_classes(name: str) -> list:
+    """Operator classes of a feature, importing its module on first use"""
+    module = importlib.import_module(f".{feature_modules[name]}", __package__)
+    return module.classes
+
+def get_registered_feature_classes() -> list:
+    return [cls for feature in _registered_features.values() for cls in feature]
+
+def register_feature(name: str):
+    if name in _registered_features:
+        return
+    feature = get_feature_classes(name)
+    for cls in feature:
+        bpy.utils.register_class(cls)
+    _registered_features[name] = feature
+
+def unregister_feature(name: str):
+    feature = _registered_features.pop(name, None)
+    if feature is None:
+        return
+    for cls in reversed(feature):
+        bpy.utils.unregister_class(cls)
+
+def sync_features():
+    """Register or unregister optional operators to match the preferences and panel state"""
+    # Scripts run in the background call the operators without any panel
+    if bpy.app.background:
+        for name in feature_modules:
+            register_feature(name)
+        return
+
+    addon_prefs = bpy.context.preferences.addons[INTERNAL_NAME].preferences
+    if addon_prefs.experimental_features:
+        register_feature("LODS")
+    else:
+        unregister_feature("LODS")
+
+    # Stays registered once used, until the add-on is unregistered
+    scenes = getattr(bpy.data, "scenes", ())
+    if any(scene.r0fl_toolbox_props.show_ext_ops for scene in scenes):
+        register_feature("TEXEL_DENSITY")
+
+@bpy.app.handlers.persistent
+def sync_features_on_load(*args):
+    sync_features()
+
+def _deferred_sync_features():
+    # Scenes can't be read while registering
+    sync_features()
+    return None
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    if sync_features_on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(sync_features_on_load)
+
+    if bpy.app.background:
+        # No timers run before a --python script, register everything now
+        sync_features()
+    else:
+        bpy.app.timers.register(_deferred_sync_features, first_interval=0)
+
 def unregister():
+    if bpy.app.timers.is_registered(_deferred_sync_features):
+        bpy.app.timers.unregister(_deferred_sync_features)
+    if sync_features_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(sync_features_on_load)
+
+    for name in list(_registered_features):
+        unregister_feature(name)
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
-    
\ No newline at end of file
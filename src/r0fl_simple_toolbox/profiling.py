@@ -0,0 +1,198 @@
+import bpy
+import time
+import cProfile
+from collections import Counter, deque
+
+class OperatorRun:
+    """
+    Wall time and hidden operator calls of one toolbox operator execution.
+    Modal runs span invoke to the last modal call, wall time only counts the calls.
+    """
+    __slots__ = ("operator", "timestamp", "wall", "calls", "ops_calls", "mode_sets", "view_layer_updates", "ops")
+
+    def __init__(self, operator: str):
+        self.operator = operator
+        self.timestamp = time.time()
+        self.wall = 0.0
+        self.calls = 0
+        self.ops_calls = 0
+        self.mode_sets = 0
+        self.view_layer_updates = 0
+        self.ops = Counter()
+
+    def format(self) -> str:
+        calls = f" over {self.calls} calls" if self.calls > 1 else ""
+        return (f"{self.operator}: {self.wall * 1000:.1f} ms{calls}, {self.ops_calls} ops, "
+                f"{self.mode_sets} mode switches, {self.view_layer_updates} view layer updates")
+
+
+# Last runs, newest last
+_runs = deque(maxlen=50)
+
+# Runs being measured, outermost first. Nested toolbox operators count into every run of the stack
+_active = []
+
+# Runs of operators inside invoke or still modal, by operator pointer.
+# Their execute calls count into these runs instead of starting new ones.
+_instance_runs = {}
+
+# Operator methods measured, modal runs end when modal stops returning these
+WRAPPED_METHODS = ("execute", "invoke", "modal")
+MODAL_RUNNING = {'RUNNING_MODAL', 'PASS_THROUGH'}
+
+_original_methods = {}  # (class, method name) -> function
+_original_op_call = None
+_profiler = None
+_verbose = False
+
+def is_enabled() -> bool:
+    return bool(_original_methods)
+
+def get_runs() -> list:
+    return list(_runs)
+
+def clear_runs():
+    _runs.clear()
+
+def _count(field: str, idname: str = ""):
+    for run in _active:
+        setattr(run, field, getattr(run, field) + 1)
+        if idname:
+            run.ops[idname] += 1
+
+def update_view_layer(view_layer=None):
+    """view_layer.update(), counted while profiling. RNA methods can't be wrapped from Python"""
+    if _active:
+        _count("view_layer_updates")
+    (view_layer or bpy.context.view_layer).update()
+
+def _install_ops_hook():
+    global _original_op_call
+
+    # bpy.ops.<module>.<operator> wrappers all share one class
+    op_type = type(bpy.ops.object.mode_set)
+    _original_op_call = op_type.__call__
+
+    def __call__(self, *args, **kwargs):
+        if _active:
+            idname = self.idname_py()
+            _count("ops_calls", idname)
+            if idname == "object.mode_set":
+                _count("mode_sets")
+        return _original_op_call(self, *args, **kwargs)
+
+    op_type.__call__ = __call__
+
+def _remove_ops_hook():
+    global _original_op_call
+    if _original_op_call is not None:
+        type(bpy.ops.object.mode_set).__call__ = _original_op_call
+        _original_op_call = None
+
+def _measure(run: OperatorRun, func, *args):
+    """Call func with the run active, adding the call to its wall time"""
+    _active.append(run)
+    outermost = len(_active) == 1
+    if outermost and _profiler is not None:
+        _profiler.enable()
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        run.wall += time.perf_counter() - start
+        run.calls += 1
+        if outermost and _profiler is not None:
+            _profiler.disable()
+        _active.pop()
+
+def _finish(run: OperatorRun):
+    _runs.append(run)
+    if _verbose:
+        print(f"[PROFILING] {run.format()}")
+
+def _wrap_method(cls, name: str):
+    func = cls.__dict__[name]
+
+    def execute_profiled(self, context):
+        if self.as_pointer() in _instance_runs:
+            return func(self, context)
+        run = OperatorRun(cls.bl_idname)
+        try:
+            return _measure(run, func, self, context)
+        finally:
+            _finish(run)
+
+    def invoke_profiled(self, context, event):
+        key = self.as_pointer()
+        run = OperatorRun(cls.bl_idname)
+        _instance_runs[key] = run
+        result = {'CANCELLED'}
+        try:
+            result = _measure(run, func, self, context, event)
+            return result
+        finally:
+            if not MODAL_RUNNING & result:
+                _finish(_instance_runs.pop(key))
+
+    def modal_profiled(self, context, event):
+        key = self.as_pointer()
+        run = _instance_runs.setdefault(key, OperatorRun(cls.bl_idname))
+        result = {'CANCELLED'}
+        try:
+            result = _measure(run, func, self, context, event)
+            return result
+        finally:
+            if not MODAL_RUNNING & result:
+                _finish(_instance_runs.pop(key))
+
+    wrapper = {"execute": execute_profiled, "invoke": invoke_profiled, "modal": modal_profiled}[name]
+    _original_methods[(cls, name)] = func
+    setattr(cls, name, wrapper)
+
+def enable(classes, history: int = 50, use_cprofile=False, verbose=False):
+    """
+    Start recording every execute, invoke and modal run of the given operator classes.
+    Args:
+        history: Number of runs kept
+        use_cprofile: Also collect cProfile stats of the runs, for dump_stats
+        verbose: Print every run to the console
+    """
+    global _runs, _profiler, _verbose
+
+    disable()
+    _runs = deque(_runs, maxlen=history)
+    _profiler = cProfile.Profile() if use_cprofile else None
+    _verbose = verbose
+
+    for cls in classes:
+        for name in WRAPPED_METHODS:
+            # Inherited methods, like ExportHelper.invoke, are left alone
+            if name in cls.__dict__:
+                _wrap_method(cls, name)
+    _install_ops_hook()
+
+def disable():
+    for (cls, name), func in _original_methods.items():
+        setattr(cls, name, func)
+    _original_methods.clear()
+    _instance_runs.clear()
+    _remove_ops_hook()
+
+def has_stats() -> bool:
+    return _profiler is not None and _profiler.getstats() != []
+
+def dump_stats(filepath: str):
+    """Write the cProfile stats of the runs recorded so far, readable with pstats or snakeviz"""
+    _profiler.dump_stats(filepath)
+
+
+# -------------------------------------------------------------------
+#   Register & Unregister
+# -------------------------------------------------------------------
+
+def register():
+    pass
+
+def unregister():
+    # Never leave wrapped classes or the ops hook behind a reload
+    disable()
@@ -10,6 +10,19 @@ from bpy.props import (StringProperty,
                        )
 
 from .const import INTERNAL_NAME
+from . import utils as u
+
+def sync_features():
+    # Operators import this module, so they are only imported once needed
+    from . import operators
+    operators.sync_features()
+
+def update_td_outliers(addon_props, context):
+    """Re-filter the outliers of the last texel density audit for the new tolerance"""
+    from . import texel_density
+    audit = texel_density.get_last_audit()
+    if len(audit):
+        audit.update_outliers(audit.target, addon_props.td_tolerance_prop / 100)
 
 # ============ ADDON PROPS =============
 # Properties which are not stored in preferences
@@ -18,11 +31,13 @@ class RPROP_UL_custom_property_list(bpy.types.UIList):
         row = layout.row(align=True)
         row.prop(item, "selected", text="")
         row.label(text=item.name)
+        row.label(text=str(item.count))
 
 
 class CustomPropertyItem(bpy.types.PropertyGroup):
     name: StringProperty()
     selected: BoolProperty(default=False)
+    count: IntProperty(default=0, description="Number of selected objects holding this property")
 
 
 class r0flToolboxProps(bpy.types.PropertyGroup):
@@ -32,10 +47,31 @@ class r0flToolboxProps(bpy.types.PropertyGroup):
         default=False
     )
 
+    profiling_history_prop: IntProperty(
+        name="History",
+        description="Number of operator runs kept while profiling",
+        default=50,
+        min=1,
+        max=1000
+    )
+
+    profiling_cprofile_prop: BoolProperty(
+        name="cProfile",
+        description="Also collect cProfile stats of the profiled runs. Adds overhead",
+        default=False
+    )
+
+    profiling_print_prop: BoolProperty(
+        name="Print",
+        description="Print every profiled run to the console",
+        default=False
+    )
+
     show_object_ops: BoolProperty(
         name="Object Ops",
         description="Show or hide the Object operators section",
-        default=True
+        default=True,
+        update=lambda self, context: u.schedule_property_list_refresh(force=True)
     )
     
     show_mesh_ops: BoolProperty(
@@ -44,10 +80,43 @@ class r0flToolboxProps(bpy.types.PropertyGroup):
         default=True
     )
 
+    show_memory_prop: BoolProperty(
+        name="Memory",
+        description="Show or hide the mesh memory profiler section",
+        default=False
+    )
+
+    memory_top_n_prop: IntProperty(
+        name="Top",
+        description="Number of largest meshes to list",
+        default=10,
+        min=1,
+        max=100
+    )
+
+    td_tolerance_prop: FloatProperty(
+        name="Tolerance",
+        description="Islands further than this from the target Texel Density are listed as outliers",
+        default=10.0,
+        min=0.0,
+        max=100.0,
+        subtype='PERCENTAGE',
+        update=lambda self, context: update_td_outliers(self, context)
+    )
+
+    td_outliers_top_n_prop: IntProperty(
+        name="Top",
+        description="Number of outlier objects to list",
+        default=10,
+        min=1,
+        max=100
+    )
+
     show_ext_ops: BoolProperty(
         name="External Ops",
         description="Show or hide the External operators section",
-        default=False
+        default=False,
+        update=lambda self, context: sync_features()
     )
 
     reload_modules_prop: StringProperty(
@@ -57,12 +126,26 @@ class r0flToolboxProps(bpy.types.PropertyGroup):
 
     screen_size_pct_prop: FloatProperty(
         name="Screen Size Percentage",
+        description="Screen size at which LOD0 is displayed. LOD decimate ratios are relative to it (0 uses 100%)",
         default=0.0,
         min=0.0,
         max=100.0,
         subtype="PERCENTAGE"
     )
 
+    lod_screen_sizes_prop: StringProperty(
+        name="LOD Screen Sizes",
+        description="Comma-separated screen size percentages, one per LOD (LOD1, LOD2, ...)",
+        default="50, 25, 10"
+    )
+
+    lod_workers_prop: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes used to generate LODs (0 uses all cores)",
+        default=0,
+        min=0
+    )
+
     polygon_threshold: FloatProperty(
         name="Screen Size Threshold (%)",
         default=1,
@@ -74,16 +157,96 @@ class r0flToolboxProps(bpy.types.PropertyGroup):
     show_custom_property_list_prop: BoolProperty(
         name="Delete Custom Properties",
         description="List Custom Properties",
+        default=False,
+        # The list isn't tracked while collapsed
+        update=lambda self, context: u.schedule_property_list_refresh(force=True)
+    )
+
+    purge_include_prop: StringProperty(
+        name="Include",
+        description="Comma-separated patterns of custom property names to purge",
+        default="*"
+    )
+
+    purge_exclude_prop: StringProperty(
+        name="Exclude",
+        description="Comma-separated patterns of custom property names to keep",
+        default=""
+    )
+
+    purge_use_regex_prop: BoolProperty(
+        name="Regex",
+        description="Use regular expressions instead of glob patterns",
         default=False
     )
 
+    show_clear_attributes_prop: BoolProperty(
+        name="Clear Attributes",
+        description="Show or hide the attribute cleaning rules",
+        default=False
+    )
+
+    attr_remove_prop: StringProperty(
+        name="Remove",
+        description="Comma-separated patterns of attribute names to remove",
+        default="*"
+    )
+
+    attr_keep_prop: StringProperty(
+        name="Keep",
+        description="Comma-separated patterns of attribute names to always keep",
+        default="colorSet*, map*, material_index*"
+    )
+
+    attr_use_regex_prop: BoolProperty(
+        name="Regex",
+        description="Use regular expressions instead of glob patterns",
+        default=False
+    )
+
+    attr_keep_uv_maps_prop: BoolProperty(
+        name="Keep UV Maps",
+        description="Never remove UV map attributes",
+        default=True
+    )
+
+    attr_domains_prop: EnumProperty(
+        name="Domains",
+        description="Attribute domains to clean",
+        items=[
+            ('POINT', "Vertex", "Vertex attributes"),
+            ('EDGE', "Edge", "Edge attributes"),
+            ('FACE', "Face", "Face attributes"),
+            ('CORNER', "Corner", "Face corner attributes"),
+        ],
+        options={'ENUM_FLAG'},
+        default={'POINT', 'EDGE', 'FACE', 'CORNER'}
+    )
+
+    attr_data_types_prop: EnumProperty(
+        name="Data Types",
+        description="Attribute data types to clean",
+        items=[
+            ('FLOAT', "Float", ""),
+            ('INT', "Integer", ""),
+            ('FLOAT_VECTOR', "Vector", ""),
+            ('FLOAT_COLOR', "Color", ""),
+            ('BYTE_COLOR', "Byte Color", ""),
+            ('STRING', "String", ""),
+            ('BOOLEAN', "Boolean", ""),
+            ('FLOAT2', "2D Vector", ""),
+            ('INT8', "8-Bit Integer", ""),
+            ('INT32_2D', "2D Integer Vector", ""),
+            ('INT16_2D', "2D 16-Bit Integer Vector", ""),
+            ('QUATERNION', "Quaternion", ""),
+            ('FLOAT4X4', "4x4 Matrix", ""),
+        ],
+        options={'ENUM_FLAG'},
+        default={'FLOAT', 'INT', 'FLOAT_VECTOR', 'FLOAT_COLOR', 'BYTE_COLOR', 'STRING'}
+    )
+
     custom_property_list: CollectionProperty(type=CustomPropertyItem)
     custom_property_list_index: IntProperty(default=0)
-    last_object_selection: StringProperty(
-        name="Last Object Selection",
-        description="Comma-separated names of last selected objects",
-        default=''
-    )
 
 
 # ============ ADDON PREFS =============
@@ -93,7 +256,8 @@ class AddonPreferences(bpy.types.AddonPreferences):
     experimental_features: BoolProperty(
         name="Experimental Features",
         description="Enable experimental features",
-        default=False
+        default=False,
+        update=lambda self, context: sync_features()
     )
     
     clear_sharp_axis_float_prop: FloatProperty(
@@ -101,15 +265,23 @@ class AddonPreferences(bpy.types.AddonPreferences):
         default=0.0,
         min=0.0,
         description="Threshold value for vertex/edge selection",
-        update=lambda self, context: save_preferences()
+        update=lambda self, context: u.save_preferences()
     )
     
     zenuv_td_prop: FloatProperty(
-        name="ZenUV Texel Density",
+        name="Texel Density",
         default=10.0,
         min=0.0,
         description="Texel Density value to apply to meshes",
-        update=lambda self, context: save_preferences()
+        update=lambda self, context: u.save_preferences()
+    )
+    
+    td_texture_size_prop: IntProperty(
+        name="Texture Size",
+        default=2048,
+        min=1,
+        description="Texture resolution in pixels the Texel Density is measured against",
+        update=lambda self, context: u.save_preferences()
     )
     
     zenuv_unit_options = zenuv_unit_options = [
@@ -128,7 +300,7 @@ class AddonPreferences(bpy.types.AddonPreferences):
         items=zenuv_unit_options,
         description="Texel Density value to apply to meshes",
         default='PX_CM',
-        update=lambda self, context: save_preferences()
+        update=lambda self, context: u.save_preferences()
     )
     
     def draw(self, context):
@@ -151,6 +323,9 @@ class AddonPreferences(bpy.types.AddonPreferences):
         row = td_box.row()
         row.prop(self, "zenuv_td_unit_prop")
         
+        row = td_box.row()
+        row.prop(self, "td_texture_size_prop")
+        
     def save_axis_threshold(self):
         addon_prefs = bpy.context.preferences.addons["r0fl_simple_toolbox"].preferences
         addon_prefs.clear_sharp_axis_float_prop = self.clear_sharp_axis_float_prop
@@ -170,13 +345,15 @@ classes = [
 
 def register():
     for cls in classes:
-        print(f"[PROPERTIES] Registering {cls}")
         bpy.utils.register_class(cls)
     
-    print("[PROPERTIES] Registering bpy.types.Scene.r0fl_toolbox_props")
     bpy.types.Scene.r0fl_toolbox_props = PointerProperty(type=r0flToolboxProps)
+    
+    u.mark_preferences_saved()
 
 def unregister():
+    u.flush_pending_preferences()
+    
     for cls in classes:
         bpy.utils.unregister_class(cls)
     
@@ -0,0 +1,281 @@
+import re
+import bpy
+import fnmatch
+from collections import Counter
+
+# sizeof(IDProperty) on 64-bit builds, paid by every custom property
+IDPROP_STRUCT_SIZE = 136
+
+# Bytes per item of IDPropertyArray typecodes
+IDPROP_ARRAY_ITEM_SIZE = {'i': 4, 'f': 4, 'd': 8, 'b': 1}
+
+class CustomPropertyIndex:
+    """
+    Inverted index of object custom properties: property name to the objects holding it.
+
+    Built lazily in one pass over bpy.data.objects, then only updated for the
+    objects named in depsgraph updates.
+    """
+
+    def __init__(self):
+        self._props = {}    # Property name -> set of object pointers
+        self._objects = {}  # Object pointer -> (object, tuple of property names)
+        self._valid = False
+
+    def invalidate(self):
+        self._valid = False
+
+    def is_valid(self) -> bool:
+        return self._valid
+
+    def build(self):
+        self._props = {}
+        self._objects = {}
+        for obj in bpy.data.objects:
+            self._index_object(obj)
+        self._valid = True
+
+    def ensure(self):
+        if not self._valid:
+            self.build()
+        return self
+
+    def _unindex_object(self, ptr):
+        entry = self._objects.pop(ptr, None)
+        if entry is None:
+            return
+        for name in entry[1]:
+            holders = self._props.get(name)
+            if holders is not None:
+                holders.discard(ptr)
+                if not holders:
+                    del self._props[name]
+
+    def _index_object(self, obj):
+        ptr = obj.as_pointer()
+        keys = tuple(obj.keys())
+        old = self._objects.get(ptr)
+        if old is not None and old[1] == keys:
+            # Keep the current wrapper, a new ID may reuse a freed pointer
+            self._objects[ptr] = (obj, keys)
+            return
+
+        self._unindex_object(ptr)
+        self._objects[ptr] = (obj, keys)
+        for name in keys:
+            self._props.setdefault(name, set()).add(ptr)
+
+    def update_objects(self, objects):
+        """Re-index the given objects"""
+        if not self._valid:
+            return
+        for obj in objects:
+            self._index_object(obj)
+
+    def check_updates(self, depsgraph):
+        """Re-index the objects named in a depsgraph update"""
+        if not self._valid:
+            return
+
+        # Removed objects aren't reported, rebuild lazily when the count changes
+        if len(bpy.data.objects) != len(self._objects):
+            self.invalidate()
+            return
+
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self._index_object(update.id.original)
+
+    def object_count(self, name: str) -> int:
+        return len(self._props.get(name, ()))
+
+    def count_properties(self, objects) -> Counter:
+        """Number of objects holding each custom property, among the given objects"""
+        counts = Counter()
+        for obj in objects:
+            entry = self._objects.get(obj.as_pointer())
+            if entry is None:
+                self._index_object(obj)
+                entry = self._objects[obj.as_pointer()]
+            counts.update(entry[1])
+        return counts
+
+    def remove_properties(self, names, objects=None):
+        """
+        Delete custom properties, only visiting the objects which hold them.
+        Args:
+            names: Property names to delete
+            objects: Restrict deletion to these objects. All objects if None
+        Returns:
+            Tuple (number of deletions, number of objects affected)
+        """
+        allowed = {obj.as_pointer() for obj in objects} if objects is not None else None
+
+        deletions = 0
+        touched = {}
+        for name in names:
+            holders = self._props.get(name, set())
+            if allowed is not None:
+                holders = holders & allowed
+
+            for ptr in list(holders):
+                obj = self._objects[ptr][0]
+                try:
+                    if name not in obj:
+                        continue
+                except ReferenceError:
+                    # Object removed since indexed, rebuild on next use to pick up any live object
+                    self._unindex_object(ptr)
+                    touched.pop(ptr, None)
+                    self.invalidate()
+                    continue
+
+                print(f"Deleting property '{name}' of object {obj.name}")
+                del obj[name]
+                deletions += 1
+                touched[ptr] = obj
+
+        for obj in touched.values():
+            self._index_object(obj)
+
+        return deletions, len(touched)
+
+
+_index = CustomPropertyIndex()
+
+def get_index() -> CustomPropertyIndex:
+    """Get the custom property index, building it if needed"""
+    return _index.ensure()
+
+def compile_patterns(text: str, use_regex=False):
+    """
+    Compile a comma-separated list of glob or regex patterns into a single regex.
+    Returns None if there are no patterns.
+    """
+    patterns = [t.strip() for t in text.split(',') if t.strip()]
+    if not patterns:
+        return None
+
+    if not use_regex:
+        patterns = [fnmatch.translate(p) for p in patterns]
+    else:
+        patterns = [f"(?:{p})\\Z" for p in patterns]
+
+    return re.compile('|'.join(f"(?:{p})" for p in patterns))
+
+def estimate_idprop_size(value) -> int:
+    """Estimated bytes held by an IDProperty value, including its own struct"""
+    size = IDPROP_STRUCT_SIZE
+    if isinstance(value, str):
+        size += len(value.encode()) + 1
+    elif hasattr(value, "typecode"):
+        # IDPropertyArray
+        size += len(value) * IDPROP_ARRAY_ITEM_SIZE.get(value.typecode, 8)
+    elif hasattr(value, "keys"):
+        # IDPropertyGroup
+        size += sum(estimate_idprop_size(v) for v in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_idprop_size(v) for v in value)
+    elif isinstance(value, bytes):
+        size += len(value)
+
+    return size
+
+def iter_id_collections():
+    """Iterate (name, collection) of every ID collection in bpy.data"""
+    for prop in bpy.data.bl_rna.properties:
+        if prop.type == 'COLLECTION':
+            yield prop.identifier, getattr(bpy.data, prop.identifier)
+
+def purge_custom_properties(include: str = "*", exclude: str = "", use_regex=False, dry_run=True) -> dict:
+    """
+    Delete custom properties matching the include patterns and not the exclude patterns
+    from every ID in bpy.data, in a single pass.
+
+    Properties backing registered RNA properties (e.g. addon settings) and linked
+    IDs are skipped.
+    Returns:
+        Dict of ID collection name to [properties, IDs, estimated bytes]
+    """
+    include_re = compile_patterns(include, use_regex)
+    exclude_re = compile_patterns(exclude, use_regex)
+    if include_re is None:
+        return {}
+
+    # Names repeat across thousands of IDs, cache each match decision
+    matches = {}
+    def is_match(id_type, name):
+        key = (id_type, name)
+        result = matches.get(key)
+        if result is None:
+            result = (
+                include_re.match(name) is not None
+                and (exclude_re is None or exclude_re.match(name) is None)
+                and name not in id_type.bl_rna.properties
+            )
+            matches[key] = result
+        return result
+
+    stats = {}
+    for coll_name, collection in iter_id_collections():
+        n_props = 0
+        n_ids = 0
+        n_bytes = 0
+        for id_data in collection:
+            if id_data.library:
+                continue
+
+            keys = [k for k in id_data.keys() if is_match(type(id_data), k)]
+            if not keys:
+                continue
+
+            n_ids += 1
+            n_props += len(keys)
+            for k in keys:
+                n_bytes += estimate_idprop_size(id_data[k])
+                if not dry_run:
+                    del id_data[k]
+
+        if n_props:
+            stats[coll_name] = [n_props, n_ids, n_bytes]
+
+    if not dry_run:
+        _index.invalidate()
+
+    return stats
+
+
+@bpy.app.handlers.persistent
+def property_index_depsgraph_update(scene, depsgraph):
+    _index.check_updates(depsgraph)
+
+@bpy.app.handlers.persistent
+def property_index_invalidate(*args):
+    # Undo and file loads replace every object
+    _index.invalidate()
+
+# -------------------------------------------------------------------
+#   Register & Unregister
+# -------------------------------------------------------------------
+
+handlers = [
+    (bpy.app.handlers.depsgraph_update_post, property_index_depsgraph_update),
+    (bpy.app.handlers.undo_post, property_index_invalidate),
+    (bpy.app.handlers.redo_post, property_index_invalidate),
+    (bpy.app.handlers.load_post, property_index_invalidate),
+]
+
+def register():
+    for handler_list, handler in handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+def unregister():
+    for handler_list, handler in handlers:
+        try:
+            if handler in handler_list:
+                handler_list.remove(handler)
+        except Exception as e:
+            print(f"Error removing handler {handler}: {e}")
+
+    _index.invalidate()
@@ -0,0 +1,196 @@
+import os
+import ast
+import sys
+import time
+import hashlib
+import importlib
+
+from .const import INTERNAL_NAME
+
+class ModuleRecord:
+    """Source state of a loaded module and the package modules it imports"""
+    __slots__ = ("name", "path", "mtime", "digest", "imports")
+
+    def __init__(self, name: str, path: str, package_modules):
+        self.name = name
+        self.path = path
+        self.mtime = os.stat(path).st_mtime_ns
+        source = read_source(path)
+        self.digest = hashlib.sha1(source).hexdigest()
+        self.imports = get_imports(name, source, path, package_modules)
+
+    def is_changed(self) -> bool:
+        """Whether the source changed. The file is only hashed when its mtime moved"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        return hashlib.sha1(read_source(self.path)).hexdigest() != self.digest
+
+
+def read_source(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+def get_package_modules(package: str = INTERNAL_NAME) -> dict:
+    """Loaded modules of a package, the package itself included, from sys.modules"""
+    prefix = package + "."
+    return {
+        name: module for name, module in list(sys.modules.items())
+        if (name == package or name.startswith(prefix)) and getattr(module, "__file__", None)
+    }
+
+def get_imports(name: str, source: bytes, path: str, package_modules) -> set:
+    """Names of the package modules a module imports, relative imports resolved"""
+    is_package = os.path.basename(path) == "__init__.py"
+    base_parts = name.split('.') if is_package else name.split('.')[:-1]
+
+    imports = set()
+    for node in ast.walk(ast.parse(source, filename=path)):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = '.'.join(base_parts[:len(base_parts) - (node.level - 1)])
+                target = f"{base}.{node.module}" if node.module else base
+            else:
+                target = node.module
+            # from . import utils imports the submodules, not the package
+            if node.module:
+                imports.add(target)
+            imports.update(f"{target}.{alias.name}" for alias in node.names)
+
+    imports.discard(name)
+    return imports & set(package_modules)
+
+def topological_order(names, records) -> list:
+    """Order module names so every module comes after the modules it imports"""
+    names = set(names)
+    deps = {n: records[n].imports & names for n in names}
+    ordered = []
+    ready = sorted(n for n, d in deps.items() if not d)
+    while ready:
+        n = ready.pop(0)
+        ordered.append(n)
+        for other, d in deps.items():
+            if n in d:
+                d.discard(n)
+                if not d and other not in ordered and other not in ready:
+                    ready.append(other)
+        del deps[n]
+        ready.sort()
+
+    # Import cycles keep whatever is left in name order
+    ordered.extend(sorted(deps))
+    return ordered
+
+
+class Reloader:
+    """
+    Incremental reloader of a package.
+
+    Records the source state of every loaded package module, then reloads only
+    the modules which changed since, plus the modules importing them.
+    """
+
+    def __init__(self, package: str = INTERNAL_NAME):
+        self.package = package
+        self.records = {}
+
+    def snapshot(self):
+        modules = get_package_modules(self.package)
+        self.records = {name: ModuleRecord(name, module.__file__, modules) for name, module in modules.items()}
+
+    def get_changed(self) -> set:
+        if not self.records:
+            self.snapshot()
+
+        # Modules imported since, like optional operator modules, start from their current state
+        modules = get_package_modules(self.package)
+        for name, module in modules.items():
+            if name not in self.records:
+                self.records[name] = ModuleRecord(name, module.__file__, modules)
+
+        return {name for name, record in self.records.items() if record.is_changed()}
+
+    def get_dependents(self, names) -> set:
+        """Modules which import any of the names, directly or not, the names included"""
+        affected = set(names)
+        grew = True
+        while grew:
+            grew = False
+            for name, record in self.records.items():
+                if name not in affected and record.imports & affected:
+                    affected.add(name)
+                    grew = True
+        return affected
+
+    def reload(self, force=()) -> list:
+        """
+        Reload changed modules and their dependents, and re-register the package.
+        Args:
+            force: Module names to reload even if unchanged
+        Returns:
+            Tuple (list of (module name, seconds) in reload order, list of module names which failed)
+        """
+        changed = self.get_changed()
+        # Forced names which are not loaded package modules can't be reloaded
+        failures = sorted(set(force) - set(self.records))
+        changed |= set(force) & set(self.records)
+        if not changed:
+            return [], failures
+
+        order = topological_order(self.get_dependents(changed), self.records)
+        package = sys.modules[self.package]
+
+        try:
+            package.unregister()
+        except Exception as e:
+            print(f"[RELOADER] Error unregistering {self.package}: {e}")
+
+        timings = []
+        for name in order:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.reload(module)
+            except Exception as e:
+                print(f"[RELOADER] Error reloading {name}: {e}")
+                failures.append(name)
+                continue
+            timings.append((name, time.perf_counter() - start))
+            print(f"[RELOADER] Reloaded {name} in {timings[-1][1] * 1000:.1f} ms")
+
+        # Registering takes a new baseline, imports may have changed as well
+        try:
+            sys.modules[self.package].register()
+        except Exception as e:
+            print(f"[RELOADER] Error registering {self.package}: {e}")
+            failures.append(self.package)
+
+        return timings, failures
+
+
+_reloader = None
+
+def get_reloader(package: str = INTERNAL_NAME) -> Reloader:
+    global _reloader
+    if _reloader is None or _reloader.package != package:
+        _reloader = Reloader(package)
+    return _reloader
+
+
+# -------------------------------------------------------------------
+#   Register & Unregister
+# -------------------------------------------------------------------
+
+def register():
+    # Baseline of the sources as loaded
+    get_reloader().snapshot()
+
+def unregister():
+    pass
@@ -0,0 +1,97 @@
+import bpy
+import bmesh
+import numpy as np
+
+from . import edit_mesh
+
+# Mesh collections holding the selection of each domain, in select mode order
+DOMAINS = ("vertices", "edges", "polygons")
+
+class SelectionState:
+    """
+    Snapshot of the vertex, edge and face selection of a mesh.
+
+    Each domain is stored as a NumPy bool array indexed like the mesh elements.
+    """
+    __slots__ = ("verts", "edges", "faces", "select_mode")
+
+    def __init__(self, verts, edges, faces, select_mode):
+        self.verts = verts
+        self.edges = edges
+        self.faces = faces
+        self.select_mode = select_mode
+
+    def arrays(self):
+        return (self.verts, self.edges, self.faces)
+
+    def selected_indices(self, domain: str = "EDGE"):
+        """Indices of the selected elements of a domain (VERT, EDGE or FACE)"""
+        arr = {"VERT": self.verts, "EDGE": self.edges, "FACE": self.faces}[domain]
+        return np.flatnonzero(arr)
+
+def _read_select(collection):
+    arr = np.empty(len(collection), dtype=bool)
+    collection.foreach_get("select", arr)
+    return arr
+
+def _read_mesh_select(mesh):
+    return tuple(_read_select(getattr(mesh, domain)) for domain in DOMAINS)
+
+def snapshot(obj) -> SelectionState:
+    """
+    Capture the selection of a mesh object.
+
+    In Edit mode the selection is read from the edit-mesh, without syncing the mesh data.
+    """
+    mesh = obj.data
+    if obj.mode == "EDIT":
+        verts, edges, faces = edit_mesh.read_select(bmesh.from_edit_mesh(mesh))
+    else:
+        verts, edges, faces = _read_mesh_select(mesh)
+    select_mode = tuple(bpy.context.scene.tool_settings.mesh_select_mode)
+
+    return SelectionState(verts, edges, faces, select_mode)
+
+def _restore_edit_mesh(obj, state: SelectionState, update=True):
+    mesh = obj.data
+    bm = bmesh.from_edit_mesh(mesh)
+
+    # Only touch the elements whose selection actually differs
+    current = edit_mesh.read_select(bm)
+    bm_seqs = (bm.verts, bm.edges, bm.faces)
+
+    changed = 0
+    for seq, saved, now in zip(bm_seqs, state.arrays(), current):
+        if len(saved) != len(now):
+            print(f"[SELECTION] Topology of {obj.name} changed, skipping restore of {len(saved)} elements")
+            continue
+        seq.ensure_lookup_table()
+        for idx in np.flatnonzero(saved != now):
+            seq[idx].select = bool(saved[idx])
+            changed += 1
+
+    if changed and update:
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+
+def _restore_mesh(obj, state: SelectionState):
+    mesh = obj.data
+    for domain, saved in zip(DOMAINS, state.arrays()):
+        collection = getattr(mesh, domain)
+        if len(collection) != len(saved):
+            print(f"[SELECTION] Topology of {obj.name} changed, skipping restore of {domain}")
+            continue
+        collection.foreach_set("select", saved)
+
+def restore(obj, state: SelectionState, restore_select_mode=True, update=True):
+    """
+    Restore a selection captured with snapshot, in whichever mode the object is in.
+    Args:
+        update: Push an update of the edit-mesh. Disable when the caller already does
+    """
+    if obj.mode == "EDIT":
+        _restore_edit_mesh(obj, state, update=update)
+    else:
+        _restore_mesh(obj, state)
+
+    if restore_select_mode:
+        bpy.context.scene.tool_settings.mesh_select_mode = state.select_mode
@@ -0,0 +1,29 @@
+import time
+
+# Seconds spent importing and registering each module, in load order
+timings = {"import": {}, "register": {}}
+
+class timed:
+    """Context manager recording the time of a startup step"""
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        timings[self.kind][self.name] = time.perf_counter() - self.start
+
+def get_total(kind: str) -> float:
+    return sum(timings[kind].values())
+
+def format_report() -> str:
+    lines = []
+    for kind, steps in timings.items():
+        lines.append(f"{kind.capitalize()}: {get_total(kind) * 1000:.1f} ms")
+        for name, seconds in sorted(steps.items(), key=lambda x: x[1], reverse=True):
+            lines.append(f"    {name}: {seconds * 1000:.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,341 @@
+import bpy
+import csv
+import bmesh
+import hashlib
+import numpy as np
+
+from . import kernels
+from . import edit_mesh
+
+# Length of each texel density unit, in meters
+UNIT_TO_METERS = {
+    'PX_KM': 1000.0,
+    'PX_M': 1.0,
+    'PX_CM': 0.01,
+    'PX_MM': 0.001,
+    'PX_UM': 1e-6,
+    'PX_MIL': 2.54e-5,
+    'PX_FT': 0.3048,
+    'PX_IN': 0.0254,
+    'PX_TH': 2.54e-5,
+}
+
+# UVs closer than this are considered the same UV vertex when finding islands
+UV_EPSILON = 1e-5
+
+def to_px_per_meter(value: float, unit: str) -> float:
+    return value / UNIT_TO_METERS.get(unit, 0.01)
+
+def from_px_per_meter(value: float, unit: str) -> float:
+    return value * UNIT_TO_METERS.get(unit, 0.01)
+
+
+class MeshTDData:
+    """Bulk read loop, coordinate and UV arrays of a mesh needed for texel density"""
+    __slots__ = ("n_polys", "co", "loop_verts", "loop_edges", "loop_polys", "next_loop", "uv")
+
+    def __init__(self, mesh, uv_layer, matrix=None, scale_length=1.0):
+        n_verts = len(mesh.vertices)
+        n_loops = len(mesh.loops)
+        self.n_polys = len(mesh.polygons)
+
+        co = np.empty(n_verts * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", co)
+        self.co = co.reshape(-1, 3)
+        if matrix is not None:
+            self.transform(matrix, scale_length)
+
+        self.loop_verts = np.empty(n_loops, dtype=np.int32)
+        self.loop_edges = np.empty(n_loops, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", self.loop_verts)
+        mesh.loops.foreach_get("edge_index", self.loop_edges)
+
+        loop_starts = np.empty(self.n_polys, dtype=np.int32)
+        loop_totals = np.empty(self.n_polys, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        self.loop_polys, self.next_loop = kernels.loop_topology(loop_starts, loop_totals, n_loops)
+
+        uv = np.empty(n_loops * 2, dtype=np.float64)
+        uv_layer.data.foreach_get("uv", uv)
+        self.uv = uv.reshape(-1, 2)
+
+    @classmethod
+    def from_bmesh(cls, bm, uv_layer, loops=None, matrix=None, scale_length=1.0):
+        """
+        Same arrays read from an edit-mesh, without syncing the mesh data.
+        Args:
+            uv_layer: BMesh UV layer
+            loops: Loops from edit_mesh.get_loops, if already gathered
+        """
+        data = cls.__new__(cls)
+        edit_mesh.ensure_indices(bm)
+        loops = edit_mesh.get_loops(bm) if loops is None else loops
+
+        data.n_polys = len(bm.faces)
+        data.co = edit_mesh.read_coords(bm)
+        if matrix is not None:
+            data.transform(matrix, scale_length)
+
+        data.loop_verts, data.loop_edges = edit_mesh.read_loop_indices(loops)
+
+        loop_totals = edit_mesh.read_loop_totals(bm)
+        loop_starts = np.zeros_like(loop_totals)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+        data.loop_polys, data.next_loop = kernels.loop_topology(loop_starts, loop_totals, len(loops))
+
+        data.uv = edit_mesh.read_uv(loops, uv_layer)
+        return data
+
+    def transform(self, matrix, scale_length=1.0):
+        m = np.array(matrix, dtype=np.float64)
+        self.co = (self.co @ m[:3, :3].T + m[:3, 3]) * scale_length
+
+    def content_hash(self) -> str:
+        """Hash of the coordinates, topology and UVs, taken before any transform"""
+        h = hashlib.blake2b(digest_size=16)
+        for arr in (self.co, self.loop_verts, self.loop_edges, self.loop_polys, self.uv):
+            h.update(arr.tobytes())
+        return h.hexdigest()
+
+def get_td_data(mesh):
+    """MeshTDData of the active UV map of a mesh, from its edit-mesh in Edit mode. None without UVs or faces"""
+    if mesh.is_editmode:
+        bm = bmesh.from_edit_mesh(mesh)
+        uv_layer = bm.loops.layers.uv.active
+        if uv_layer is None or not len(bm.faces):
+            return None
+        return MeshTDData.from_bmesh(bm, uv_layer)
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None or not len(mesh.polygons):
+        return None
+    return MeshTDData(mesh, uv_layer)
+
+def get_uv_islands(data: MeshTDData):
+    """Island index of every polygon and number of islands"""
+    return kernels.uv_islands(data.loop_verts, data.loop_edges, data.loop_polys, data.next_loop, data.uv, data.n_polys, UV_EPSILON)
+
+def get_island_areas(data: MeshTDData, co=None):
+    """
+    3D and UV area of every UV island.
+    Args:
+        co: Coordinates to measure the 3D areas with instead of data.co
+    Returns:
+        Tuple (island index of every polygon, island 3D areas, island UV areas)
+    """
+    co = data.co if co is None else co
+    face_island, n_islands = get_uv_islands(data)
+    area_3d = kernels.face_areas(co, data.loop_verts, data.next_loop, data.loop_polys, data.n_polys)
+    area_uv = kernels.uv_face_areas(data.uv, data.next_loop, data.loop_polys, data.n_polys)
+
+    return face_island, kernels.island_sums(face_island, n_islands, area_3d), kernels.island_sums(face_island, n_islands, area_uv)
+
+def get_island_density(data: MeshTDData, texture_size: int):
+    """
+    Texel density of every UV island, in pixels per meter.
+    Returns:
+        Tuple (island index of every polygon, island 3D areas, island UV areas, island densities)
+    """
+    face_island, island_3d, island_uv = get_island_areas(data)
+    return face_island, island_3d, island_uv, kernels.density(island_3d, island_uv, texture_size)
+
+def scale_islands_to_density(data: MeshTDData, face_island, density, target: float):
+    """New (L, 2) UV array with every island scaled around its UV bounds center to the target density"""
+    return kernels.scale_islands(data.uv, face_island[data.loop_polys], density, target)
+
+def set_texel_density(obj, target_px_per_m: float, texture_size: int, bm=None) -> int:
+    """
+    Scale every UV island of an object's active UV map to the target texel density.
+
+    Areas are measured in world space. When an edit-mesh is given it is read
+    and written directly, the mesh data is not synced from it.
+    Returns:
+        Number of islands processed
+    """
+    mesh = obj.data
+    scale_length = bpy.context.scene.unit_settings.scale_length
+
+    if bm is None:
+        uv_layer = mesh.uv_layers.active
+        if uv_layer is None or not len(mesh.polygons):
+            return 0
+        data = MeshTDData(mesh, uv_layer, obj.matrix_world, scale_length)
+    else:
+        uv_layer = bm.loops.layers.uv.active
+        if uv_layer is None or not len(bm.faces):
+            return 0
+        loops = edit_mesh.get_loops(bm)
+        data = MeshTDData.from_bmesh(bm, uv_layer, loops, obj.matrix_world, scale_length)
+
+    face_island, _, _, density = get_island_density(data, texture_size)
+    new_uv = scale_islands_to_density(data, face_island, density, target_px_per_m)
+
+    if bm is None:
+        uv_layer.data.foreach_set("uv", new_uv.astype(np.float32).ravel())
+        mesh.update()
+    else:
+        for loop, uv in zip(loops, new_uv.tolist()):
+            loop[uv_layer].uv = uv
+
+    return len(density)
+
+
+# ---- Audit ----
+
+class ObjectTD:
+    """Texel density of an object and of each of its UV islands, in pixels per meter"""
+    __slots__ = ("name", "mesh", "area_3d", "area_uv", "density", "island_density")
+
+    def __init__(self, obj, island_3d, island_uv, texture_size: int):
+        self.name = obj.name
+        self.mesh = obj.data.name
+        self.area_3d = float(island_3d.sum())
+        self.area_uv = float(island_uv.sum())
+        self.density = texture_size * (self.area_uv / self.area_3d) ** 0.5 if self.area_3d > 0 else 0.0
+        self.island_density = kernels.density(island_3d, island_uv, texture_size)
+
+
+def summarize(values):
+    """(min, median, max) of an array, zeros if empty"""
+    values = np.asarray(values)
+    if not len(values):
+        return 0.0, 0.0, 0.0
+    return float(values.min()), float(np.median(values)), float(values.max())
+
+def get_island_densities(audit=None):
+    audit = _last_audit if audit is None else audit
+    if not audit:
+        return np.empty(0)
+    return np.concatenate([o.island_density for o in audit])
+
+def get_outliers(target: float, tolerance: float, audit=None) -> list:
+    """
+    Objects with islands off the target density by more than tolerance (0-1).
+    Returns:
+        List of (ObjectTD, number of outlier islands), worst object density first
+    """
+    audit = _last_audit if audit is None else audit
+    lo = target * (1.0 - tolerance)
+    hi = target * (1.0 + tolerance)
+
+    outliers = []
+    for o in audit:
+        d = o.island_density
+        n = int(np.count_nonzero((d > 0) & ((d < lo) | (d > hi))))
+        if n:
+            outliers.append((o, n))
+
+    outliers.sort(key=lambda x: abs(x[0].density - target), reverse=True)
+    return outliers
+
+
+class AuditResult:
+    """
+    Objects of an audit, with the summary and outliers drawn by the panel.
+    Both are computed once per audit, or tolerance change, not on every redraw.
+    """
+    __slots__ = ("objects", "summary", "target", "tolerance", "outliers")
+
+    def __init__(self, objects=(), target: float = 0.0, tolerance: float = 0.1):
+        self.objects = list(objects)
+        self.summary = summarize(get_island_densities(self.objects))
+        self.update_outliers(target, tolerance)
+
+    def update_outliers(self, target: float, tolerance: float):
+        self.target = target
+        self.tolerance = tolerance
+        self.outliers = get_outliers(target, tolerance, self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+
+# Island areas keyed by (mesh content hash, metric key), kept between audits
+_audit_cache = {}
+
+# Result of the last audit, drawn by the panel
+_last_audit = AuditResult()
+
+def get_metric_key(matrix, scale_length=1.0) -> bytes:
+    """
+    Key of the areas a transform produces.
+
+    Areas only depend on the metric M^T M of the linear part of the matrix,
+    so instances which only differ in location or rotation share a key.
+    """
+    m = np.array(matrix, dtype=np.float64)[:3, :3] * scale_length
+    return np.round(m.T @ m, 6).tobytes()
+
+def audit_texel_density(objects=None, texture_size: int = 2048, target: float = 0.0, tolerance: float = 0.1) -> AuditResult:
+    """
+    Measure the texel density of every mesh object and its UV islands.
+
+    Each mesh is read once. Islands are computed once per mesh content and
+    metric, so shared meshes and unchanged meshes from previous audits are
+    not recomputed.
+    Args:
+        target: Target density in pixels per meter the outliers are found against
+        tolerance: Allowed relative difference to the target (0-1)
+    """
+    global _last_audit, _audit_cache
+
+    objects = bpy.context.scene.objects if objects is None else objects
+    scale_length = bpy.context.scene.unit_settings.scale_length
+
+    # Shared meshes are read and hashed once, for all their objects
+    mesh_objects = {}
+    for obj in objects:
+        if obj.type == "MESH":
+            mesh_objects.setdefault(obj.data, []).append(obj)
+
+    cache = {}
+    computed = 0
+    audit = []
+    for mesh, objs in mesh_objects.items():
+        data = get_td_data(mesh)
+        if data is None:
+            continue
+        content_hash = data.content_hash()
+
+        for obj in objs:
+            key = (content_hash, get_metric_key(obj.matrix_world, scale_length))
+            areas = cache.get(key) or _audit_cache.get(key)
+            if areas is None:
+                # Areas don't depend on translation, the linear part is enough
+                co = data.co @ (np.array(obj.matrix_world)[:3, :3].T * scale_length)
+                areas = get_island_areas(data, co)[1:]
+                computed += 1
+            cache[key] = areas
+
+            audit.append(ObjectTD(obj, *areas, texture_size))
+
+    # Drop entries of meshes which changed or no longer exist
+    _audit_cache = cache
+    _last_audit = AuditResult(audit, target, tolerance)
+
+    print(f"[TD AUDIT] {len(audit)} objects, {len(cache)} unique island sets, {computed} computed")
+    return _last_audit
+
+def get_last_audit() -> AuditResult:
+    return _last_audit
+
+def export_csv(filepath: str, unit: str = 'PX_CM', audit=None):
+    """Write one row per object, followed by one row per island, in the given unit"""
+    audit = _last_audit if audit is None else audit
+    label = unit.lower().replace('_', '/')
+
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["object", "mesh", "islands", "area_3d_m2", "area_uv", f"density_{label}"])
+        for o in audit:
+            writer.writerow([o.name, o.mesh, len(o.island_density), o.area_3d, o.area_uv, from_px_per_meter(o.density, unit)])
+
+        writer.writerow([])
+        writer.writerow(["object", "island", f"density_{label}"])
+        for o in audit:
+            for i, d in enumerate(o.island_density):
+                writer.writerow([o.name, i, from_px_per_meter(float(d), unit)])
@@ -0,0 +1,104 @@
+"""
+Texel density operators, imported and registered once the External section is opened.
+"""
+import bpy
+from bpy_extras.io_utils import ExportHelper
+
+from .const import INTERNAL_NAME
+from . import edit_mesh
+from . import texel_density
+
+class SimpleToolbox_OT_ApplyZenUVTD(bpy.types.Operator):
+    bl_label = "Set TD"
+    bl_idname = "r0tools.zenuv_set_td"
+    bl_description = "Scale every UV island of the selected meshes to the Texel Density set in the preferences.\nDoes not require ZenUV"
+    bl_options = {'REGISTER','UNDO'}
+
+    accepted_contexts = ["OBJECT", "EDIT_MESH"]
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode in cls.accepted_contexts and len(context.selected_objects) > 0
+    
+    def execute(self, context):
+        context_mode = context.mode
+        
+        if context_mode not in self.accepted_contexts:
+            self.report({'WARNING'}, "Only performed in Object or Edit modes")
+            return {'CANCELLED'}
+        
+        addon_prefs = context.preferences.addons[INTERNAL_NAME].preferences
+        td_value = addon_prefs.zenuv_td_prop
+        td_unit = addon_prefs.zenuv_td_unit_prop
+        texture_size = addon_prefs.td_texture_size_prop
+        target = texel_density.to_px_per_meter(td_value, td_unit)
+        unit_label = td_unit.split('_')[1].lower()
+        
+        print(f"Setting TD {td_value} px/{unit_label} at {texture_size}px")
+        
+        n_objects = 0
+        n_islands = 0
+        if context_mode == "EDIT_MESH":
+            for obj, bm in edit_mesh.iter_edit_meshes(context):
+                n_islands += texel_density.set_texel_density(obj, target, texture_size, bm=bm)
+                n_objects += 1
+        else:
+            # Shared meshes are scaled once, measured with the first object's transform
+            for obj, mesh in edit_mesh.iter_object_meshes(context):
+                n_islands += texel_density.set_texel_density(obj, target, texture_size)
+                n_objects += 1
+        
+        self.report({'INFO'}, f"Texel density set to {td_value} px/{unit_label} for {n_islands} islands in {n_objects} meshes.")
+        
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_AuditTexelDensity(bpy.types.Operator):
+    bl_label = "Audit TD"
+    bl_idname = "r0tools.audit_texel_density"
+    bl_description = "Measure the texel density of every mesh object in the scene and of each of its UV islands.\nMeshes shared by several objects, or unchanged since the last audit, are not recomputed"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        addon_prefs = context.preferences.addons[INTERNAL_NAME].preferences
+        addon_props = context.scene.r0fl_toolbox_props
+        td_unit = addon_prefs.zenuv_td_unit_prop
+
+        # Summary and outliers are computed here once, the panel only draws them
+        audit = texel_density.audit_texel_density(
+            texture_size=addon_prefs.td_texture_size_prop,
+            target=texel_density.to_px_per_meter(addon_prefs.zenuv_td_prop, td_unit),
+            tolerance=addon_props.td_tolerance_prop / 100
+        )
+
+        lo, median, hi = (texel_density.from_px_per_meter(v, td_unit) for v in audit.summary)
+        unit_label = td_unit.split('_')[1].lower()
+        self.report({'INFO'}, f"Audited {len(audit)} objects. Islands min {lo:.2f}, median {median:.2f}, max {hi:.2f} px/{unit_label}")
+        return {'FINISHED'}
+
+
+class SimpleToolbox_OT_ExportTexelDensityCSV(bpy.types.Operator, ExportHelper):
+    bl_label = "Export CSV"
+    bl_idname = "r0tools.export_texel_density_csv"
+    bl_description = "Export the last texel density audit to a CSV file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".csv"
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return len(texel_density.get_last_audit()) > 0
+
+    def execute(self, context):
+        addon_prefs = context.preferences.addons[INTERNAL_NAME].preferences
+        texel_density.export_csv(self.filepath, addon_prefs.zenuv_td_unit_prop)
+        self.report({'INFO'}, f"Exported texel density audit to {self.filepath}")
+        return {'FINISHED'}
+
+
+classes = [
+    SimpleToolbox_OT_ApplyZenUVTD,
+    SimpleToolbox_OT_AuditTexelDensity,
+    SimpleToolbox_OT_ExportTexelDensityCSV,
+]
@@ -2,6 +2,9 @@ import bpy
 
 from .const import INTERNAL_NAME, ADDON_NAME, VERSION_STR
 from . import utils as u
+from . import memory
+from . import startup
+from . import profiling
 
 class PT_SimpleToolbox(bpy.types.Panel):
     bl_idname = 'OBJECT_PT_quick_toolbox'
@@ -30,6 +33,34 @@ class PT_SimpleToolbox(bpy.types.Panel):
             row.prop(addon_props, "reload_modules_prop")
             row = box.row()
             row.operator("r0tools.reload_named_scripts", icon="NONE")
+            # Profiling
+            profiling_box = box.box()
+            row = profiling_box.row(align=True)
+            enabled = profiling.is_enabled()
+            row.operator("r0tools.toggle_profiling", text="Stop Profiling" if enabled else "Profile Operators", icon="REC" if enabled else "NONE", depress=enabled)
+            row = profiling_box.row(align=True)
+            row.enabled = not enabled
+            row.prop(addon_props, "profiling_history_prop")
+            row.prop(addon_props, "profiling_cprofile_prop")
+            row.prop(addon_props, "profiling_print_prop")
+            runs = profiling.get_runs()
+            if runs:
+                col = profiling_box.column(align=True)
+                for run in reversed(runs[-10:]):
+                    row = col.row(align=True)
+                    row.label(text=run.operator.split('.')[-1])
+                    row.label(text=f"{run.wall * 1000:.1f} ms")
+                    row.label(text=f"ops {run.ops_calls}")
+                    row.label(text=f"mode {run.mode_sets}")
+                    row.label(text=f"upd {run.view_layer_updates}")
+                row = profiling_box.row(align=True)
+                row.operator("r0tools.clear_profiling_runs", icon="TRASH")
+                row.operator("r0tools.dump_profile_stats", icon="EXPORT")
+            
+            col = box.column(align=True)
+            col.label(text="Startup", icon="TIME")
+            for line in startup.format_report().splitlines():
+                col.label(text=line)
         
         # Object Ops
         box = layout.box()
@@ -39,8 +70,24 @@ class PT_SimpleToolbox(bpy.types.Panel):
             # row.label(text="Object Ops")
             row = box.row(align=True)
             row.operator("r0tools.clear_custom_split_normals")
-            # row = box.row(align=True)
-            # row.operator("r0tools.clear_mesh_attributes")
+            row = box.row()
+            row.prop(addon_props, "show_clear_attributes_prop", icon="TRIA_DOWN" if addon_props.show_clear_attributes_prop else "TRIA_RIGHT", emboss=False)
+            if addon_props.show_clear_attributes_prop:
+                attr_box = box.box()
+                row = attr_box.row()
+                row.prop(addon_props, "attr_remove_prop")
+                row = attr_box.row()
+                row.prop(addon_props, "attr_keep_prop")
+                row = attr_box.row(align=True)
+                row.prop(addon_props, "attr_domains_prop")
+                col = attr_box.column(align=True)
+                col.prop(addon_props, "attr_data_types_prop")
+                row = attr_box.row()
+                row.prop(addon_props, "attr_keep_uv_maps_prop")
+                row.prop(addon_props, "attr_use_regex_prop")
+                row = attr_box.row(align=True)
+                row.operator("r0tools.clear_mesh_attributes", text="Dry Run").dry_run = True
+                row.operator("r0tools.clear_mesh_attributes", text="Clear").dry_run = False
             row = box.row(align=True)
             row.operator("r0tools.clear_all_objects_children")
             row = box.row()
@@ -59,6 +106,18 @@ class PT_SimpleToolbox(bpy.types.Panel):
                 )
                 row = box.row()
                 row.operator("r0tools.clear_custom_properties")
+                # Scene-wide purge
+                purge_box = box.box()
+                row = purge_box.row()
+                row.label(text="Purge All Data-blocks:")
+                row.prop(addon_props, "purge_use_regex_prop")
+                row = purge_box.row()
+                row.prop(addon_props, "purge_include_prop")
+                row = purge_box.row()
+                row.prop(addon_props, "purge_exclude_prop")
+                row = purge_box.row(align=True)
+                row.operator("r0tools.purge_custom_properties", text="Dry Run").dry_run = True
+                row.operator("r0tools.purge_custom_properties", text="Purge").dry_run = False
         
         # Mesh Ops
         box = layout.box()
@@ -69,6 +128,12 @@ class PT_SimpleToolbox(bpy.types.Panel):
             # Nth Edges Operator
             row = box.row(align=True)
             row.operator("r0tools.nth_edges")
+            row.operator("r0tools.nth_edges_modal", text="", icon="RESTRICT_SELECT_OFF")
+            # Loose Geometry
+            row = box.row(align=True)
+            row.label(text="Loose Geometry:")
+            row.operator("r0tools.find_loose_geometry", text="Select").action = 'SELECT'
+            row.operator("r0tools.find_loose_geometry", text="Delete").action = 'DELETE'
             box = box.box()
             row = box.row(align=True)
             # Clear Sharp Edges on Axis
@@ -81,17 +146,65 @@ class PT_SimpleToolbox(bpy.types.Panel):
             row.operator("r0tools.clear_sharp_axis_y", text="Y")
             row.operator("r0tools.clear_sharp_axis_z", text="Z")
         
+        # Memory
+        box = layout.box()
+        box.prop(addon_props, "show_memory_prop", icon="TRIA_DOWN" if addon_props.show_memory_prop else "TRIA_RIGHT", emboss=False)
+        if addon_props.show_memory_prop:
+            row = box.row(align=True)
+            row.operator("r0tools.profile_mesh_memory")
+            row.prop(addon_props, "memory_top_n_prop")
+            profile = memory.get_last_profile()
+            if profile:
+                col = box.column(align=True)
+                for m in profile[:addon_props.memory_top_n_prop]:
+                    row = col.row(align=True)
+                    row.label(text=m.name)
+                    row.label(text=f"x{m.users}")
+                    row.label(text=memory.format_bytes(m.total))
+                row = box.row()
+                row.label(text=f"Total: {memory.format_bytes(sum(m.total for m in profile))}")
+                row.operator("r0tools.export_mesh_memory_csv", icon="EXPORT")
+        
         # Externals
         box = layout.box()
         box.prop(addon_props, "show_ext_ops", icon="TRIA_DOWN" if addon_props.show_ext_ops else "TRIA_RIGHT", emboss=False)
         if addon_props.show_ext_ops:
+            # Imported with the texel density operators, once the section is opened
+            from . import texel_density
+
             row = box.row(align=True)
-            row.label(text="ZenUV Texel Density")
+            row.label(text="Texel Density")
             row = box.row(align=True)
             row.prop(addon_prefs, "zenuv_td_prop", text="TD:")
             row.prop(addon_prefs, "zenuv_td_unit_prop", text="Unit")
             row = box.row(align=True)
+            row.prop(addon_prefs, "td_texture_size_prop", text="Texture Size")
+            row = box.row(align=True)
             row.operator("r0tools.zenuv_set_td")
+            
+            # Audit
+            row = box.row(align=True)
+            row.operator("r0tools.audit_texel_density")
+            row.prop(addon_props, "td_tolerance_prop")
+            row.prop(addon_props, "td_outliers_top_n_prop")
+            audit = texel_density.get_last_audit()
+            if audit:
+                td_unit = addon_prefs.zenuv_td_unit_prop
+                unit_label = td_unit.split('_')[1].lower()
+                lo, median, hi = (texel_density.from_px_per_meter(v, td_unit) for v in audit.summary)
+                row = box.row()
+                row.label(text=f"Min {lo:.2f}  Median {median:.2f}  Max {hi:.2f} px/{unit_label}")
+                
+                target = texel_density.from_px_per_meter(audit.target, td_unit)
+                col = box.column(align=True)
+                col.label(text=f"Outliers: {len(audit.outliers)} objects (target {target:.2f} ±{audit.tolerance * 100:.0f}%)")
+                for o, n_islands in audit.outliers[:addon_props.td_outliers_top_n_prop]:
+                    row = col.row(align=True)
+                    row.label(text=o.name)
+                    row.label(text=f"{texel_density.from_px_per_meter(o.density, td_unit):.2f}")
+                    row.label(text=f"{n_islands} islands")
+                row = box.row()
+                row.operator("r0tools.export_texel_density_csv", icon="EXPORT")
 
         if addon_prefs.experimental_features:
             row = layout.row()
@@ -100,9 +213,22 @@ class PT_SimpleToolbox(bpy.types.Panel):
             row = box.row()
             row.label(text="LODs")
             row = box.row()
-            row.operator("r0tools.experimental_op_1")
-            row = box.row()
             row.prop(addon_props, "screen_size_pct_prop", text="Screen Size (%):")
+            row = box.row()
+            row.prop(addon_props, "polygon_threshold")
+            row = box.row(align=True)
+            op = row.operator("r0tools.screen_coverage", text="Select Small")
+            op.action = 'SELECT'
+            op = row.operator("r0tools.screen_coverage", text="Tag Small")
+            op.action = 'TAG'
+            row = box.row(align=True)
+            op = row.operator("r0tools.screen_coverage", text="Select Small (Camera)")
+            op.source = 'CAMERA'
+            row = box.row()
+            row.prop(addon_props, "lod_screen_sizes_prop", text="LOD Sizes (%)")
+            row = box.row(align=True)
+            row.prop(addon_props, "lod_workers_prop")
+            row.operator("r0tools.generate_lods")
 
 
 # -------------------------------------------------------------------
@@ -123,10 +249,11 @@ def register():
 
     for handler in depsgraph_handlers:
         if handler not in bpy.app.handlers.depsgraph_update_post:
-            print(f"[DEBUG] Registering Handler {handler}")
             bpy.app.handlers.depsgraph_update_post.append(handler)
 
 def unregister():
+    u.cancel_property_list_refresh()
+
     for handler in depsgraph_handlers:
         try:
             if handler in bpy.app.handlers.depsgraph_update_post:
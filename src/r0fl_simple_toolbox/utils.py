@@ -1,7 +1,13 @@
 import bpy
-import math
+import time
+import bmesh
+import numpy as np
 
 from .const import INTERNAL_NAME
+from . import hierarchy
+from . import property_index
+from . import edit_mesh
+from . import kernels
 
 def iter_scene_objects(selected=False, type: str = ''):
         iters = bpy.data.objects
@@ -14,17 +20,24 @@ def iter_scene_objects(selected=False, type: str = ''):
                 
 def iter_children(p_obj, recursive=True):
     """
-    Iterate through all children of a given parent object.
+    Iterate through all children of a given parent object in the current view layer.
     Args:
         p_obj: Parent object to find children for
         recursive: If True, also iterate through children of children
     """
     
-    for obj in bpy.data.objects:
-        if obj.parent == p_obj:
-            yield obj
-            if recursive:
-                yield from iter_children(obj, recursive=True)         
+    yield from hierarchy.get_index().iter_depth_first(p_obj, recursive=recursive)
+
+def get_viewport(context):
+    """Get the window region and region 3D view of the first 3D viewport, or (None, None)"""
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            for r in area.regions:
+                if r.type == 'WINDOW':
+                    return r, area.spaces.active.region_3d
+            break
+
+    return None, None
 
 def show_notification(message, title="Script Finished"):
     """Display a popup notification and status info message"""
@@ -34,24 +47,77 @@ def show_notification(message, title="Script Finished"):
 def deselect_all():
     bpy.ops.object.select_all(action="DESELECT")
 
-def save_preferences():
-    """Safely save user preferences without causing recursion"""
+# Seconds without preference changes before they are written to disk
+PREFERENCES_SAVE_DELAY = 1.0
+
+# Add-on preference values as last written to disk
+_saved_preferences = None
+
+def get_preferences_snapshot():
+    """Values of every add-on preference, to tell whether anything changed since the last write"""
     try:
-        if not hasattr(save_preferences, 'is_saving'):
-            save_preferences.is_saving = False
-            
-        if not save_preferences.is_saving:
-            save_preferences.is_saving = True
-            bpy.context.preferences.use_preferences_save = True
-            
-            bpy.data.scenes["Scene"].zen_uv.td_props.prp_current_td = get_td_value()
-            bpy.data.scenes["Scene"].zen_uv.td_props.td_unit = get_td_unit()
-            
-            bpy.ops.wm.save_userpref()
-            save_preferences.is_saving = False
+        preferences = bpy.context.preferences.addons[INTERNAL_NAME].preferences
+    except KeyError:
+        return None
+    return tuple((p.identifier, getattr(preferences, p.identifier)) for p in preferences.bl_rna.properties if p.identifier != "rna_type")
+
+def mark_preferences_saved():
+    """Record the current preferences as the ones on disk, so unchanged values are never written"""
+    global _saved_preferences
+    _saved_preferences = get_preferences_snapshot()
+
+def flush_preferences() -> bool:
+    """
+    Write the user preferences now, if the add-on preferences changed since the last write.
+    Returns:
+        Whether the preferences were written
+    """
+    global _saved_preferences
+
+    cancel_preferences_save()
+
+    snapshot = get_preferences_snapshot()
+    if snapshot is None or snapshot == _saved_preferences:
+        return False
+
+    try:
+        # Keep ZenUV in sync when it is installed, it is not required
+        scene = bpy.context.scene
+        if hasattr(scene, "zen_uv"):
+            scene.zen_uv.td_props.prp_current_td = get_td_value()
+            scene.zen_uv.td_props.td_unit = get_td_unit()
+
+        bpy.context.preferences.use_preferences_save = True
+        bpy.ops.wm.save_userpref()
+        _saved_preferences = snapshot
+        print("[PREFERENCES] Saved user preferences")
+        return True
     except Exception as e:
         print(f"Error saving preferences: {e}")
-        save_preferences.is_saving = False
+        return False
+
+def _preferences_save_timer():
+    flush_preferences()
+    return None
+
+def save_preferences():
+    """
+    Mark the preferences dirty. They are written once no change happened for PREFERENCES_SAVE_DELAY,
+    so dragging a slider writes to disk once instead of on every update.
+    """
+    # Restart the quiet period on every change
+    if bpy.app.timers.is_registered(_preferences_save_timer):
+        bpy.app.timers.unregister(_preferences_save_timer)
+    bpy.app.timers.register(_preferences_save_timer, first_interval=PREFERENCES_SAVE_DELAY)
+
+def cancel_preferences_save():
+    if bpy.app.timers.is_registered(_preferences_save_timer):
+        bpy.app.timers.unregister(_preferences_save_timer)
+
+def flush_pending_preferences():
+    """Write preferences waiting on the debounce timer right away, used before unregistering"""
+    if bpy.app.timers.is_registered(_preferences_save_timer):
+        flush_preferences()
 
 def get_td_value():
     """Get the texel density value from addon preferences"""
@@ -80,131 +146,218 @@ def get_td_unit():
         print(e)
         return 'cm'  # default value if preferences not found
 
-def op_clear_sharp_along_axis(axis: str):
+AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+def get_edge_vertices(mesh):
+    """Get the vertex index pairs of every edge as an (E, 2) array"""
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    return edge_verts.reshape(-1, 2)
+
+def get_axis_band_edges(mesh, axis: str, threshold: float):
+    """
+    Get the indices of the edges lying on the plane of a given axis.
+
+    Vertex coordinates and edge vertex pairs are read in bulk, so this
+    scales linearly with the size of the mesh.
+    Args:
+        mesh: Mesh data block (must be in sync with any edit-mesh)
+        axis: One of X, Y or Z
+        threshold: Absolute distance from the axis plane to consider a vertex on it
+    """
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+
+    return kernels.axis_band_edges(co.reshape(-1, 3), get_edge_vertices(mesh), AXIS_INDEX[str(axis).upper()], threshold)
+
+def clear_sharp_edges(mesh, edge_indices) -> int:
+    """Clear the sharp flag of the given edges by writing the sharp_edge attribute directly"""
+    attr = mesh.attributes.get("sharp_edge")
+    if attr is None or not len(edge_indices):
+        return 0
+
+    sharp = np.empty(len(mesh.edges), dtype=bool)
+    attr.data.foreach_get("value", sharp)
+
+    cleared = int(np.count_nonzero(sharp[edge_indices]))
+    if cleared:
+        sharp[edge_indices] = False
+        attr.data.foreach_set("value", sharp)
+        mesh.update()
+
+    return cleared
+
+def clear_sharp_edges_bmesh(bm, edge_indices) -> int:
+    """Clear the sharp flag of the given edges of an edit-mesh"""
+    bm.edges.ensure_lookup_table()
+
+    cleared = 0
+    for idx in edge_indices:
+        edge = bm.edges[idx]
+        if not edge.smooth:
+            edge.smooth = True
+            cleared += 1
+
+    return cleared
+
+def op_clear_sharp_along_axis(axis: str) -> int:
+    """
+    Clears sharp edges lying on the given axis plane of every selected mesh.
+
+    Works in Object and Edit modes without switching modes or touching the selection.
+    Returns the number of edges cleared.
+    """
     axis = str(axis).upper()
     
     threshold = bpy.context.preferences.addons[INTERNAL_NAME].preferences.clear_sharp_axis_float_prop
     print(f"Threshold: {threshold}")
     
-    # Collect select objects
-    objects = [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
+    total_cleared = 0
     
-    print(f"Objects: {objects}")
+    # Objects in (multi-object) Edit mode, edited in place
+    for obj, bm in edit_mesh.iter_edit_meshes():
+        # Read from the edit-mesh, element order matches the mesh data
+        edit_mesh.ensure_indices(bm)
+        edge_indices = kernels.axis_band_edges(edit_mesh.read_coords(bm), edit_mesh.read_edge_vertices(bm), AXIS_INDEX[axis], threshold)
+        cleared = clear_sharp_edges_bmesh(bm, edge_indices)
+        print(f"{obj.name}: Cleared {cleared} sharp edges on {axis}")
+        total_cleared += cleared
     
-    if not objects:
+    # Remaining selected objects, shared meshes processed once
+    for obj, mesh in edit_mesh.iter_object_meshes():
+        edge_indices = get_axis_band_edges(mesh, axis, threshold)
+        cleared = clear_sharp_edges(mesh, edge_indices)
+        print(f"{obj.name}: Cleared {cleared} sharp edges on {axis}")
+        total_cleared += cleared
+
+    return total_cleared
+
+
+def clear_custom_normals(obj) -> bool:
+    """
+    Remove the custom split normals of an object's mesh without switching modes or the active object.
+    Returns whether the mesh had custom normals.
+    """
+    mesh = obj.data
+    is_edit = obj.mode == "EDIT"
+
+    # Stored as a regular attribute in newer versions
+    attr = mesh.attributes.get("custom_normal")
+    if attr is not None and not is_edit:
+        mesh.attributes.remove(attr)
+        return True
+
+    if not (is_edit or mesh.has_custom_normals):
         return False
-    
-    for obj in objects:
-        # Set the active object
-        bpy.context.view_layer.objects.active = obj
-        print(f"Iterating: {obj.name}")
-        
-        # Check the mode
-        mode = obj.mode
-        print(f"Mode: {mode}")
-        
-        # Access mesh data
-        mesh = obj.data
-        print(f"Mesh: {mesh}")
-        
-        # Store the selection mode
-        # Tuple of Booleans for each of the 3 modes
-        selection_mode = tuple(bpy.context.scene.tool_settings.mesh_select_mode)
-        
-        # Store initial selections
-        # Vertices
-        selected_vertices = [v.index for v in mesh.vertices if v.select]
-        
-        # Edges
-        selected_edges = [e.index for e in mesh.edges if e.select]
-        
-        # Faces
-        selected_faces = [f.index for f in mesh.polygons if f.select]
-        
-        # Deselect all vertices
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_mode(type="VERT")
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.object.mode_set(mode="OBJECT") # We're in Object mode so we can select stuff. Logic is weird.
-        
-        for idx, vertex in enumerate(mesh.vertices):
-            # print(f"Vertex {vertex.co}", end="")
-            
-            if axis == 'X':
-                if math.isclose(vertex.co.x, 0.0, abs_tol=threshold):
-                    mesh.vertices[idx].select = True
-                    # print(f" X isclose({vertex.co.x}, 0.0, abs_tol={threshold}): {math.isclose(vertex.co.x, 0.0, abs_tol=threshold)}")
-            
-            if axis == 'Y':
-                if math.isclose(vertex.co.y, 0.0, abs_tol=threshold):
-                    mesh.vertices[idx].select = True
-                    # print(f" Y isclose({vertex.co.y}, 0.0, abs_tol={threshold}): {math.isclose(vertex.co.y, 0.0, abs_tol=threshold)}")
-                    
-            if axis == 'Z':
-                if math.isclose(vertex.co.z, 0.0, abs_tol=threshold):
-                    mesh.vertices[idx].select = True
-                    # print(f" Z isclose({vertex.co.z}, 0.0, abs_tol={threshold}): {math.isclose(vertex.co.z, 0.0, abs_tol=threshold)}")
-        
-        # Enter Edit mode
-        bpy.ops.object.mode_set(mode="EDIT")
-        
-        # Switch to edge mode
-        bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type="EDGE")
-        
-        # Clear the Sharp
-        bpy.ops.mesh.mark_sharp(clear=True)
-        
-        # Restore the inital selections and mode
-        if selection_mode[0] is True:
-            # Deselect all vertices
-            bpy.ops.mesh.select_mode(type="VERT")
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT") # We're in Object mode so we can select stuff. Logic is weird.
-            for vert_idx in selected_vertices:
-                mesh.vertices[vert_idx].select = True
-        if selection_mode[1] is True:
-            # Deselect all vertices
-            bpy.ops.mesh.select_mode(type="EDGE")
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT") # We're in Object mode so we can select stuff. Logic is weird.
-            for edge_idx in selected_edges:
-                mesh.edges[edge_idx].select = True
-        if selection_mode[2] is True:
-            # Deselect all vertices
-            bpy.ops.mesh.select_mode(type="FACE")
-            bpy.ops.mesh.select_all(action="DESELECT")
-            bpy.ops.object.mode_set(mode="OBJECT") # We're in Object mode so we can select stuff. Logic is weird.
-            for face_idx in selected_faces:
-                mesh.polygons[face_idx].select = True
-        
-        # Set back to Object mode
-        bpy.ops.object.mode_set(mode=mode)
 
+    # No data API for the legacy custom normals layer, but the operator handles edit-meshes too
+    with bpy.context.temp_override(object=obj, active_object=obj):
+        bpy.ops.mesh.customdata_custom_splitnormals_clear()
+    return True
 
-def continuous_property_list_update(scene, context):
-    # This method is required to assess the last object selection, otherwise
-    # this is triggered on every click and the list is updated, and the checkboxes are reset
-    
-    if bpy.context.selected_objects:
-        current_selection = {obj.name for obj in iter_scene_objects(selected=True)}
-        addon_props = context.scene.r0fl_toolbox_props
-        prev_selection = set(addon_props.last_object_selection.split(',')) if addon_props.last_object_selection else set()
-
-        if current_selection != prev_selection:
-            addon_props.custom_property_list.clear()
-
-            # Add unique custom properties to the list
-            unique_props = set()
-            for obj in bpy.context.selected_objects:
-                for prop_name in obj.keys():
-                    if not prop_name.startswith('_') and prop_name not in unique_props:
-                        unique_props.add(prop_name)
-                        item = addon_props.custom_property_list.add()
-                        item.name = prop_name
-
-            # Update the last object selection
-            addon_props.last_object_selection = ','.join(current_selection)
+def set_mesh_smooth(obj):
+    """Set every face of an object's mesh to smooth shading"""
+    mesh = obj.data
+
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(mesh)
+        for f in bm.faces:
+            f.smooth = True
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    elif bpy.app.version >= (4, 1, 0):
+        # Faces are smooth when there is no sharp_face attribute
+        attr = mesh.attributes.get("sharp_face")
+        if attr is not None:
+            mesh.attributes.remove(attr)
     else:
-        # Clear the property list if no objects are selected
-        context.scene.r0fl_toolbox_props.custom_property_list.clear()
-        context.scene.r0fl_toolbox_props.last_object_selection = ""
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+        mesh.update()
+
+def get_loose_geometry(mesh):
+    """
+    Find the loose geometry of a mesh by counting how often each element is used by face corners.
+
+    Handles faces of any size and runs in linear time.
+    Returns:
+        Tuple of index arrays (loose_verts, loose_edges, wire_edges)
+        loose_verts: Vertices not used by any edge or face
+        loose_edges: Edges without faces which are not attached to any face either
+        wire_edges: All edges without faces
+    """
+    return kernels.loose_geometry(len(mesh.vertices), get_edge_vertices(mesh), *get_loop_indices(mesh))
+
+def get_loop_indices(mesh):
+    """Vertex and edge index of every loop"""
+    n_loops = len(mesh.loops)
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    loop_edges = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    return loop_verts, loop_edges
+
+def rebuild_custom_property_list(addon_props, objects):
+    """Fill the custom property list with the unique custom properties of the given objects and their object counts"""
+    addon_props.custom_property_list.clear()
+
+    counts = property_index.get_index().count_properties(objects)
+    for prop_name in sorted(counts):
+        if not prop_name.startswith('_'):
+            item = addon_props.custom_property_list.add()
+            item.name = prop_name
+            item.count = counts[prop_name]
+
+# Seconds without depsgraph updates before the property list is refreshed
+PROPERTY_LIST_DEBOUNCE = 0.15
+
+# Count and hash of the selected objects' pointers the property list was last built from
+_selection_fingerprint = None
+_last_depsgraph_update = 0.0
+
+def get_selection_fingerprint(view_layer):
+    selected = view_layer.objects.selected
+    return len(selected), hash(tuple(obj.as_pointer() for obj in selected))
+
+def _property_list_refresh():
+    global _selection_fingerprint
+
+    # Wait for a quiet period so bursts of updates (e.g. dragging a gizmo) only refresh once
+    remaining = PROPERTY_LIST_DEBOUNCE - (time.monotonic() - _last_depsgraph_update)
+    if remaining > 0:
+        return remaining
+
+    context = bpy.context
+    addon_props = getattr(context.scene, "r0fl_toolbox_props", None)
+    if addon_props is None:
+        return None
+
+    fingerprint = get_selection_fingerprint(context.view_layer)
+    # This is required to assess the last object selection, otherwise
+    # the list is updated on every click, and the checkboxes are reset
+    if fingerprint != _selection_fingerprint:
+        _selection_fingerprint = fingerprint
+        rebuild_custom_property_list(addon_props, context.view_layer.objects.selected)
+
+    return None
+
+def schedule_property_list_refresh(force=False):
+    """Refresh the custom property list once depsgraph updates settle"""
+    global _selection_fingerprint, _last_depsgraph_update
+
+    if force:
+        _selection_fingerprint = None
+
+    _last_depsgraph_update = time.monotonic()
+    if not bpy.app.timers.is_registered(_property_list_refresh):
+        bpy.app.timers.register(_property_list_refresh, first_interval=PROPERTY_LIST_DEBOUNCE)
+
+def cancel_property_list_refresh():
+    if bpy.app.timers.is_registered(_property_list_refresh):
+        bpy.app.timers.unregister(_property_list_refresh)
+
+def continuous_property_list_update(scene, context):
+    # Runs on every depsgraph update, so only schedule the debounced refresh here
+    addon_props = scene.r0fl_toolbox_props
+    if not (addon_props.show_object_ops and addon_props.show_custom_property_list_prop):
+        return
+
+    schedule_property_list_refresh()
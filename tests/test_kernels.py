@@ -0,0 +1,136 @@
+"""Tests of the NumPy kernels, run in plain CPython with the bpy stub"""
+import numpy as np
+import pytest
+
+from bench_kernels import grid_arrays, random_tree
+from r0fl_simple_toolbox import kernels
+
+
+def reference_depth_first(parents, root):
+    children = {}
+    for node, parent in enumerate(parents):
+        children.setdefault(parent, []).append(node)
+    result = []
+    stack = list(reversed(children.get(root, [])))
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        stack.extend(reversed(children.get(node, [])))
+    return result
+
+def reference_breadth_first(parents, root):
+    children = {}
+    for node, parent in enumerate(parents):
+        children.setdefault(parent, []).append(node)
+    result = []
+    level = children.get(root, [])
+    while level:
+        result.extend(level)
+        level = [c for node in level for c in children.get(node, [])]
+    return result
+
+
+@pytest.fixture
+def grid():
+    return grid_arrays(400, islands_x=4)
+
+@pytest.fixture
+def topology(grid):
+    return kernels.loop_topology(grid["loop_starts"], grid["loop_totals"], len(grid["loop_verts"]))
+
+
+# ---- Mesh ----
+
+def test_axis_band_edges(grid):
+    # The x = 0 column of a 20x20 grid
+    band = kernels.axis_band_edges(grid["co"], grid["edge_verts"], 0, 1e-6)
+    assert len(band) == 19
+    assert np.all(grid["co"][grid["edge_verts"][band], 0] == 0)
+
+def test_loose_geometry():
+    # Triangle, a wire edge attached to it, a loose edge and a loose vertex
+    edge_verts = np.array([[0, 1], [1, 2], [2, 0], [2, 3], [4, 5]])
+    loop_verts = np.array([0, 1, 2])
+    loop_edges = np.array([0, 1, 2])
+    loose_verts, loose_edges, wire_edges = kernels.loose_geometry(7, edge_verts, loop_verts, loop_edges)
+    assert loose_verts.tolist() == [6]
+    assert loose_edges.tolist() == [4]
+    assert wire_edges.tolist() == [3, 4]
+
+def test_loose_geometry_grid(grid, topology):
+    loose = kernels.loose_geometry(len(grid["co"]), grid["edge_verts"], grid["loop_verts"], grid["loop_edges"])
+    assert not any(len(x) for x in loose)
+
+@pytest.mark.parametrize("nth, offset", [(2, 1), (3, 1), (3, 2), (4, 5)])
+def test_nth_mask(nth, offset):
+    mask = kernels.nth_mask(20, 7, nth, offset)
+    assert np.flatnonzero(mask).tolist() == [i for i in range(20) if (i - 7) % nth == offset % nth]
+
+
+# ---- UV islands and texel density ----
+
+def test_loop_topology():
+    loop_polys, next_loop = kernels.loop_topology(np.array([0, 3]), np.array([3, 4]), 7)
+    assert loop_polys.tolist() == [0, 0, 0, 1, 1, 1, 1]
+    assert next_loop.tolist() == [1, 2, 0, 4, 5, 6, 3]
+
+def test_face_areas(grid, topology):
+    loop_polys, next_loop = topology
+    area = kernels.face_areas(grid["co"], grid["loop_verts"], next_loop, loop_polys, grid["n_polys"])
+    assert np.allclose(area, 1 / 19 ** 2)
+
+def test_uv_islands(grid, topology):
+    loop_polys, next_loop = topology
+    face_island, n_islands = kernels.uv_islands(grid["loop_verts"], grid["loop_edges"], loop_polys, next_loop, grid["uv"], grid["n_polys"])
+    assert n_islands == 4
+    assert len(face_island) == grid["n_polys"]
+
+def test_connected_components():
+    labels, n = kernels.connected_components(6, np.array([0, 1, 4]), np.array([1, 2, 5]))
+    assert n == 3
+    assert labels[0] == labels[1] == labels[2]
+    assert labels[4] == labels[5]
+    assert len({labels[0], labels[3], labels[4]}) == 3
+
+def test_density_without_area():
+    density = kernels.density(np.array([1.0, 0.0]), np.array([0.25, 0.0]), 1024)
+    assert density.tolist() == [512.0, 0.0]
+
+def test_scale_islands(grid, topology):
+    loop_polys, next_loop = topology
+    face_island, n_islands = kernels.uv_islands(grid["loop_verts"], grid["loop_edges"], loop_polys, next_loop, grid["uv"], grid["n_polys"])
+    area_3d = kernels.face_areas(grid["co"], grid["loop_verts"], next_loop, loop_polys, grid["n_polys"])
+
+    def island_density(uv):
+        area_uv = kernels.uv_face_areas(uv, next_loop, loop_polys, grid["n_polys"])
+        return kernels.density(kernels.island_sums(face_island, n_islands, area_3d),
+                               kernels.island_sums(face_island, n_islands, area_uv), 1024)
+
+    new_uv = kernels.scale_islands(grid["uv"], face_island[loop_polys], island_density(grid["uv"]), 256.0)
+    assert np.allclose(island_density(new_uv), 256.0)
+
+
+# ---- Hierarchy ----
+
+def test_children_table():
+    children, offsets = kernels.children_table([-1, 0, 0, 1, -1])
+    assert [children[offsets[i]:offsets[i + 1]].tolist() for i in range(5)] == [[1, 2], [3], [], [], []]
+
+@pytest.mark.parametrize("seed", range(3))
+def test_depth_first(seed):
+    parents = random_tree(500, seed)
+    children, offsets = kernels.children_table(parents)
+    for root in (0, 1, 7, 499):
+        assert kernels.depth_first(children, offsets, root).tolist() == reference_depth_first(parents.tolist(), root)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_breadth_first(seed):
+    parents = random_tree(500, seed)
+    children, offsets = kernels.children_table(parents)
+    for root in (0, 1, 7, 499):
+        assert kernels.breadth_first(children, offsets, root).tolist() == reference_breadth_first(parents.tolist(), root)
+
+def test_depth_first_chain():
+    parents = np.arange(-1, 99)
+    children, offsets = kernels.children_table(parents)
+    assert kernels.depth_first(children, offsets, 0).tolist() == list(range(1, 100))